@@ -0,0 +1,32 @@
+"""
+Parse stored case-question answers into the typed answer_* columns.
+
+    python backfill_answers.py
+    python backfill_answers.py --batch-size 5000
+    python backfill_answers.py --all    # re-parse rows that were already normalized
+"""
+import argparse
+import asyncio
+import json
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.database import init_db, close_db
+from helpers.answer_normalizer import backfill_case_answers
+
+
+async def main(args):
+    await init_db()
+    try:
+        async for progress in backfill_case_answers(batch_size=args.batch_size, renormalize=args.all):
+            print(json.dumps(progress), flush=True)
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill typed case-question answers")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows read and updated per batch")
+    parser.add_argument("--all", action="store_true", help="Also re-parse rows that were already normalized")
+    asyncio.run(main(parser.parse_args()))
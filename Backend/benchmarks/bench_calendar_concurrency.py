@@ -0,0 +1,52 @@
+"""
+Concurrent availability lookups against a local fake Google Calendar with
+a fixed round-trip latency. A client that blocks the event loop takes
+about lookups x latency; a non-blocking one about a single round trip.
+
+    python -m benchmarks.bench_calendar_concurrency
+    python -m benchmarks.bench_calendar_concurrency --lookups 50 --latency 0.1
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from config.settings import settings
+from helpers.calendar_service import CalendarService
+from tests.fake_google_calendar import FakeCredentials, FakeGoogleCalendar
+
+
+async def run(lookups: int):
+    service = CalendarService()
+    service.credentials = FakeCredentials()
+    start = datetime(2030, 1, 7)
+    windows = [(start + timedelta(days=i), start + timedelta(days=i + 1)) for i in range(lookups)]
+    try:
+        started = time.perf_counter()
+        for window in windows:
+            await service.get_available_slots(*window)
+        sequential = time.perf_counter() - started
+
+        service.availability_cache.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*[service.get_available_slots(*window) for window in windows])
+        concurrent = time.perf_counter() - started
+    finally:
+        await service.close()
+    return sequential, concurrent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark concurrent calendar lookups")
+    parser.add_argument("--lookups", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds the fake server waits per request")
+    args = parser.parse_args()
+
+    fake = FakeGoogleCalendar(latency_seconds=args.latency)
+    settings.GOOGLE_CALENDAR_API_URL = fake.start()
+    try:
+        sequential, concurrent = asyncio.run(run(args.lookups))
+    finally:
+        fake.stop()
+    print(f"{args.lookups} lookups at {args.latency * 1000:.0f}ms per round trip")
+    print(f"  one at a time: {sequential:.2f}s")
+    print(f"  concurrent:    {concurrent:.2f}s (peak {fake.max_in_flight} requests in flight)")
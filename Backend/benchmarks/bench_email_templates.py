@@ -0,0 +1,100 @@
+"""
+Confirmation-email renders per second: the precompiled template against
+the MIMEMultipart build and flatten that every send used to do.
+
+    python -m benchmarks.bench_email_templates
+    python -m benchmarks.bench_email_templates --renders 50000
+"""
+import argparse
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+from benchmarks.common import per_second
+from helpers.email_templates import EmailTemplateRegistry
+
+TEMPLATES = Path(__file__).resolve().parent.parent / "templates" / "email"
+SENDER = ("Legal Intake Team", "intake@example.com")
+
+
+def callers(count: int):
+    return [
+        {
+            "caller_name": f"Caller {n}",
+            "practice_area": "Personal Injury" if n % 2 else "Lemon Law",
+            "date": "January 07, 2030",
+            "time": "10:00 AM",
+            "signature": SENDER[0],
+            "email": f"caller{n}@example.com",
+        }
+        for n in range(count)
+    ]
+
+
+def legacy_render(fields) -> bytes:
+    # The body of send_confirmation_email before templates, minus the SMTP call.
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = f"Appointment Confirmation - {fields['practice_area']}"
+    msg['From'] = f"{SENDER[0]} <{SENDER[1]}>"
+    msg['To'] = fields["email"]
+    html_body = f"""
+    <html>
+      <body>
+        <h2>Appointment Confirmation</h2>
+        <p>Dear {fields['caller_name']},</p>
+        <p>This email confirms your appointment for a {fields['practice_area']} consultation.</p>
+        <h3>Appointment Details:</h3>
+        <ul>
+          <li><strong>Date:</strong> {fields['date']}</li>
+          <li><strong>Time:</strong> {fields['time']}</li>
+          <li><strong>Practice Area:</strong> {fields['practice_area']}</li>
+        </ul>
+        <h3>Next Steps:</h3>
+        <p>Please arrive 10 minutes early for your appointment. If you need to reschedule or cancel, please contact us at least 24 hours in advance.</p>
+        <p>If you have any questions, please don't hesitate to reach out.</p>
+        <p>Best regards,<br>Legal Intake Team</p>
+      </body>
+    </html>
+    """
+    text_body = f"""
+    Appointment Confirmation
+
+    Dear {fields['caller_name']},
+
+    This email confirms your appointment for a {fields['practice_area']} consultation.
+
+    Appointment Details:
+    - Date: {fields['date']}
+    - Time: {fields['time']}
+    - Practice Area: {fields['practice_area']}
+
+    Next Steps:
+    Please arrive 10 minutes early for your appointment. If you need to reschedule or cancel, please contact us at least 24 hours in advance.
+
+    If you have any questions, please don't hesitate to reach out.
+
+    Best regards,
+    Legal Intake Team
+    """
+    msg.attach(MIMEText(text_body, 'plain'))
+    msg.attach(MIMEText(html_body, 'html'))
+    return msg.as_bytes()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark confirmation-email rendering")
+    parser.add_argument("--renders", type=int, default=20000)
+    args = parser.parse_args()
+
+    inputs = callers(1000)
+    rounds = max(1, args.renders // len(inputs))
+    registry = EmailTemplateRegistry(str(TEMPLATES))
+    registry.load()
+
+    def render(fields):
+        registry.get("confirmation", fields["practice_area"]).render(SENDER, fields["email"], fields)
+
+    legacy = per_second(legacy_render, inputs, rounds)
+    precompiled = per_second(render, inputs, rounds)
+    print(f"{rounds * len(inputs)} renders of the confirmation email")
+    print(f"  MIMEMultipart build + flatten: {legacy:9,.0f}/s")
+    print(f"  precompiled template:          {precompiled:9,.0f}/s ({precompiled / legacy:.1f}x)")
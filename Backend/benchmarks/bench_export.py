@@ -0,0 +1,62 @@
+"""
+Call export throughput: rows/s, output size and peak traced memory per
+format and batch size, over seeded calls in a temporary sqlite database.
+
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --calls 20000 --batch-size 500 2000 --formats csv parquet
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from tortoise import Tortoise
+from config.database import TORTOISE_ORM
+from helpers.call_export import export_rows, export_stream
+from tests.intake_data import seed_calls
+
+
+async def export_size(export_format: str, batch_size: int) -> int:
+    size = 0
+    async for data in export_stream(export_format, export_rows(batch_size=batch_size)):
+        size += len(data)
+    return size
+
+
+async def measure(export_format: str, batch_size: int):
+    # Timed and traced in separate passes; tracing slows the export severalfold.
+    started = time.perf_counter()
+    size = await export_size(export_format, batch_size)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    await export_size(export_format, batch_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, size, peak
+
+
+async def main(args):
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite://{Path(directory) / 'export.sqlite3'}"
+        await Tortoise.init(config=dict(TORTOISE_ORM, connections={"default": url}))
+        try:
+            await Tortoise.generate_schemas()
+            await seed_calls(args.calls)
+            for batch_size in args.batch_size:
+                for export_format in args.formats:
+                    seconds, size, peak = await measure(export_format, batch_size)
+                    print(
+                        f"{export_format:8s} batch {batch_size:5d}: {args.calls / seconds:8,.0f} rows/s, "
+                        f"{size / 1e6:6.1f} MB out, peak {peak / 1e6:5.1f} MB traced"
+                    )
+        finally:
+            await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark call exports")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--formats", nargs="+", default=["csv", "ndjson", "parquet"])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,32 @@
+"""
+Accuracy and throughput of spoken email extraction on the test corpus.
+
+    python -m benchmarks.bench_extract_email
+    python -m benchmarks.bench_extract_email --baseline 5bbad18   # compare with validators.py at a revision
+"""
+import argparse
+from benchmarks.common import module_at_revision, per_second
+from helpers import validators
+from tests.corpora.emails import EMAIL_CORPUS
+
+
+def report(label: str, module, rounds: int):
+    correct = sum(module.extract_email(text) == expected for text, expected in EMAIL_CORPUS)
+    rate = per_second(module.extract_email, (text for text, _ in EMAIL_CORPUS), rounds)
+    print(f"{label}: {correct}/{len(EMAIL_CORPUS)} correct, {rate:,.0f} transcripts/s")
+    return {text for text, expected in EMAIL_CORPUS if module.extract_email(text) == expected}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark spoken email extraction")
+    parser.add_argument("--baseline", help="Git revision whose helpers/validators.py to compare against")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    baseline_correct = set()
+    if args.baseline:
+        baseline = module_at_revision(args.baseline, "helpers/validators.py", "baseline_validators")
+        baseline_correct = report(args.baseline, baseline, args.rounds)
+    current_correct = report("current", validators, args.rounds)
+    for text in sorted(baseline_correct - current_correct):
+        print(f"regressed: {text!r}")
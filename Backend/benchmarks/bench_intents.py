@@ -0,0 +1,23 @@
+"""
+Accuracy and throughput of intent classification on the test corpus.
+
+    python -m benchmarks.bench_intents
+"""
+import argparse
+from benchmarks.common import per_second
+from helpers.intents import classify
+from tests.corpora.intents import INTENT_CORPUS
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark intent classification")
+    parser.add_argument("--rounds", type=int, default=5000)
+    args = parser.parse_args()
+
+    correct = sum(classify(text, vocabulary).intent == expected for vocabulary, text, expected in INTENT_CORPUS)
+    rate = per_second(lambda case: classify(case[1], case[0]), INTENT_CORPUS, args.rounds)
+    print(f"{correct}/{len(INTENT_CORPUS)} correct, {rate:,.0f} classifications/s")
+    for vocabulary, text, expected in INTENT_CORPUS:
+        got = classify(text, vocabulary).intent
+        if got != expected:
+            print(f"miss: [{vocabulary}] {text!r} -> {got!r}, expected {expected!r}")
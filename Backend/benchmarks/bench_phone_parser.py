@@ -0,0 +1,33 @@
+"""
+Accuracy and throughput of spoken phone-number parsing on the test corpus.
+
+    python -m benchmarks.bench_phone_parser
+    python -m benchmarks.bench_phone_parser --baseline 5bbad18   # compare with validators.py at a revision
+"""
+import argparse
+from benchmarks.common import module_at_revision, per_second
+from helpers import validators
+from tests.corpora.phones import PHONE_CORPUS
+
+
+def report(label: str, module, rounds: int):
+    correct = sum(module.extract_phone_number(text) == expected for text, expected in PHONE_CORPUS)
+
+    def extract_and_validate(text: str):
+        phone = module.extract_phone_number(text)
+        if phone:
+            module.validate_phone(phone)
+
+    rate = per_second(extract_and_validate, (text for text, _ in PHONE_CORPUS), rounds)
+    print(f"{label}: {correct}/{len(PHONE_CORPUS)} correct, {rate:,.0f} extract+validate/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark spoken phone-number parsing")
+    parser.add_argument("--baseline", help="Git revision whose helpers/validators.py to compare against")
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.baseline:
+        report(args.baseline, module_at_revision(args.baseline, "helpers/validators.py", "baseline_validators"), args.rounds)
+    report("current", validators, args.rounds)
@@ -0,0 +1,42 @@
+"""
+First MAX_SLOTS free slots over busy calendars with 30-90 day windows:
+the sweep engine against the per-slot loop it replaced.
+
+    python -m benchmarks.bench_slot_engine
+    python -m benchmarks.bench_slot_engine --days 30 60 90 --limit 10
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+from helpers.slot_engine import iter_free_slots, parse_busy_intervals
+from tests.busy_calendars import legacy_free_slots, packed_calendar
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark free-slot generation")
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 60, 90])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = datetime(2030, 1, 7, 9)
+    for days in args.days:
+        end = start + timedelta(days=days)
+        busy = packed_calendar(start, days, rng)
+        legacy, legacy_seconds = timed(lambda: legacy_free_slots(start, end, busy, limit=args.limit))
+        sweep, sweep_seconds = timed(lambda: list(islice(iter_free_slots(start, end, parse_busy_intervals(busy)), args.limit)))
+        assert sweep == legacy
+        print(
+            f"{days:3d} days, {len(busy):5d} busy periods: "
+            f"legacy {legacy_seconds * 1000:8.1f}ms, sweep {sweep_seconds * 1000:6.2f}ms "
+            f"({legacy_seconds / sweep_seconds:,.0f}x)"
+        )
@@ -0,0 +1,62 @@
+"""
+Sends per second against a local SMTP server that delays every reply by a
+simulated round trip: the pooled transport against the old per-message
+handshake (connect, EHLO, send, QUIT on the event loop for each message).
+TLS and AUTH are left out, so the real handshake costs more round trips
+than this measures.
+
+    python -m benchmarks.bench_smtp
+    python -m benchmarks.bench_smtp --messages 200 --latency 0.01 --pool-size 4
+"""
+import argparse
+import asyncio
+import smtplib
+import time
+from helpers.smtp_pool import SMTPPool
+from tests.fake_smtp_server import FakeSMTPServer
+
+SENDER = "intake@example.com"
+RECIPIENTS = ["caller@example.com"]
+MESSAGE = b"Subject: Appointment confirmed\r\n\r\nSee you then.\r\n"
+
+
+async def handshake_per_message(port: int, messages: int):
+    for _ in range(messages):
+        with smtplib.SMTP("127.0.0.1", port, timeout=10) as smtp:
+            smtp.sendmail(SENDER, RECIPIENTS, MESSAGE)
+
+
+async def pooled(port: int, messages: int, size: int):
+    pool = SMTPPool("127.0.0.1", port, use_tls=False, size=size)
+    try:
+        await asyncio.gather(*[pool.send_raw(SENDER, RECIPIENTS, MESSAGE) for _ in range(messages)])
+    finally:
+        await pool.close()
+
+
+def timed(coroutine) -> float:
+    started = time.perf_counter()
+    asyncio.run(coroutine)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SMTP sends")
+    parser.add_argument("--messages", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.005, help="Seconds the server waits before each reply")
+    parser.add_argument("--pool-size", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    fake = FakeSMTPServer(latency_seconds=args.latency)
+    port = fake.start()
+    try:
+        print(f"{args.messages} messages at {args.latency * 1000:.0f}ms per reply")
+        seconds = timed(handshake_per_message(port, args.messages))
+        print(f"  handshake per message: {args.messages / seconds:7.1f} sends/s ({fake.connections} connections)")
+        for size in args.pool_size:
+            fake.connections = 0
+            seconds = timed(pooled(port, args.messages, size))
+            print(f"  pool of {size}:            {args.messages / seconds:7.1f} sends/s ({fake.connections} connections)")
+    finally:
+        fake.stop()
+    assert len(fake.messages) == args.messages * (1 + len(args.pool_size))
@@ -0,0 +1,27 @@
+import subprocess
+import time
+import types
+from pathlib import Path
+from typing import Callable, Iterable
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+def module_at_revision(revision: str, path: str, name: str) -> types.ModuleType:
+    # Loads a Backend module as it was at a git revision, so a benchmark can
+    # compare against the implementation it replaced.
+    source = subprocess.run(
+        ["git", "show", f"{revision}:Backend/{path}"],
+        cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    module = types.ModuleType(name)
+    module.__file__ = f"{revision}:{path}"
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+def per_second(fn: Callable, inputs: Iterable, rounds: int) -> float:
+    inputs = list(inputs)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for value in inputs:
+            fn(value)
+    return rounds * len(inputs) / (time.perf_counter() - started)
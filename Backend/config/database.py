@@ -19,7 +19,9 @@ TORTOISE_ORM = {
     "apps": {
         "models": {
             "models": ["models.caller", "models.intake_call", "models.case_question", 
-                      "models.appointment", "models.calendar_event", "aerich.models"],
+                      "models.appointment", "models.calendar_event", "models.busy_interval",
+                      "models.calendar_sync_state", "models.slot_hold", "models.outbox_message",
+                      "models.stat_counter", "aerich.models"],
             "default_connection": "default",
         },
     },
@@ -5,7 +5,13 @@ PERSONAL_INJURY_QUESTIONS = [
     {
         "key": "incident_type",
         "question": "What type of incident was it? Options are: car accident, slip and fall, workplace, or other.",
-        "type": "choice"
+        "type": "choice",
+        "options": {
+            "car_accident": ["car accident", "car", "vehicle", "truck", "motorcycle", "crash", "collision", "rear ended", "hit"],
+            "slip_and_fall": ["slip and fall", "slip", "slipped", "fall", "fell", "tripped", "trip"],
+            "workplace": ["workplace", "work", "job", "on the job", "at work"],
+            "other": ["other", "something else"]
+        }
     },
     {
         "key": "incident_date",
@@ -35,7 +41,13 @@ PERSONAL_INJURY_QUESTIONS = [
     {
         "key": "insurance_involved",
         "question": "Is there insurance involved? Options are: your insurance, other party's insurance, both, or not sure.",
-        "type": "choice"
+        "type": "choice",
+        "options": {
+            "own": ["your insurance", "my insurance", "mine", "my own", "my insurer"],
+            "other_party": ["other party's insurance", "other party", "their insurance", "other driver", "theirs", "the other"],
+            "both": ["both", "both of them"],
+            "unsure": ["not sure", "unsure", "don't know", "no idea"]
+        }
     }
 ]
 
@@ -3,15 +3,21 @@ from twilio.twiml.voice_response import VoiceResponse, Gather
 from models.intake_call import IntakeCall
 from models.caller import Caller
 from models.appointment import Appointment
-from models.calendar_event import CalendarEvent
 from helpers.voice_agent import VoiceAgent, CallState
 from helpers.calendar_service import calendar_service
-from helpers.email_service import send_confirmation_email
+from helpers.outbox import enqueue_booking_side_effects, outbox_worker
+from helpers.call_session import call_sessions
+from helpers.slot_holds import slot_holds
+from helpers.slot_engine import format_slot
+from helpers.intents import classify, YES, NO
 from config.settings import settings
+from tortoise.transactions import in_transaction
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional
 import json
 
+MAX_OFFERED_SLOTS = 8
+
 async def handle_caller_response(request: Request, call_sid: str) -> str:
     from datetime import datetime
     
@@ -23,92 +29,95 @@ async def handle_caller_response(request: Request, call_sid: str) -> str:
     
     from tortoise.exceptions import DoesNotExist, IntegrityError
     
-    try:
-        intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
-        if hasattr(intake_call, 'caller_id') and intake_call.caller_id:
-            try:
-                await intake_call.fetch_related('caller')
-            except Exception:
-                pass
-    except DoesNotExist:
+    agent = call_sessions.get(call_sid)
+    if agent is None:
         try:
-            from_number = form.get("From", "")
-            temp_caller, _ = await Caller.get_or_create(
-                email=f"temp_{call_sid}@temp.com",
-                defaults={
-                    "full_name": "Temporary",
-                    "phone": from_number or ""
-                }
-            )
-            
-            intake_call, created = await IntakeCall.get_or_create(
-                twilio_call_sid=call_sid,
-                defaults={
-                    "caller": temp_caller,
-                    "call_status": "in_progress",
-                    "current_state": CallState.GREETING.value,
-                    "practice_area": "",
-                    "consent_to_book": False
-                }
-            )
-        except IntegrityError:
+            intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
+            if hasattr(intake_call, 'caller_id') and intake_call.caller_id:
+                try:
+                    await intake_call.fetch_related('caller')
+                except Exception:
+                    pass
+        except DoesNotExist:
             try:
-                intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
-            except DoesNotExist:
+                from_number = form.get("From", "")
+                temp_caller, _ = await Caller.get_or_create(
+                    email=f"temp_{call_sid}@temp.com",
+                    defaults={
+                        "full_name": "Temporary",
+                        "phone": from_number or ""
+                    }
+                )
+            
+                intake_call, created = await IntakeCall.get_or_create(
+                    twilio_call_sid=call_sid,
+                    defaults={
+                        "caller": temp_caller,
+                        "call_status": "in_progress",
+                        "current_state": CallState.GREETING.value,
+                        "practice_area": "",
+                        "consent_to_book": False
+                    }
+                )
+            except IntegrityError:
+                try:
+                    intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
+                except DoesNotExist:
+                    response.say("Sorry, there was an error processing your call. Please try again.", voice='alice')
+                    response.hangup()
+                    return str(response)
+            except Exception:
+                import traceback
+                traceback.print_exc()
                 response.say("Sorry, there was an error processing your call. Please try again.", voice='alice')
                 response.hangup()
                 return str(response)
         except Exception:
             import traceback
             traceback.print_exc()
-            response.say("Sorry, there was an error processing your call. Please try again.", voice='alice')
-            response.hangup()
-            return str(response)
-    except Exception:
-        import traceback
-        traceback.print_exc()
+            try:
+                from_number = form.get("From", "")
+                temp_caller, _ = await Caller.get_or_create(
+                    email=f"temp_{call_sid}@temp.com",
+                    defaults={
+                        "full_name": "Temporary",
+                        "phone": from_number or ""
+                    }
+                )
+                intake_call, created = await IntakeCall.get_or_create(
+                    twilio_call_sid=call_sid,
+                    defaults={
+                        "caller": temp_caller,
+                        "call_status": "in_progress",
+                        "current_state": CallState.GREETING.value,
+                        "practice_area": "",
+                        "consent_to_book": False
+                    }
+                )
+            except Exception:
+                response.say("Sorry, there was an error processing your call. Please try again.", voice='alice')
+                response.hangup()
+                return str(response)
+    
         try:
-            from_number = form.get("From", "")
-            temp_caller, _ = await Caller.get_or_create(
-                email=f"temp_{call_sid}@temp.com",
-                defaults={
-                    "full_name": "Temporary",
-                    "phone": from_number or ""
-                }
-            )
-            intake_call, created = await IntakeCall.get_or_create(
-                twilio_call_sid=call_sid,
-                defaults={
-                    "caller": temp_caller,
-                    "call_status": "in_progress",
-                    "current_state": CallState.GREETING.value,
-                    "practice_area": "",
-                    "consent_to_book": False
-                }
-            )
+            agent = VoiceAgent(intake_call)
+            call_sessions.put(call_sid, agent)
         except Exception:
-            response.say("Sorry, there was an error processing your call. Please try again.", voice='alice')
+            import traceback
+            traceback.print_exc()
+            response.say("Sorry, there was an error. Please try again.", voice='alice')
             response.hangup()
             return str(response)
     
-    try:
-        agent = VoiceAgent(intake_call)
-    except Exception:
-        import traceback
-        traceback.print_exc()
-        response.say("Sorry, there was an error. Please try again.", voice='alice')
-        response.hangup()
-        return str(response)
-    
     result = await agent.process_response(speech_result)
     
-    if result["action"] == "end":
-        response.say(result["message"], voice='alice')
+    if result.action == "end":
+        response.say(result.message, voice='alice')
         response.hangup()
         return str(response)
     
-    elif result["action"] == "transfer":
-        response.say(result["message"], voice='alice')
+    elif result.action == "transfer":
+        response.say(result.message, voice='alice')
         base_url = settings.APP_URL.rstrip('/')
         gather = Gather(
             input='speech dtmf',
@@ -124,16 +133,17 @@ async def handle_caller_response(request: Request, call_sid: str) -> str:
         response.hangup()
         return str(response)
     
-    if result["message"]:
+    if result.message:
         if agent.current_state == CallState.SHOW_SLOTS:
-            start_date = datetime.now() + timedelta(days=1)
-            end_date = start_date + timedelta(days=14)
-            slots = await calendar_service.get_available_slots(start_date, end_date)
+            await slot_holds.release(call_sid)
+            agent.held_slot = None
+            slots = await _get_offerable_slots(agent)
             
             if slots:
-                num_slots = min(8, len(slots), 10)
+                await agent.offer_slots(slots[:MAX_OFFERED_SLOTS])
+                num_slots = len(agent.offered_slots)
                 slots_message = "Here are the available time slots: "
-                for i, slot in enumerate(slots[:num_slots], 1):
+                for i, slot in enumerate(agent.offered_slots.slots, 1):
                     slots_message += f"Option {i}, {slot['formatted']}. "
                 slots_message += f"Please choose option 1 through {num_slots}. Which option would you like?"
                 
@@ -159,7 +169,7 @@ async def handle_caller_response(request: Request, call_sid: str) -> str:
                 action=f'{base_url}/api/twilio/handle-response?call_sid={call_sid}',
                 method='POST'
             )
-            gather.say(result["message"], voice='alice')
+            gather.say(result.message, voice='alice')
             response.append(gather)
     
     base_url = settings.APP_URL.rstrip('/')
@@ -168,6 +178,19 @@ async def handle_caller_response(request: Request, call_sid: str) -> str:
     
     return str(response)
 
+async def _get_offerable_slots(agent: VoiceAgent) -> List[Dict]:
+    start_date = datetime.now() + timedelta(days=1)
+    end_date = start_date + timedelta(days=14)
+    held = await slot_holds.held_slots(start_date, end_date, exclude_call_sid=agent.intake_call.twilio_call_sid)
+    return await calendar_service.get_available_slots(
+        start_date, end_date, practice_area=agent.intake_call.practice_area, held=held
+    )
+
+def _show_slots_again(response: VoiceResponse, call_sid: str, message: str) -> str:
+    response.say(message, voice='alice')
+    response.redirect(f'{settings.APP_URL.rstrip("/")}/api/twilio/handle-response?call_sid={call_sid}')
+    return str(response)
+
 async def handle_slot_selection(request: Request, call_sid: str, slot_datetime: Optional[str] = None) -> str:
     response = VoiceResponse()
 
@@ -176,75 +199,73 @@ async def handle_slot_selection(request: Request, call_sid: str, slot_datetime:
     speech_result = form.get("SpeechResult", "")
     digits = form.get("Digits", "")
     
-    try:
-        intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
-    except:
-        response.say("Sorry, I couldn't find your call record.")
+    agent = call_sessions.get(call_sid)
+    if agent is None:
+        try:
+            intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
+        except:
+            response.say("Sorry, I couldn't find your call record.")
+            response.hangup()
+            return str(response)
+        
+        agent = VoiceAgent(intake_call)
+        call_sessions.put(call_sid, agent)
+    
+    intake_call = agent.intake_call
+    
+    if agent.current_state == CallState.END_CALL:
+        # A late or repeated webhook for a call that already finished;
+        # there is nothing left to choose or confirm.
+        response.say("Thank you for calling. Goodbye.", voice='alice')
         response.hangup()
         return str(response)
     
-    agent = VoiceAgent(intake_call)
-    
     if slot_datetime:
-        selected_slot = None
-        start_date = datetime.now() + timedelta(days=1)
-        end_date = start_date + timedelta(days=14)
-        slots = await calendar_service.get_available_slots(start_date, end_date)
-        
-        for slot in slots:
-            if slot["datetime"] == slot_datetime:
-                selected_slot = slot
-                break
+        selected_slot = agent.held_slot
+        if selected_slot is None or selected_slot["datetime"] != slot_datetime:
+            # Session was rebuilt from the DB; the hold row still says which calendar we picked.
+            hold = await slot_holds.get_hold(call_sid, datetime.fromisoformat(slot_datetime))
+            selected_slot = dict(format_slot(datetime.fromisoformat(slot_datetime)), calendar_id=hold.calendar_id) if hold else None
         
         if selected_slot:
-            confirmation_response = speech_result.lower() if speech_result else ""
+            intent = classify(speech_result, "confirm").intent
             
-            if "yes" in confirmation_response or "correct" in confirmation_response or "confirm" in confirmation_response:
-                caller = await Caller.get(id=intake_call.caller_id)
+            if intent == YES:
                 appointment_datetime = datetime.fromisoformat(selected_slot["datetime"])
                 
-                appointment = await Appointment.create(
-                    intake_call=intake_call,
-                    caller=caller,
-                    practice_area=intake_call.practice_area,
-                    appointment_date=appointment_datetime,
-                    appointment_time=appointment_datetime.time(),
-                    booking_status="confirmed"
-                )
-                
-                event_data = {
-                    "title": f"{intake_call.practice_area} Consultation - {caller.full_name}",
-                    "description": f"Consultation for {intake_call.practice_area} case.",
-                    "start_time": appointment_datetime,
-                    "end_time": appointment_datetime + timedelta(minutes=30),
-                    "attendees": [{"email": caller.email}]
-                }
-                
-                google_event_id = await calendar_service.create_calendar_event(event_data)
-                
-                if google_event_id:
-                    appointment.calendar_event_id = google_event_id
-                    await appointment.save()
-                    
-                    await CalendarEvent.create(
-                        appointment=appointment,
-                        google_event_id=google_event_id,
-                        event_title=event_data["title"],
-                        event_description=event_data["description"],
-                        start_time=appointment_datetime,
-                        end_time=appointment_datetime + timedelta(minutes=30)
+                # Booking and its side effects commit together on one
+                # connection; the calendar event and email go out from the
+                # outbox worker. The call only ends (and its hooks fire) once
+                # that has committed.
+                async with in_transaction() as connection:
+                    appointment = await slot_holds.book(
+                        call_sid,
+                        selected_slot["calendar_id"],
+                        appointment_datetime,
+                        using_db=connection,
+                        intake_call=intake_call,
+                        caller_id=intake_call.caller_id,
+                        practice_area=intake_call.practice_area,
+                        booking_status="confirmed"
                     )
-                
-                await send_confirmation_email(appointment)
+                    if appointment is not None:
+                        await enqueue_booking_side_effects(appointment, using_db=connection)
+                agent.held_slot = None
+                if appointment is None:
+                    await agent._transition_to(CallState.SHOW_SLOTS)
+                    return _show_slots_again(response, call_sid, "I'm sorry, that time was just booked by another caller. Let me show you the available slots again.")
+                await agent.end_call()
+                outbox_worker.wake()
                 
                 confirm_message = f"Perfect! I have you scheduled for {selected_slot['formatted']}. You will receive a confirmation email shortly with all the details."
                 response.say(confirm_message, voice='alice')
                 response.say("Thank you for calling. Have a great day!", voice='alice')
                 
-                await agent.end_call()
                 response.hangup()
                 return str(response)
-            elif "no" in confirmation_response or "wrong" in confirmation_response:
+            elif intent == NO:
+                await slot_holds.release(call_sid)
+                agent.held_slot = None
                 await agent._transition_to(CallState.SHOW_SLOTS)
                 response.say("No problem. Let me show you the available slots again.", voice='alice')
                 response.redirect(f'{settings.APP_URL.rstrip("/")}/api/twilio/handle-response?call_sid={call_sid}')
@@ -261,31 +282,26 @@ async def handle_slot_selection(request: Request, call_sid: str, slot_datetime:
                 gather.say(confirm_message, voice='alice')
                 response.append(gather)
                 return str(response)
+        
+        await agent._transition_to(CallState.SHOW_SLOTS)
+        return _show_slots_again(response, call_sid, "I'm sorry, that time is no longer being held for you. Let me show you the available slots again.")
     
-    start_date = datetime.now() + timedelta(days=1)
-    end_date = start_date + timedelta(days=14)
-    slots = await calendar_service.get_available_slots(start_date, end_date)
-    
-    selected_slot = None
+    if agent.offered_slots is None:
+        # No saved list to match "option 2" against; read the openings again
+        # rather than guess from a list that may have shifted.
+        return _show_slots_again(response, call_sid, "Let me read you the available times again.")
     
-    if digits:
-        try:
-            option_num = int(digits) - 1
-            if 0 <= option_num < len(slots):
-                selected_slot = slots[option_num]
-        except:
-            pass
-    
-    if not selected_slot and speech_result:
-        speech_lower = speech_result.lower()
-        for i, slot in enumerate(slots, 1):
-            if f"option {i}" in speech_lower or f"{i}" in speech_lower:
-                selected_slot = slot
-                break
+    selected_slot = agent.offered_slots.choose(speech_result, digits)
     
     if selected_slot:
+        slot_start = datetime.fromisoformat(selected_slot["datetime"])
+        if not await slot_holds.acquire(selected_slot["calendar_id"], slot_start, call_sid):
+            agent.offered_slots = None
+            return _show_slots_again(response, call_sid, "I'm sorry, another caller just took that time. Let me read you the latest openings.")
+        
         await agent._transition_to(CallState.CONFIRM_BOOKING)
         agent.selected_slot = selected_slot["formatted"]
+        agent.held_slot = selected_slot
         
         slot_datetime_str = selected_slot["datetime"]
         
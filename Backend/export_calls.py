@@ -0,0 +1,62 @@
+"""
+Export calls with their caller, answers and appointment.
+
+    python export_calls.py --format csv --output calls.csv
+    python export_calls.py --format parquet --output calls.parquet --practice-area "Lemon Law"
+    python export_calls.py --format ndjson --start-date 2024-01-01 > calls.ndjson
+
+Throughput (rows per second) is reported on stderr when the export finishes.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.database import init_db, close_db
+from config.settings import settings
+from helpers.call_export import export_rows, export_stream
+
+
+async def main(args):
+    await init_db()
+    output = open(args.output, "wb") if args.output != "-" else sys.stdout.buffer
+    rows = 0
+    started = time.perf_counter()
+
+    async def counted(chunks):
+        nonlocal rows
+        async for chunk in chunks:
+            rows += len(chunk)
+            yield chunk
+
+    try:
+        chunks = export_rows(args.practice_area, args.start_date, args.end_date, batch_size=args.batch_size)
+        async for data in export_stream(args.format, counted(chunks)):
+            output.write(data)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+        await close_db()
+
+    seconds = time.perf_counter() - started
+    print(json.dumps({
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds) if seconds else None,
+    }), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export calls as CSV, NDJSON or Parquet")
+    parser.add_argument("--format", choices=["csv", "ndjson", "parquet"], default="csv")
+    parser.add_argument("--output", default="-", help="File to write, or - for stdout")
+    parser.add_argument("--practice-area", help="Only calls for this practice area")
+    parser.add_argument("--start-date", type=datetime.fromisoformat, help="Calls created on or after this date")
+    parser.add_argument("--end-date", type=datetime.fromisoformat, help="Calls created before this date")
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE, help="Calls read per chunk")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,260 @@
+import calendar
+import re
+from dataclasses import asdict, astuple, dataclass
+from datetime import date, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+from config.lemon_law_questions import LEMON_LAW_QUESTIONS
+from config.personal_injury_questions import PERSONAL_INJURY_QUESTIONS
+from helpers.intents import IntentMatcher, classify
+from helpers.validators import validate_date
+from models.case_question import CaseQuestion
+
+QUESTIONS_BY_KEY: Dict[str, Dict] = {
+    question["key"]: question for question in LEMON_LAW_QUESTIONS + PERSONAL_INJURY_QUESTIONS
+}
+
+NORMALIZED_FIELDS = ["answer_date", "answer_number", "answer_choice", "normalized_at"]
+
+@dataclass
+class NormalizedAnswer:
+    answer_date: Optional[date] = None
+    answer_number: Optional[int] = None
+    answer_choice: Optional[str] = None
+
+class SpokenOrdinal(int):
+    # "third", "21st": a day of the month, never half of a spoken year.
+    pass
+
+_TOKEN = re.compile(r"\d+|[a-z]+(?:'[a-z]+)?")
+_NUMERIC_DATE = re.compile(r"\b\d{4}-\d{1,2}-\d{1,2}\b|\b\d{1,2}/\d{1,2}/\d{4}\b")
+
+_UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
+    "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+_TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+_ORDINALS = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5, "sixth": 6, "seventh": 7,
+    "eighth": 8, "ninth": 9, "tenth": 10, "eleventh": 11, "twelfth": 12, "thirteenth": 13,
+    "fourteenth": 14, "fifteenth": 15, "sixteenth": 16, "seventeenth": 17, "eighteenth": 18,
+    "nineteenth": 19, "twentieth": 20, "thirtieth": 30,
+}
+_ORDINAL_SUFFIXES = frozenset({"st", "nd", "rd", "th"})
+_COUNT_WORDS = {"none": 0, "never": 0, "once": 1, "twice": 2, "couple": 2}
+
+MONTHS = {
+    "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3, "april": 4, "apr": 4,
+    "may": 5, "june": 6, "jun": 6, "july": 7, "jul": 7, "august": 8, "aug": 8,
+    "september": 9, "sep": 9, "sept": 9, "october": 10, "oct": 10, "november": 11, "nov": 11,
+    "december": 12, "dec": 12,
+}
+_UNIT_DAYS = {"day": 1, "days": 1, "week": 7, "weeks": 7}
+_UNIT_MONTHS = {"month": 1, "months": 1, "year": 12, "years": 12}
+
+Token = Union[int, str]
+
+def read_spoken_numbers(text: str) -> List[Token]:
+    # Collapses spoken numbers into ints in one pass: "twenty three" -> 23,
+    # "two thousand and five" -> 2005, "third" / "3rd" -> SpokenOrdinal(3).
+    tokens: List[Token] = []
+    total = current = None
+    last = None
+
+    def flush():
+        nonlocal total, current, last
+        if current is not None or total is not None:
+            tokens.append((total or 0) + (current or 0))
+        total = current = last = None
+
+    for word in _TOKEN.findall(text.lower()):
+        if word.isdigit():
+            flush()
+            tokens.append(int(word))
+            continue
+        if word in _ORDINAL_SUFFIXES and tokens and isinstance(tokens[-1], int):
+            tokens[-1] = SpokenOrdinal(tokens[-1])
+            continue
+
+        if word in _UNITS or word in _ORDINALS:
+            value = _UNITS.get(word, _ORDINALS.get(word))
+            if current is None or (value < 10 and last == "tens") or last == "scale":
+                current = (current or 0) + value
+            else:
+                flush()
+                current = value
+            last = "unit"
+            if word in _ORDINALS:
+                value = (total or 0) + current
+                total = current = last = None
+                tokens.append(SpokenOrdinal(value))
+        elif word in _TENS:
+            if current is not None and last != "scale":
+                flush()
+            current = (current or 0) + _TENS[word]
+            last = "tens"
+        elif word == "hundred" and last != "scale":
+            current = (current or 1) * 100
+            last = "scale"
+        elif word == "thousand" and last != "scale":
+            total = (total or 0) + (current or 1) * 1000
+            current = 0
+            last = "scale"
+        elif word == "and" and last == "scale":
+            continue
+        else:
+            flush()
+            tokens.append(word)
+    flush()
+
+    # "twenty twenty three" / "nineteen ninety nine" are years.
+    merged: List[Token] = []
+    for token in tokens:
+        previous = merged[-1] if merged else None
+        if (
+            isinstance(token, int) and not isinstance(token, SpokenOrdinal) and 0 <= token <= 99
+            and isinstance(previous, int) and not isinstance(previous, SpokenOrdinal) and previous in (19, 20)
+        ):
+            merged[-1] = previous * 100 + token
+        else:
+            merged.append(token)
+    return merged
+
+def parse_spoken_number(text: str) -> Optional[int]:
+    for token in read_spoken_numbers(text):
+        if isinstance(token, int):
+            return int(token)
+        if token in _COUNT_WORDS:
+            return _COUNT_WORDS[token]
+    return None
+
+def _months_before(reference: date, months: int) -> date:
+    month_index = reference.year * 12 + reference.month - 1 - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    return date(year, month, min(reference.day, calendar.monthrange(year, month)[1]))
+
+def _relative_date(tokens: List[Token], reference: date) -> Optional[date]:
+    for i, token in enumerate(tokens):
+        if token == "today":
+            return reference
+        if token == "yesterday":
+            return reference - timedelta(days=1)
+        if token == "ago" and i >= 1:
+            unit = tokens[i - 1]
+            count = tokens[i - 2] if i >= 2 else None
+            count = 1 if count in ("a", "an") else _COUNT_WORDS.get(count, count)
+            if isinstance(count, int):
+                if unit in _UNIT_DAYS:
+                    return reference - timedelta(days=count * _UNIT_DAYS[unit])
+                if unit in _UNIT_MONTHS:
+                    return _months_before(reference, count * _UNIT_MONTHS[unit])
+        if token == "last" and i + 1 < len(tokens):
+            unit = tokens[i + 1]
+            if unit == "week":
+                return reference - timedelta(days=7)
+            if unit in ("month", "year"):
+                return _months_before(reference, _UNIT_MONTHS[unit])
+    return None
+
+def _calendar_date(words: List[Token], reference: date) -> Optional[date]:
+    for i, token in enumerate(words):
+        if not isinstance(token, str) or token not in MONTHS:
+            continue
+        day = year = None
+        following = words[i + 1:i + 3]
+        preceding = words[i - 1] if i else None
+        for candidate in following:
+            if isinstance(candidate, int) and 1900 <= candidate <= 2100:
+                year = int(candidate)
+            elif isinstance(candidate, int) and day is None and year is None and 1 <= candidate <= 31:
+                day = int(candidate)
+        if day is None and isinstance(preceding, int) and 1 <= preceding <= 31:
+            day = int(preceding)
+        if year is None:
+            year = next((int(word) for word in words[max(i - 2, 0):i] if isinstance(word, int) and 1900 <= word <= 2100), None)
+        if token == "may" and day is None and year is None:
+            continue  # "I may have ..."
+
+        month = MONTHS[token]
+        try:
+            if year is None:
+                year = reference.year
+                if date(year, month, day or 1) > reference:
+                    year -= 1
+            return date(year, month, day or 1)
+        except ValueError:
+            return None
+    return None
+
+def parse_spoken_date(text: str, reference: Optional[date] = None) -> Optional[date]:
+    reference = reference or date.today()
+    match = _NUMERIC_DATE.search(text)
+    if match:
+        parsed = validate_date(match.group(0))
+        if parsed:
+            return parsed.date()
+
+    words = [token for token in read_spoken_numbers(text) if token not in ("the", "of")]
+    return _calendar_date(words, reference) or _relative_date(words, reference)
+
+_choice_matchers: Dict[str, IntentMatcher] = {}
+
+def _choice_matcher(question: Dict) -> IntentMatcher:
+    matcher = _choice_matchers.get(question["key"])
+    if matcher is None:
+        matcher = _choice_matchers[question["key"]] = IntentMatcher(question.get("options", {}))
+    return matcher
+
+def normalize_answer(question: Optional[Dict], answer: str, reference: Optional[date] = None) -> NormalizedAnswer:
+    question_type = question.get("type") if question else None
+    if not answer:
+        return NormalizedAnswer()
+
+    if question_type == "date":
+        return NormalizedAnswer(answer_date=parse_spoken_date(answer, reference))
+    if question_type == "number":
+        return NormalizedAnswer(answer_number=parse_spoken_number(answer))
+    if question_type in ("yes_no", "yes_no_unsure"):
+        return NormalizedAnswer(answer_choice=classify(answer, "answer_yes_no").intent)
+    if question_type == "choice":
+        return NormalizedAnswer(answer_choice=_choice_matcher(question).classify(answer).intent)
+    return NormalizedAnswer()
+
+def normalized_fields(question: Optional[Dict], answer: str, reference: Optional[date] = None) -> Dict:
+    return dict(asdict(normalize_answer(question, answer, reference)), normalized_at=timezone.now())
+
+async def backfill_case_answers(batch_size: int = 1000, renormalize: bool = False) -> AsyncIterator[Dict]:
+    # Keyset pages by id so every chunk is an index range scan. Answers
+    # cluster on a few values ("yes", "no", small counts), so each chunk is
+    # written as one UPDATE ... WHERE id IN (...) per distinct value, in a
+    # single transaction.
+    last_id = 0
+    processed = 0
+    while True:
+        query = CaseQuestion.filter(id__gt=last_id)
+        if not renormalize:
+            query = query.filter(normalized_at__isnull=True)
+        rows = await query.order_by("id").limit(batch_size).values("id", "question_key", "answer", "created_at")
+        if not rows:
+            break
+
+        groups: Dict[tuple, Tuple[NormalizedAnswer, List[int]]] = {}
+        for row in rows:
+            reference = row["created_at"].date() if row["created_at"] else None
+            normalized = normalize_answer(QUESTIONS_BY_KEY.get(row["question_key"]), row["answer"], reference)
+            groups.setdefault(astuple(normalized), (normalized, []))[1].append(row["id"])
+
+        normalized_at = timezone.now()
+        async with in_transaction():
+            for normalized, ids in groups.values():
+                await CaseQuestion.filter(id__in=ids).update(normalized_at=normalized_at, **asdict(normalized))
+
+        last_id = rows[-1]["id"]
+        processed += len(rows)
+        yield {"last_id": last_id, "batch": len(rows), "updates": len(groups), "processed": processed}
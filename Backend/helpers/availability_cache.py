@@ -0,0 +1,60 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+class AvailabilityCache:
+    # Keys are (calendar_ids, window_start, window_end, *extra); windows use naive datetimes.
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple, Tuple[float, List]] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._generation = 0
+
+    async def get_or_load(self, key: Tuple, loader: Callable[[], Awaitable[List]]) -> List:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, slots = entry
+            if expires_at > time.monotonic():
+                return list(slots)
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, self._generation))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+
+        return list(await asyncio.shield(task))
+
+    def _forget_inflight(self, key: Tuple, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _load(self, key: Tuple, loader: Callable[[], Awaitable[List]], generation: int) -> List:
+        slots = await loader()
+        if generation == self._generation and self.ttl_seconds > 0:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, slots)
+        return slots
+
+    def invalidate(self, start: datetime, end: datetime, calendar_id: Optional[str] = None):
+        start = start.replace(tzinfo=None)
+        end = end.replace(tzinfo=None)
+        self._generation += 1
+
+        for store in (self._entries, self._inflight):
+            for key in list(store):
+                key_calendars, window_start, window_end = key[:3]
+                if calendar_id is not None and calendar_id not in key_calendars:
+                    continue
+                if window_start < end and start < window_end:
+                    del store[key]
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
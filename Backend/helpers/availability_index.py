@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+from tortoise.transactions import in_transaction
+from models.appointment import Appointment
+from models.busy_interval import BusyInterval
+from models.calendar_sync_state import CalendarSyncState
+from helpers.slot_engine import Interval, SLOT_INTERVAL_MINUTES, merge_intervals
+
+def _utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def event_interval(event: Dict) -> Optional[Interval]:
+    if event.get('status') == 'cancelled' or event.get('transparency') == 'transparent':
+        return None
+
+    start = event.get('start', {})
+    end = event.get('end', {})
+    if 'dateTime' in start and 'dateTime' in end:
+        interval = (
+            _utc_naive(datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))),
+            _utc_naive(datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00')))
+        )
+    elif 'date' in start and 'date' in end:
+        interval = (datetime.fromisoformat(start['date']), datetime.fromisoformat(end['date']))
+    else:
+        return None
+
+    return interval if interval[1] > interval[0] else None
+
+class AvailabilityIndex:
+    # Busy time per calendar: Google events keyed by event id, plus our own
+    # appointments keyed by appointment id so bookings count before Google
+    # echoes them back.
+
+    def __init__(self, horizon_days: int = 120):
+        self.horizon_days = horizon_days
+        self._events: Dict[str, Dict[str, Interval]] = {}
+        self._appointments: Dict[str, Dict[int, Interval]] = {}
+        self._merged: Dict[str, List[Interval]] = {}
+        self.sync_tokens: Dict[str, Optional[str]] = {}
+        self.last_synced_at: Dict[str, datetime] = {}
+        self.last_full_sync_at: Dict[str, datetime] = {}
+        self.loaded = False
+
+    async def load(self, default_calendar_id: str):
+        self._events.clear()
+        self._appointments.clear()
+        self._merged.clear()
+
+        for row in await BusyInterval.all():
+            self._events.setdefault(row.calendar_id, {})[row.google_event_id] = (
+                _utc_naive(row.start_time), _utc_naive(row.end_time)
+            )
+
+        for state in await CalendarSyncState.all():
+            self.sync_tokens[state.calendar_id] = state.sync_token
+            if state.last_synced_at:
+                self.last_synced_at[state.calendar_id] = _utc_naive(state.last_synced_at)
+            if state.last_full_sync_at:
+                self.last_full_sync_at[state.calendar_id] = _utc_naive(state.last_full_sync_at)
+
+        upcoming = await Appointment.filter(
+            appointment_date__gte=_utc_now() - timedelta(days=1)
+        ).exclude(booking_status="cancelled")
+        for appointment in upcoming:
+            self.add_appointment(appointment, default_calendar_id)
+
+        self.loaded = True
+
+    def busy_intervals(self, calendar_id: str) -> List[Interval]:
+        merged = self._merged.get(calendar_id)
+        if merged is None:
+            merged = merge_intervals(
+                list(self._events.get(calendar_id, {}).values())
+                + list(self._appointments.get(calendar_id, {}).values())
+            )
+            self._merged[calendar_id] = merged
+        return merged
+
+    def staleness(self, calendar_ids: Iterable[str]) -> Optional[float]:
+        now = _utc_now()
+        ages = []
+        for calendar_id in calendar_ids:
+            synced_at = self.last_synced_at.get(calendar_id)
+            if synced_at is None:
+                return None
+            ages.append((now - synced_at).total_seconds())
+        return max(ages) if ages else None
+
+    def add_appointment(self, appointment: Appointment, default_calendar_id: str):
+        calendar_id = appointment.attorney_calendar_id or default_calendar_id
+        start = _utc_naive(appointment.appointment_date)
+        self._appointments.setdefault(calendar_id, {})[appointment.id] = (
+            start, start + timedelta(minutes=SLOT_INTERVAL_MINUTES)
+        )
+        self._merged.pop(calendar_id, None)
+
+    def remove_appointment(self, appointment: Appointment, default_calendar_id: str):
+        calendar_id = appointment.attorney_calendar_id or default_calendar_id
+        self._appointments.get(calendar_id, {}).pop(appointment.id, None)
+        self._merged.pop(calendar_id, None)
+
+    def needs_full_sync(self, calendar_id: str, full_sync_interval: timedelta) -> bool:
+        if not self.sync_tokens.get(calendar_id):
+            return True
+        last_full_sync = self.last_full_sync_at.get(calendar_id)
+        return last_full_sync is None or _utc_now() - last_full_sync > full_sync_interval
+
+    async def apply_sync(self, calendar_id: str, events: List[Dict], sync_token: Optional[str], full: bool) -> List[Interval]:
+        now = _utc_now()
+        horizon_start = now - timedelta(days=1)
+        horizon_end = now + timedelta(days=self.horizon_days)
+
+        previous = self._events.get(calendar_id, {})
+        current = {} if full else dict(previous)
+
+        for event in events:
+            event_id = event.get('id')
+            if not event_id:
+                continue
+            interval = event_interval(event)
+            if interval and interval[1] >= horizon_start and interval[0] <= horizon_end:
+                current[event_id] = interval
+            else:
+                current.pop(event_id, None)
+
+        removed = [event_id for event_id in previous if event_id not in current]
+        updated = [event_id for event_id, interval in current.items() if previous.get(event_id) != interval]
+        changed = [previous[event_id] for event_id in removed + updated if event_id in previous]
+        changed += [current[event_id] for event_id in updated]
+
+        upserts = [
+            BusyInterval(calendar_id=calendar_id, google_event_id=event_id, start_time=current[event_id][0], end_time=current[event_id][1])
+            for event_id in updated
+        ]
+
+        async with in_transaction():
+            if removed:
+                await BusyInterval.filter(calendar_id=calendar_id, google_event_id__in=removed).delete()
+            if upserts:
+                await BusyInterval.bulk_create(
+                    upserts,
+                    batch_size=500,
+                    on_conflict=["calendar_id", "google_event_id"],
+                    update_fields=["start_time", "end_time"]
+                )
+            state_fields = {"sync_token": sync_token, "last_synced_at": now}
+            if full:
+                state_fields["last_full_sync_at"] = now
+            await CalendarSyncState.update_or_create(calendar_id=calendar_id, defaults=state_fields)
+
+        self._events[calendar_id] = current
+        self._merged.pop(calendar_id, None)
+        self.sync_tokens[calendar_id] = sync_token
+        self.last_synced_at[calendar_id] = now
+        if full:
+            self.last_full_sync_at[calendar_id] = now
+        return changed
+
+    async def reset_sync_token(self, calendar_id: str):
+        self.sync_tokens[calendar_id] = None
+        await CalendarSyncState.filter(calendar_id=calendar_id).update(sync_token=None)
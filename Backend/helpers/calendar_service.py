@@ -1,21 +1,41 @@
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from google.auth.transport.requests import Request as GoogleAuthRequest
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Collection, List, Dict, Optional, Tuple
+from tortoise.signals import post_save
 from config.settings import settings
+from helpers.availability_cache import AvailabilityCache
+from helpers.availability_index import AvailabilityIndex
+from helpers.slot_engine import (
+    SLOT_INTERVAL_MINUTES, align_to_slot, format_slot,
+    iter_pool_openings, parse_busy_intervals
+)
+from models.appointment import Appointment
+from urllib.parse import quote
+import asyncio
+import httpx
 import json
 import os
 
+MAX_SLOTS = 10
+HELD_SLOT_ALLOWANCE = 10
+FREEBUSY_MAX_CALENDARS = 50
+EVENTS_PAGE_SIZE = 2500
+
 class CalendarService:
     
     def __init__(self):
-        self.service = None
+        self.credentials = None
+        self.client: Optional[httpx.AsyncClient] = None
+        self._token_lock: Optional[asyncio.Lock] = None
         self.calendar_id = settings.GOOGLE_CALENDAR_ID
+        self.availability_cache = AvailabilityCache(ttl_seconds=settings.CALENDAR_AVAILABILITY_TTL_SECONDS)
+        self.availability_index = AvailabilityIndex(horizon_days=settings.CALENDAR_INDEX_HORIZON_DAYS)
         
-    def _get_service(self):
-        if self.service:
-            return self.service
+    def _get_credentials(self):
+        if self.credentials:
+            return self.credentials
         
         if not settings.GOOGLE_CALENDAR_CREDENTIALS:
             raise ValueError("GOOGLE_CALENDAR_CREDENTIALS not configured")
@@ -50,123 +70,235 @@ class CalendarService:
                     scopes=['https://www.googleapis.com/auth/calendar']
                 )
             
-            self.service = build('calendar', 'v3', credentials=credentials)
-            return self.service
+            self.credentials = credentials
+            return self.credentials
         except Exception as e:
             error_msg = f"Could not initialize Google Calendar service: {e}"
             raise ValueError(error_msg)
     
-    async def get_available_slots(self, start_date: datetime, end_date: datetime, duration_minutes: int = 30) -> List[Dict]:
-        try:
-            service = self._get_service()
-            
-            freebusy_query = {
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                base_url=settings.GOOGLE_CALENDAR_API_URL.rstrip('/'),
+                timeout=httpx.Timeout(settings.GOOGLE_CALENDAR_TIMEOUT_SECONDS),
+                limits=httpx.Limits(
+                    max_connections=settings.GOOGLE_CALENDAR_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GOOGLE_CALENDAR_MAX_CONNECTIONS
+                )
+            )
+        return self.client
+    
+    async def _get_access_token(self) -> str:
+        credentials = self._get_credentials()
+        if credentials.valid:
+            return credentials.token
+        
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        
+        async with self._token_lock:
+            if not credentials.valid:
+                await asyncio.to_thread(credentials.refresh, GoogleAuthRequest())
+        return credentials.token
+    
+    async def _request(self, method: str, path: str, body: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+        token = await self._get_access_token()
+        response = await self._get_client().request(
+            method,
+            path,
+            json=body,
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    async def _query_freebusy(self, start_date: datetime, end_date: datetime, calendar_ids: Optional[List[str]] = None) -> Dict:
+        calendar_ids = calendar_ids or [self.calendar_id]
+        batches = [
+            calendar_ids[i:i + FREEBUSY_MAX_CALENDARS]
+            for i in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS)
+        ]
+        results = await asyncio.gather(*[
+            self._request("POST", "/freeBusy", {
                 "timeMin": start_date.isoformat() + 'Z',
                 "timeMax": end_date.isoformat() + 'Z',
-                "items": [{"id": self.calendar_id}]
-            }
-            
-            freebusy_result = service.freebusy().query(body=freebusy_query).execute()
-            
-            busy_periods = []
-            if 'calendars' in freebusy_result and self.calendar_id in freebusy_result['calendars']:
-                busy_periods = freebusy_result['calendars'][self.calendar_id].get('busy', [])
-            
-            available_slots = []
-            current = start_date
-            
-            business_start = 9
-            business_end = 17
-            
-            while current < end_date:
-                if business_start <= current.hour < business_end:
-                    is_available = True
-                    slot_end = current + timedelta(minutes=duration_minutes)
-                    
-                    for busy in busy_periods:
-                        busy_start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
-                        busy_end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
-                        
-                        if (current < busy_end and slot_end > busy_start):
-                            is_available = False
-                            break
-                    
-                    if is_available:
-                        available_slots.append({
-                            "date": current.strftime("%Y-%m-%d"),
-                            "time": current.strftime("%H:%M"),
-                            "datetime": current.isoformat(),
-                            "formatted": current.strftime("%B %d, %Y at %I:%M %p")
-                        })
-                
-                current += timedelta(minutes=30)
-                
-                if current.hour >= business_end:
-                    current = current.replace(hour=business_start, minute=0) + timedelta(days=1)
-            
-            return available_slots[:10]
-            
-        except HttpError as e:
-            return self._get_mock_slots(start_date)
-        except ValueError as ve:
-            return self._get_mock_slots(start_date)
-        except Exception as e:
+                "items": [{"id": calendar_id} for calendar_id in batch]
+            })
+            for batch in batches
+        ])
+        
+        calendars = {}
+        for result in results:
+            calendars.update(result.get('calendars', {}))
+        return {"calendars": calendars}
+    
+    async def _list_events(self, calendar_id: str, sync_token: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        params = {"singleEvents": "true", "showDeleted": "true", "maxResults": EVENTS_PAGE_SIZE}
+        if sync_token:
+            params["syncToken"] = sync_token
+        else:
+            params["timeMin"] = (datetime.utcnow() - timedelta(days=1)).isoformat() + 'Z'
+            params["timeMax"] = (datetime.utcnow() + timedelta(days=self.availability_index.horizon_days)).isoformat() + 'Z'
+        
+        events = []
+        while True:
+            page = await self._request("GET", f"/calendars/{quote(calendar_id, safe='')}/events", params=params)
+            events.extend(page.get('items', []))
+            if not page.get('nextPageToken'):
+                return events, page.get('nextSyncToken')
+            params["pageToken"] = page['nextPageToken']
+    
+    async def sync_calendar(self, calendar_id: str):
+        index = self.availability_index
+        full = index.needs_full_sync(calendar_id, timedelta(hours=settings.CALENDAR_FULL_SYNC_HOURS))
+        sync_token = None if full else index.sync_tokens.get(calendar_id)
+        
+        try:
+            events, next_sync_token = await self._list_events(calendar_id, sync_token)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 410 or full:
+                raise
+            # Google expired the sync token; start over from a full listing.
+            await index.reset_sync_token(calendar_id)
+            full = True
+            events, next_sync_token = await self._list_events(calendar_id)
+        
+        changed = await index.apply_sync(calendar_id, events, next_sync_token, full)
+        for start_time, end_time in changed:
+            self.invalidate_slot(start_time, end_time, calendar_id=calendar_id)
+    
+    async def sync_all_calendars(self):
+        calendar_ids = settings.get_all_attorney_calendar_ids()
+        results = await asyncio.gather(
+            *[self.sync_calendar(calendar_id) for calendar_id in calendar_ids],
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                import traceback
+                traceback.print_exception(type(result), result, result.__traceback__)
+    
+    async def run_sync_loop(self):
+        if not self.availability_index.loaded:
+            await self.availability_index.load(self.calendar_id)
+        
+        while True:
+            try:
+                await self.sync_all_calendars()
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+            await asyncio.sleep(settings.CALENDAR_SYNC_INTERVAL_SECONDS)
+    
+    def _index_is_fresh(self, calendar_ids) -> bool:
+        if not self.availability_index.loaded:
+            return False
+        staleness = self.availability_index.staleness(calendar_ids)
+        return staleness is not None and staleness <= settings.CALENDAR_INDEX_MAX_STALENESS_SECONDS
+    
+    def get_index_status(self, practice_area: Optional[str] = None) -> Dict:
+        calendar_ids = settings.get_attorney_calendar_ids(practice_area)
+        staleness = self.availability_index.staleness(calendar_ids) if self.availability_index.loaded else None
+        return {
+            "source": "index" if self._index_is_fresh(calendar_ids) else "live",
+            "staleness_seconds": round(staleness, 1) if staleness is not None else None
+        }
+    
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def get_available_slots(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int = 30,
+        practice_area: Optional[str] = None,
+        held: Collection[Tuple[str, datetime]] = ()
+    ) -> List[Dict]:
+        start_date = align_to_slot(start_date)
+        end_date = align_to_slot(end_date)
+        calendar_ids = tuple(settings.get_attorney_calendar_ids(practice_area))
+        
+        # Only the first openings are generated and cached, with some extra
+        # for slots other callers are holding. A held (calendar_id, start)
+        # pair hides at most one opening, so if holds use up the extra one
+        # more pass with MAX_SLOTS + len(held) is always enough.
+        limit = MAX_SLOTS + HELD_SLOT_ALLOWANCE
+        while True:
+            openings = await self._load_openings(start_date, end_date, duration_minutes, calendar_ids, limit)
+            slots = self._unheld_slots(openings, held)
+            if len(slots) == MAX_SLOTS or len(openings) < limit or limit >= MAX_SLOTS + len(held):
+                return slots
+            limit = MAX_SLOTS + len(held)
+    
+    async def _load_openings(self, start_date: datetime, end_date: datetime, duration_minutes: int, calendar_ids: Tuple[str, ...], limit: int) -> List[Tuple[datetime, List[str]]]:
+        try:
+            return await self.availability_cache.get_or_load(
+                (calendar_ids, start_date, end_date, duration_minutes, limit),
+                lambda: self._query_available_slots(start_date, end_date, duration_minutes, calendar_ids, limit)
+            )
+        except Exception:
+            # Offer nothing rather than times nobody checked: anything returned
+            # here can be held and booked. Failures are not cached, so the
+            # next caller tries Google again.
             import traceback
             traceback.print_exc()
-            return self._get_mock_slots(start_date)
+            return []
     
-    def _get_mock_slots(self, start_date: datetime) -> List[Dict]:
+    def _unheld_slots(self, openings: List[Tuple[datetime, List[str]]], held: Collection[Tuple[str, datetime]]) -> List[Dict]:
+        # Openings are shared between callers; held (calendar_id, start) pairs
+        # are skipped per request so a hold never invalidates the cache.
         slots = []
-        current = start_date.replace(hour=9, minute=0, second=0, microsecond=0)
+        for slot, free in openings:
+            calendar_id = next((c for c in free if (c, slot) not in held), None)
+            if calendar_id is not None:
+                slots.append(dict(format_slot(slot), calendar_id=calendar_id))
+                if len(slots) == MAX_SLOTS:
+                    break
+        return slots
+    
+    async def _query_available_slots(self, start_date: datetime, end_date: datetime, duration_minutes: int, calendar_ids: Tuple[str, ...], limit: int) -> List[Tuple[datetime, List[str]]]:
+        if self._index_is_fresh(calendar_ids):
+            busy_by_calendar = {
+                calendar_id: self.availability_index.busy_intervals(calendar_id)
+                for calendar_id in calendar_ids
+            }
+        else:
+            busy_by_calendar = await self._query_live_busy(start_date, end_date, calendar_ids)
         
-        for i in range(10):
-            if current.hour >= 17:
-                current = current.replace(hour=9, minute=0) + timedelta(days=1)
-            
-            slots.append({
-                "date": current.strftime("%Y-%m-%d"),
-                "time": current.strftime("%H:%M"),
-                "datetime": current.isoformat(),
-                "formatted": current.strftime("%B %d, %Y at %I:%M %p")
-            })
-            
-            current += timedelta(hours=1)
+        return list(islice(iter_pool_openings(
+            start_date,
+            end_date,
+            busy_by_calendar,
+            duration_minutes=duration_minutes,
+            business_start=settings.BUSINESS_HOURS_START,
+            business_end=settings.BUSINESS_HOURS_END,
+            buffer_minutes=settings.SLOT_BUFFER_MINUTES
+        ), limit))
+    
+    async def _query_live_busy(self, start_date: datetime, end_date: datetime, calendar_ids: Tuple[str, ...]) -> Dict[str, List]:
+        freebusy_result = await self._query_freebusy(start_date, end_date, list(calendar_ids))
         
-        return slots
+        busy_by_calendar = {}
+        for calendar_id in calendar_ids:
+            calendar = freebusy_result['calendars'].get(calendar_id)
+            if calendar is None or calendar.get('errors'):
+                continue
+            busy_by_calendar[calendar_id] = parse_busy_intervals(calendar.get('busy', []))
+        return busy_by_calendar
+    
+    def invalidate_slot(self, start_time: datetime, end_time: Optional[datetime] = None, calendar_id: Optional[str] = None):
+        if end_time is None:
+            end_time = start_time + timedelta(minutes=SLOT_INTERVAL_MINUTES)
+        self.availability_cache.invalidate(start_time, end_time, calendar_id=calendar_id)
     
     async def create_calendar_event(self, appointment_data: Dict) -> Optional[str]:
         try:
-            service = self._get_service()
-            
-            event = {
-                'summary': appointment_data.get('title', 'Legal Consultation'),
-                'description': appointment_data.get('description', ''),
-                'start': {
-                    'dateTime': appointment_data['start_time'].isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': appointment_data['end_time'].isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'attendees': appointment_data.get('attendees', []),
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},
-                        {'method': 'popup', 'minutes': 30},
-                    ],
-                },
-            }
-            
-            created_event = service.events().insert(
-                calendarId=self.calendar_id,
-                body=event
-            ).execute()
-            
-            return created_event.get('id')
-            
-        except HttpError as e:
+            return await self.insert_calendar_event(appointment_data)
+        except httpx.HTTPError as e:
             return None
         except ValueError as ve:
             return None
@@ -175,17 +307,50 @@ class CalendarService:
             traceback.print_exc()
             return None
     
+    async def insert_calendar_event(self, appointment_data: Dict) -> str:
+        event = {
+            'summary': appointment_data.get('title', 'Legal Consultation'),
+            'description': appointment_data.get('description', ''),
+            'start': {
+                'dateTime': appointment_data['start_time'].isoformat(),
+                'timeZone': 'UTC',
+            },
+            'end': {
+                'dateTime': appointment_data['end_time'].isoformat(),
+                'timeZone': 'UTC',
+            },
+            'attendees': appointment_data.get('attendees', []),
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},
+                    {'method': 'popup', 'minutes': 30},
+                ],
+            },
+        }
+        # A caller-chosen id makes retries safe: Google answers 409 for an id it already has.
+        event_id = appointment_data.get('event_id')
+        if event_id:
+            event['id'] = event_id
+        
+        calendar_id = appointment_data.get('calendar_id') or self.calendar_id
+        try:
+            created_event = await self._request(
+                "POST",
+                f"/calendars/{quote(calendar_id, safe='')}/events",
+                event
+            )
+        except httpx.HTTPStatusError as e:
+            if event_id and e.response.status_code == 409:
+                return event_id
+            raise
+        self.invalidate_slot(appointment_data['start_time'], appointment_data['end_time'], calendar_id=calendar_id)
+        
+        return created_event.get('id')
+    
     async def check_slot_availability(self, date: datetime, time: datetime) -> bool:
         try:
-            service = self._get_service()
-            
-            freebusy_query = {
-                "timeMin": date.isoformat() + 'Z',
-                "timeMax": (date + timedelta(minutes=30)).isoformat() + 'Z',
-                "items": [{"id": self.calendar_id}]
-            }
-            
-            freebusy_result = service.freebusy().query(body=freebusy_query).execute()
+            freebusy_result = await self._query_freebusy(date, date + timedelta(minutes=30))
             
             if 'calendars' in freebusy_result and self.calendar_id in freebusy_result['calendars']:
                 busy_periods = freebusy_result['calendars'][self.calendar_id].get('busy', [])
@@ -198,3 +363,14 @@ class CalendarService:
 
 calendar_service = CalendarService()
 
+@post_save(Appointment)
+async def _invalidate_booked_slot(sender, instance, created, using_db, update_fields):
+    index = calendar_service.availability_index
+    if index.loaded:
+        if instance.booking_status == "cancelled":
+            index.remove_appointment(instance, calendar_service.calendar_id)
+        else:
+            index.add_appointment(instance, calendar_service.calendar_id)
+    
+    if created or instance.booking_status == "cancelled":
+        calendar_service.invalidate_slot(instance.appointment_date, calendar_id=instance.attorney_calendar_id)
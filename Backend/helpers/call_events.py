@@ -0,0 +1,73 @@
+import asyncio
+import itertools
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set
+from config.settings import settings
+from helpers.voice_agent import CallState, VoiceAgent, transition_hooks
+
+class Subscription:
+
+    def __init__(self, call_id: Optional[int], queue_size: int):
+        self.call_id = call_id
+        self.queue: "asyncio.Queue[Dict]" = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, event: Dict):
+        # A slow dashboard never holds up the call: when its queue is full the
+        # oldest event is dropped. Events carry a sequence number, so the
+        # client can see the gap and re-read the call if it needs to.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+class CallEventHub:
+    # In-process fan-out of call state changes to push subscribers.
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[Optional[int], Set[Subscription]] = {}
+        self._sequence = itertools.count(1)
+
+    def subscribe(self, call_id: Optional[int] = None) -> Subscription:
+        # call_id=None receives events for every call.
+        subscription = Subscription(call_id, self.queue_size)
+        self._subscribers.setdefault(call_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.call_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.call_id]
+
+    def publish(self, event: Dict):
+        event = dict(event, seq=next(self._sequence))
+        for key in (event.get("call_id"), None):
+            for subscription in self._subscribers.get(key, ()):
+                subscription.offer(event)
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+call_events = CallEventHub(queue_size=settings.CALL_EVENTS_QUEUE_SIZE)
+
+def call_state_event(agent: VoiceAgent, old_state: Optional[CallState] = None, new_state: Optional[CallState] = None) -> Dict:
+    # Published after the turn's flush, when the agent may already have
+    # moved past new_state within the same turn.
+    call = agent.intake_call
+    return {
+        "call_id": call.id,
+        "twilio_call_sid": call.twilio_call_sid,
+        "previous_state": old_state.value if old_state else None,
+        "current_state": (new_state or agent.current_state).value,
+        "call_status": call.call_status,
+        "practice_area": call.practice_area,
+        "at": datetime.now(timezone.utc).isoformat(),
+    }
+
+def _publish_transition(agent: VoiceAgent, old_state: CallState, new_state: CallState):
+    call_events.publish(call_state_event(agent, old_state, new_state))
+
+transition_hooks.append(_publish_transition)
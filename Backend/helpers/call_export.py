@@ -0,0 +1,189 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from typing import AsyncIterator, Dict, List, Optional
+from helpers.answer_normalizer import QUESTIONS_BY_KEY
+from models.appointment import Appointment
+from models.case_question import CaseQuestion
+from models.intake_call import IntakeCall
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# One row per call. Answers are pivoted into one column per question key,
+# so every format has the same fixed set of columns.
+COLUMN_TYPES: Dict[str, str] = {
+    "call_id": "int",
+    "twilio_call_sid": "str",
+    "practice_area": "str",
+    "call_status": "str",
+    "current_state": "str",
+    "consent_to_book": "bool",
+    "created_at": "timestamp",
+    "caller_name": "str",
+    "caller_email": "str",
+    "caller_phone": "str",
+    "appointment_id": "int",
+    "appointment_date": "timestamp",
+    "appointment_time": "str",
+    "booking_status": "str",
+    "confirmation_email_sent": "bool",
+    **{key: "str" for key in QUESTIONS_BY_KEY},
+}
+EXPORT_COLUMNS = list(COLUMN_TYPES)
+
+_CALL_FIELDS = dict(
+    call_id="id",
+    twilio_call_sid="twilio_call_sid",
+    practice_area="practice_area",
+    call_status="call_status",
+    current_state="current_state",
+    consent_to_book="consent_to_book",
+    created_at="created_at",
+    caller_name="caller__full_name",
+    caller_email="caller__email",
+    caller_phone="caller__phone",
+)
+_APPOINTMENT_FIELDS = dict(
+    call_id="intake_call_id",
+    appointment_id="id",
+    appointment_date="appointment_date",
+    appointment_time="appointment_time",
+    booking_status="booking_status",
+    confirmation_email_sent="confirmation_email_sent",
+)
+
+async def export_rows(
+    practice_area: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    batch_size: int = 1000
+) -> AsyncIterator[List[Dict]]:
+    # Yields the export a chunk of calls at a time, keyset paged by id, so
+    # memory stays flat however many calls match. Each chunk is three
+    # queries: the calls with their callers joined in, then the answers and
+    # the appointments for just those calls.
+    last_id = 0
+    while True:
+        query = IntakeCall.filter(id__gt=last_id)
+        if practice_area:
+            query = query.filter(practice_area=practice_area)
+        if start_date:
+            query = query.filter(created_at__gte=start_date)
+        if end_date:
+            query = query.filter(created_at__lt=end_date)
+        calls = await query.order_by("id").limit(batch_size).values(**_CALL_FIELDS)
+        if not calls:
+            break
+
+        call_ids = [call["call_id"] for call in calls]
+        answers = await CaseQuestion.filter(intake_call_id__in=call_ids).values_list("intake_call_id", "question_key", "answer")
+        appointments = await Appointment.filter(intake_call_id__in=call_ids).order_by("id").values(**_APPOINTMENT_FIELDS)
+
+        rows = {call["call_id"]: dict.fromkeys(EXPORT_COLUMNS, None) | call for call in calls}
+        for call_id, question_key, answer in answers:
+            if question_key in QUESTIONS_BY_KEY:
+                rows[call_id][question_key] = answer
+        for appointment in appointments:  # the latest appointment wins
+            appointment_time = appointment["appointment_time"]
+            rows[appointment["call_id"]].update(
+                appointment,
+                appointment_time=appointment_time.isoformat() if appointment_time else None
+            )
+
+        yield list(rows.values())
+        last_id = call_ids[-1]
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+def _json_default(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+async def _csv_stream(chunks: AsyncIterator[List[Dict]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in chunks:
+        writer.writerows([_text(row[column]) for column in EXPORT_COLUMNS] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+async def _ndjson_stream(chunks: AsyncIterator[List[Dict]]) -> AsyncIterator[bytes]:
+    async for rows in chunks:
+        yield "".join(json.dumps(row, default=_json_default) + "\n" for row in rows).encode()
+
+class _ParquetSink(io.RawIOBase):
+    # Write-only file that hands back what was written since the last drain.
+    # tell() keeps counting from the start of the file, which the footer's
+    # row group offsets depend on.
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._written += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._written
+
+    def drain(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+def _parquet_schema(pa):
+    types = {
+        "int": pa.int64(),
+        "str": pa.string(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(column, types[kind]) for column, kind in COLUMN_TYPES.items()])
+
+async def _parquet_stream(chunks: AsyncIterator[List[Dict]], pa, pq) -> AsyncIterator[bytes]:
+    # One row group per chunk; the footer goes out when the writer closes.
+    schema = _parquet_schema(pa)
+    sink = _ParquetSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for rows in chunks:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+def export_stream(export_format: str, chunks: AsyncIterator[List[Dict]]) -> AsyncIterator[bytes]:
+    # Raises before anything is streamed, so callers can still report an
+    # unknown format or a missing Parquet dependency as an error.
+    if export_format == "csv":
+        return _csv_stream(chunks)
+    if export_format == "ndjson":
+        return _ndjson_stream(chunks)
+    if export_format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export requires pyarrow to be installed")
+        return _parquet_stream(chunks, pa, pq)
+    raise ValueError(f"Unknown export format: {export_format}")
@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from config.settings import settings
+
+class CallSessionCache:
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 1800):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, call_sid: str) -> Optional[Any]:
+        entry = self._entries.get(call_sid)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, agent = entry
+        if expires_at <= time.monotonic():
+            del self._entries[call_sid]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(call_sid)
+        self.hits += 1
+        return agent
+
+    def put(self, call_sid: str, agent: Any):
+        if not call_sid:
+            return
+
+        self._entries[call_sid] = (time.monotonic() + self.ttl_seconds, agent)
+        self._entries.move_to_end(call_sid)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def evict(self, call_sid: str):
+        self._entries.pop(call_sid, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+call_sessions = CallSessionCache(
+    max_size=settings.CALL_SESSION_MAX_SIZE,
+    ttl_seconds=settings.CALL_SESSION_TTL_SECONDS
+)
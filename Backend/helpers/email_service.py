@@ -1,86 +1,51 @@
+import asyncio
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Set
+from tortoise import timezone
 from config.settings import settings
 from models.appointment import Appointment
 from models.caller import Caller
+from helpers.email_templates import RenderedEmail, email_templates
+from helpers.smtp_pool import smtp_pool
+from helpers.stats import dashboard_stats
 
-async def send_confirmation_email(appointment: Appointment) -> bool:
+_detached_sends: Set[asyncio.Task] = set()
+
+def _sender():
     sender_email = settings.SENDER_EMAIL or settings.GMAIL_USER
     sender_password = settings.SENDER_PASSWORD or settings.GMAIL_PASSWORD
     sender_name = settings.SENDER_NAME or "Legal Intake Team"
+    return sender_email, sender_password, sender_name
+
+def build_confirmation_email(appointment: Appointment, caller: Caller) -> RenderedEmail:
+    sender_email, _, sender_name = _sender()
+    template = email_templates.get("confirmation", appointment.practice_area)
+    appointment_datetime = appointment.appointment_date
+    return template.render((sender_name, sender_email), caller.email, {
+        "caller_name": caller.full_name,
+        "practice_area": appointment.practice_area,
+        "date": appointment_datetime.strftime("%B %d, %Y"),
+        "time": appointment_datetime.strftime("%I:%M %p"),
+        "signature": sender_name
+    })
+
+async def send_confirmation_email(appointment: Appointment) -> bool:
+    sender_email, sender_password, _ = _sender()
     
     if not sender_email or not sender_password:
         return False
     
     try:
         caller = await Caller.get(id=appointment.caller_id)
+        rendered = build_confirmation_email(appointment, caller)
+        await smtp_pool.send_raw(rendered.sender, rendered.recipients, rendered.data)
         
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = f"Appointment Confirmation - {appointment.practice_area}"
-        msg['From'] = f"{sender_name} <{sender_email}>"
-        msg['To'] = caller.email
-        
-        appointment_datetime = appointment.appointment_date
-        formatted_date = appointment_datetime.strftime("%B %d, %Y")
-        formatted_time = appointment_datetime.strftime("%I:%M %p")
-        
-        html_body = f"""
-        <html>
-          <body>
-            <h2>Appointment Confirmation</h2>
-            <p>Dear {caller.full_name},</p>
-            <p>This email confirms your appointment for a {appointment.practice_area} consultation.</p>
-            <h3>Appointment Details:</h3>
-            <ul>
-              <li><strong>Date:</strong> {formatted_date}</li>
-              <li><strong>Time:</strong> {formatted_time}</li>
-              <li><strong>Practice Area:</strong> {appointment.practice_area}</li>
-            </ul>
-            <h3>Next Steps:</h3>
-            <p>Please arrive 10 minutes early for your appointment. If you need to reschedule or cancel, please contact us at least 24 hours in advance.</p>
-            <p>If you have any questions, please don't hesitate to reach out.</p>
-            <p>Best regards,<br>Legal Intake Team</p>
-          </body>
-        </html>
-        """
-        
-        text_body = f"""
-        Appointment Confirmation
-        
-        Dear {caller.full_name},
-        
-        This email confirms your appointment for a {appointment.practice_area} consultation.
-        
-        Appointment Details:
-        - Date: {formatted_date}
-        - Time: {formatted_time}
-        - Practice Area: {appointment.practice_area}
-        
-        Next Steps:
-        Please arrive 10 minutes early for your appointment. If you need to reschedule or cancel, please contact us at least 24 hours in advance.
-        
-        If you have any questions, please don't hesitate to reach out.
-        
-        Best regards,
-        Legal Intake Team
-        """
-        
-        part1 = MIMEText(text_body, 'plain')
-        part2 = MIMEText(html_body, 'html')
-        
-        msg.attach(part1)
-        msg.attach(part2)
-        
-        with smtplib.SMTP('smtp.gmail.com', 587) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
-        
-        appointment.confirmation_email_sent = True
-        await appointment.save()
+        if not appointment.confirmation_email_sent:
+            appointment.confirmation_email_sent = True
+            marked = await Appointment.filter(id=appointment.id, confirmation_email_sent=False).update(confirmation_email_sent=True, updated_at=timezone.now())
+            if marked and appointment.booking_status != "cancelled":
+                dashboard_stats.incr("emails.pending", -1)
         
         return True
         
@@ -93,3 +58,61 @@ async def send_confirmation_email(appointment: Appointment) -> bool:
         traceback.print_exc()
         return False
 
+
+async def resend_confirmation_emails(
+    appointment_ids: Optional[List[int]] = None,
+    practice_area: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> AsyncIterator[Dict]:
+    sender_email, sender_password, _ = _sender()
+    if not sender_email or not sender_password:
+        yield {"done": True, "error": "Email sender not configured", "sent": 0, "failed": 0}
+        return
+    
+    query = Appointment.filter(confirmation_email_sent=False).exclude(booking_status="cancelled")
+    if appointment_ids:
+        query = query.filter(id__in=appointment_ids)
+    if practice_area:
+        query = query.filter(practice_area=practice_area)
+    if start_date:
+        query = query.filter(appointment_date__gte=start_date)
+    if end_date:
+        query = query.filter(appointment_date__lt=end_date)
+    appointments = await query.order_by("appointment_date").prefetch_related("caller")
+    
+    async def send(appointment: Appointment) -> Dict:
+        try:
+            rendered = build_confirmation_email(appointment, appointment.caller)
+            await smtp_pool.send_raw(rendered.sender, rendered.recipients, rendered.data)
+            # Recorded as soon as it is delivered, so the next resend skips
+            # it even if this stream's consumer has gone away. Only the send
+            # that flips the flag counts it; the outbox may have got there first.
+            marked = await Appointment.filter(id=appointment.id, confirmation_email_sent=False).update(confirmation_email_sent=True, updated_at=timezone.now())
+            if marked:
+                dashboard_stats.incr("emails.pending", -1)
+            return {"appointment_id": appointment.id, "status": "sent"}
+        except Exception as e:
+            return {"appointment_id": appointment.id, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    
+    # The pool bounds how many sends are on the wire; each connection is
+    # logged in once and reused for the whole batch.
+    tasks = [asyncio.create_task(send(appointment)) for appointment in appointments]
+    sent_ids = []
+    failed = 0
+    try:
+        for completed in asyncio.as_completed(tasks):
+            result = await completed
+            if result["status"] == "sent":
+                sent_ids.append(result["appointment_id"])
+            else:
+                failed += 1
+            yield dict(result, progress=len(sent_ids) + failed, total=len(appointments))
+    finally:
+        # When the consumer goes away mid-stream the remaining sends still
+        # finish and mark themselves; keep them referenced until they do.
+        for task in tasks:
+            if not task.done():
+                _detached_sends.add(task)
+                task.add_done_callback(_detached_sends.discard)
+    yield {"done": True, "sent": len(sent_ids), "failed": failed, "total": len(appointments)}
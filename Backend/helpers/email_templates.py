@@ -0,0 +1,131 @@
+import html
+import os
+import re
+import time
+from dataclasses import dataclass
+from email import policy
+from email.charset import Charset
+from email.header import Header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr
+from string import Template
+from typing import Dict, List, Mapping, Optional, Tuple
+from config.settings import settings
+
+TEMPLATE_PARTS = ("subject", "txt", "html")
+
+@dataclass
+class RenderedEmail:
+    sender: str
+    recipients: List[str]
+    data: bytes
+
+def practice_area_slug(practice_area: Optional[str]) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", (practice_area or "").lower()).strip("_")
+
+def _encode_header(value: str) -> str:
+    return value if value.isascii() else Header(value, "utf-8").encode()
+
+class EmailTemplate:
+    # The whole wire message (headers, boundary, both parts) is laid out once
+    # here; rendering is a single substitution plus encoding to bytes. Fields
+    # in the HTML part are escaped, fields in the text part are not.
+
+    def __init__(self, subject: str, text: str, html_body: str):
+        self.subject = Template(subject.strip())
+        html_body = Template.pattern.sub(self._prefix_html_field, html_body)
+
+        charset = Charset("utf-8")
+        charset.body_encoding = None
+        message = MIMEMultipart("alternative")
+        message["From"] = "${_from}"
+        message["To"] = "${_to}"
+        message["Subject"] = "${_subject}"
+        for body, subtype in ((text, "plain"), (html_body, "html")):
+            part = MIMEText(body, subtype, charset)
+            part.replace_header("Content-Transfer-Encoding", "8bit")
+            message.attach(part)
+        self.message = Template(message.as_string(policy=policy.SMTP))
+
+    @staticmethod
+    def _prefix_html_field(match: re.Match) -> str:
+        name = match.group("named") or match.group("braced")
+        return "${html_%s}" % name if name else match.group(0)
+
+    def render(self, sender: Tuple[str, str], recipient: str, fields: Mapping[str, str]) -> RenderedEmail:
+        values = {name: str(value) for name, value in fields.items()}
+        values.update({f"html_{name}": html.escape(value) for name, value in values.items()})
+        values["_from"] = _encode_header(formataddr(sender))
+        values["_to"] = recipient
+        values["_subject"] = _encode_header(self.subject.substitute(values))
+        return RenderedEmail(
+            sender=sender[1],
+            recipients=[recipient],
+            data=self.message.substitute(values).encode("utf-8")
+        )
+
+class EmailTemplateRegistry:
+    # Layout: <directory>/<tenant>/<name>[.<practice_area_slug>].{subject,txt,html}
+    # Lookup falls back from the tenant to "default" and from the practice
+    # area variant to the plain one, part by part.
+
+    def __init__(self, directory: str, tenant: str = "default", reload_seconds: float = 2):
+        self.directory = directory
+        self.tenant = tenant
+        self.reload_seconds = reload_seconds
+        self._compiled: Dict[Tuple[str, str], Tuple[EmailTemplate, Dict[str, float]]] = {}
+        self._checked_at: Dict[Tuple[str, str], float] = {}
+
+    def load(self):
+        self._compiled.clear()
+        self._checked_at.clear()
+        names = set()
+        for tenant in {self.tenant, "default"}:
+            folder = os.path.join(self.directory, tenant)
+            if os.path.isdir(folder):
+                names.update(file_name.split(".")[0] for file_name in os.listdir(folder))
+        for name in names:
+            self.get(name)
+
+    def get(self, name: str, practice_area: Optional[str] = None) -> EmailTemplate:
+        key = (name, practice_area_slug(practice_area))
+        entry = self._compiled.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if not self.reload_seconds or now - self._checked_at[key] < self.reload_seconds:
+                return entry[0]
+            self._checked_at[key] = now
+            if self._resolve(*key) == entry[1]:
+                return entry[0]
+
+        mtimes = self._resolve(*key)
+        contents = {}
+        for path in mtimes:
+            with open(path, encoding="utf-8") as f:
+                contents[path.rsplit(".", 1)[1]] = f.read()
+        missing = [part for part in TEMPLATE_PARTS if part not in contents]
+        if missing:
+            raise FileNotFoundError(f"Email template '{name}' has no {', '.join(missing)} part")
+
+        template = EmailTemplate(contents["subject"], contents["txt"], contents["html"])
+        self._compiled[key] = (template, mtimes)
+        self._checked_at[key] = now
+        return template
+
+    def _resolve(self, name: str, practice_slug: str) -> Dict[str, float]:
+        stems = [f"{name}.{practice_slug}", name] if practice_slug else [name]
+        tenants = dict.fromkeys([self.tenant, "default"])
+        found = {}
+        for part in TEMPLATE_PARTS:
+            candidates = [os.path.join(self.directory, tenant, f"{stem}.{part}") for tenant in tenants for stem in stems]
+            path = next((candidate for candidate in candidates if os.path.exists(candidate)), None)
+            if path:
+                found[path] = os.path.getmtime(path)
+        return found
+
+email_templates = EmailTemplateRegistry(
+    settings.EMAIL_TEMPLATES_DIR,
+    tenant=settings.EMAIL_TENANT,
+    reload_seconds=settings.EMAIL_TEMPLATES_RELOAD_SECONDS
+)
@@ -0,0 +1,129 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+YES = "yes"
+NO = "no"
+UNSURE = "unsure"
+TRANSFER = "transfer"
+MESSAGE = "message"
+LEMON_LAW = "Lemon Law"
+PERSONAL_INJURY = "Personal Injury"
+
+# Phrases are matched on whole words, so "know" never counts as "no" and
+# "book" never counts as "ok".
+LEXICON: Dict[str, List[str]] = {
+    YES: [
+        "yes", "yeah", "yep", "yup", "sure", "ok", "okay", "correct", "right",
+        "confirm", "absolutely", "definitely", "that's right", "that is right",
+        "sounds good", "of course",
+    ],
+    NO: [
+        "no", "nope", "nah", "wrong", "incorrect", "not now", "later",
+        "no thanks", "no thank you",
+    ],
+    UNSURE: [
+        "unsure", "not sure", "don't know", "do not know", "no idea",
+        "can't remember", "don't remember", "not certain",
+    ],
+    TRANSFER: [
+        "transfer", "speak", "talk", "human", "person", "representative",
+        "agent", "operator", "real person",
+    ],
+    MESSAGE: [
+        "message", "leave", "voicemail", "call back", "call me back", "callback",
+    ],
+    LEMON_LAW: ["lemon", "lemon law"],
+    PERSONAL_INJURY: [
+        "personal", "personal injury", "injury", "injuries", "injured",
+        "accident", "hurt",
+    ],
+}
+
+# A negator right before a phrase scores the opposite intent ("not correct").
+_NEGATORS = frozenset({"not", "isn't", "don't", "doesn't", "wasn't", "never"})
+_OPPOSITES = {YES: NO}
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Per-state vocabularies: the intents a prompt listens for, plus phrases that
+# only carry that meaning in that prompt (e.g. "car" after we asked whether
+# it is about a vehicle defect).
+VOCABULARIES: Dict[str, Tuple[Tuple[str, ...], Dict[str, List[str]]]] = {
+    "confirm": ((YES, NO), {}),
+    "consent": ((YES, NO), {YES: ["go ahead", "proceed", "fine", "please do"]}),
+    "practice_area": ((LEMON_LAW, PERSONAL_INJURY), {}),
+    "practice_area_clarify": (
+        (LEMON_LAW, PERSONAL_INJURY),
+        {LEMON_LAW: ["vehicle", "car", "truck", "defect", "defects", "defective"]},
+    ),
+    "transfer": ((TRANSFER, MESSAGE), {}),
+    "answer_yes_no": (
+        (YES, NO, UNSURE),
+        {
+            YES: ["i did", "i do", "i have", "we do", "we did", "it was", "there was", "they did"],
+            NO: ["didn't", "did not", "don't", "do not", "wasn't", "was not", "haven't", "have not", "none", "never"],
+        },
+    ),
+}
+
+@dataclass
+class IntentResult:
+    intent: Optional[str]
+    scores: Dict[str, float] = field(default_factory=dict)
+
+class IntentMatcher:
+    # Phrases are indexed by their first word; a turn is scanned once, taking
+    # the longest phrase that starts at each word.
+
+    def __init__(self, lexicon: Dict[str, Iterable[str]]):
+        self.intents = tuple(lexicon)
+        self._index: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        for intent, phrases in lexicon.items():
+            for phrase in phrases:
+                words = tuple(_WORD.findall(phrase.lower()))
+                if words:
+                    self._index.setdefault(words[0], []).append((words, intent))
+        for candidates in self._index.values():
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+
+    def scores(self, text: str) -> Dict[str, float]:
+        words = _WORD.findall(text.lower()) if text else []
+        scores = dict.fromkeys(self.intents, 0.0)
+        i = 0
+        while i < len(words):
+            for phrase, intent in self._index.get(words[i], ()):
+                if len(phrase) == 1 or tuple(words[i:i + len(phrase)]) == phrase:
+                    if len(phrase) > 1 and i + len(phrase) < len(words) and words[i + len(phrase)] in _NEGATORS:
+                        # "I do not know", "it was not": the negated phrase
+                        # starting at the next word is the answer.
+                        continue
+                    if i and words[i - 1] in _NEGATORS:
+                        intent = _OPPOSITES.get(intent, intent)
+                    scores[intent] = scores.get(intent, 0.0) + len(phrase)
+                    i += len(phrase)
+                    break
+            else:
+                i += 1
+        return scores
+
+    def classify(self, text: str) -> IntentResult:
+        scores = self.scores(text)
+        best = max(scores.values(), default=0.0)
+        winners = [intent for intent, score in scores.items() if score == best]
+        # Nothing matched, or the caller said both ("yes... no") - ask again.
+        intent = winners[0] if best > 0 and len(winners) == 1 else None
+        return IntentResult(intent=intent, scores=scores)
+
+def _build_matchers() -> Dict[str, IntentMatcher]:
+    matchers = {}
+    for name, (intents, extra) in VOCABULARIES.items():
+        matchers[name] = IntentMatcher({
+            intent: LEXICON[intent] + extra.get(intent, []) for intent in intents
+        })
+    return matchers
+
+intent_matchers = _build_matchers()
+
+def classify(text: str, vocabulary: str) -> IntentResult:
+    return intent_matchers[vocabulary].classify(text)
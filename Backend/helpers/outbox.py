@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import random
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+from tortoise import timezone
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from config.settings import settings
+from models.appointment import Appointment
+from models.calendar_event import CalendarEvent
+from models.outbox_message import OutboxMessage
+from helpers.calendar_service import calendar_service
+from helpers.email_service import send_confirmation_email
+from helpers.slot_engine import SLOT_INTERVAL_MINUTES
+
+MAX_BACKOFF_SECONDS = 900
+
+class OutboxError(Exception):
+    pass
+
+async def enqueue_booking_side_effects(appointment: Appointment, using_db=None):
+    # Written in the booking transaction; the keys make a second enqueue for
+    # the same appointment fail instead of sending twice.
+    now = timezone.now()
+    calendar_key = f"calendar_event:appointment:{appointment.id}"
+    await OutboxMessage.bulk_create([
+        OutboxMessage(
+            kind="calendar_event",
+            payload={
+                "appointment_id": appointment.id,
+                "event_id": hashlib.sha1(calendar_key.encode()).hexdigest()
+            },
+            idempotency_key=calendar_key,
+            available_at=now
+        ),
+        OutboxMessage(
+            kind="confirmation_email",
+            payload={"appointment_id": appointment.id},
+            idempotency_key=f"confirmation_email:appointment:{appointment.id}",
+            available_at=now
+        )
+    ], using_db=using_db)
+
+class OutboxWorker:
+    # A message is claimed by pushing available_at past the lease; a worker
+    # that dies mid-message simply lets the lease run out and someone else
+    # picks it up again.
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[Dict], Awaitable[None]]],
+        concurrency: int = 4,
+        poll_interval: float = 2,
+        max_attempts: int = 8,
+        retry_base_seconds: float = 5,
+        lease_seconds: float = 60
+    ):
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.lease_seconds = lease_seconds
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self):
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                message = await self._claim()
+                if message is not None:
+                    await self.process(message)
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                import traceback
+                traceback.print_exc()
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _claim(self) -> Optional[OutboxMessage]:
+        now = timezone.now()
+        candidates = await OutboxMessage.filter(
+            status="pending", available_at__lte=now
+        ).order_by("available_at").limit(self.concurrency).values_list("id", flat=True)
+
+        for message_id in candidates:
+            claimed = await OutboxMessage.filter(
+                id=message_id, status="pending", available_at__lte=now
+            ).update(
+                available_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=F("attempts") + 1
+            )
+            if claimed:
+                return await OutboxMessage.get(id=message_id)
+        return None
+
+    async def process(self, message: OutboxMessage):
+        handler = self.handlers.get(message.kind)
+        try:
+            if handler is None:
+                raise OutboxError(f"No handler for outbox message kind '{message.kind}'")
+            await handler(message.payload)
+        except Exception as e:
+            message.last_error = f"{type(e).__name__}: {e}"
+            if message.attempts >= self.max_attempts:
+                message.status = "dead"
+                import traceback
+                traceback.print_exc()
+            else:
+                delay = min(self.retry_base_seconds * 2 ** (message.attempts - 1), MAX_BACKOFF_SECONDS)
+                message.available_at = timezone.now() + timedelta(seconds=delay * random.uniform(0.8, 1.2))
+            await message.save(update_fields=["status", "available_at", "last_error", "updated_at"])
+        else:
+            message.status = "done"
+            message.last_error = None
+            await message.save(update_fields=["status", "last_error", "updated_at"])
+
+async def _create_calendar_event(payload: Dict):
+    appointment = await Appointment.get(id=payload["appointment_id"]).prefetch_related("caller")
+    if appointment.calendar_event_id:
+        return
+
+    caller = appointment.caller
+    start_time = appointment.appointment_date
+    end_time = start_time + timedelta(minutes=SLOT_INTERVAL_MINUTES)
+    event_data = {
+        "event_id": payload.get("event_id"),
+        "title": f"{appointment.practice_area} Consultation - {caller.full_name}",
+        "description": f"Consultation for {appointment.practice_area} case.",
+        "start_time": start_time,
+        "end_time": end_time,
+        "attendees": [{"email": caller.email}],
+        "calendar_id": appointment.attorney_calendar_id
+    }
+    google_event_id = await calendar_service.insert_calendar_event(event_data)
+
+    async with in_transaction():
+        appointment.calendar_event_id = google_event_id
+        await appointment.save(update_fields=["calendar_event_id", "updated_at"])
+        await CalendarEvent.get_or_create(
+            google_event_id=google_event_id,
+            defaults={
+                "appointment": appointment,
+                "event_title": event_data["title"],
+                "event_description": event_data["description"],
+                "start_time": start_time,
+                "end_time": end_time
+            }
+        )
+
+async def _send_confirmation_email(payload: Dict):
+    appointment = await Appointment.get(id=payload["appointment_id"])
+    if appointment.confirmation_email_sent:
+        return
+    if not await send_confirmation_email(appointment):
+        raise OutboxError("Confirmation email was not sent")
+
+OUTBOX_HANDLERS: Dict[str, Callable[[Dict], Awaitable[None]]] = {
+    "calendar_event": _create_calendar_event,
+    "confirmation_email": _send_confirmation_email,
+}
+
+outbox_worker = OutboxWorker(
+    OUTBOX_HANDLERS,
+    concurrency=settings.OUTBOX_WORKERS,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retry_base_seconds=settings.OUTBOX_RETRY_BASE_SECONDS,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS
+)
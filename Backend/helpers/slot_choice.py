@@ -0,0 +1,112 @@
+import re
+from datetime import datetime, timedelta
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Tuple
+from helpers.answer_normalizer import MONTHS, SpokenOrdinal, read_spoken_numbers
+
+# (weekday, (month, day), hour on a 12-hour clock, minute); None means "not said".
+SlotKey = Tuple[Optional[int], Optional[Tuple[int, int]], Optional[int], Optional[int]]
+
+_WEEKDAYS = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6,
+}
+_OPTION_WORDS = frozenset({"option", "number", "choice", "slot"})
+_LAST_WORDS = frozenset({"last", "final"})
+_TIME_WORDS = frozenset({"am", "pm", "o'clock", "oclock"})
+# Transcripts spell the meridiem "a.m."; the tokenizer would split it into "a" and "m".
+_DOTTED_MERIDIEM = re.compile(r"\b([ap])\.\s*m\b\.?", re.IGNORECASE)
+
+def parse_slot_choice(text: str, option_count: int, today: Optional[datetime] = None) -> Tuple[Optional[int], Optional[SlotKey]]:
+    # Returns (option number, None) or (None, key). Priority: "option N",
+    # ordinals ("the second one"), then day/time cues ("Tuesday at 2"), then
+    # a bare number, which is read as a clock hour ("twelve") when it is not
+    # an option number.
+    text = _DOTTED_MERIDIEM.sub(lambda match: f" {match.group(1)}m ", text or "")
+    tokens = [token for token in read_spoken_numbers(text) if token not in ("the", "of", "on")]
+    weekday = day = hour = minute = None
+    ordinal = bare = None
+
+    for i, token in enumerate(tokens):
+        following = tokens[i + 1] if i + 1 < len(tokens) else None
+        preceding = tokens[i - 1] if i else None
+
+        if isinstance(token, int):
+            if preceding in _OPTION_WORDS:
+                return _option(int(token), option_count), None
+            if isinstance(token, SpokenOrdinal):
+                if following not in MONTHS and preceding not in MONTHS:
+                    ordinal = ordinal or int(token)
+            elif preceding == "at" or following in _TIME_WORDS or (isinstance(following, int) and following < 60 and 1 <= token <= 12):
+                if hour is None and 1 <= token <= 12:
+                    hour = token % 12
+                    if isinstance(following, int) and not isinstance(following, SpokenOrdinal) and following < 60:
+                        minute = int(following)
+                    elif following in ("o'clock", "oclock"):
+                        minute = 0
+            elif bare is None and preceding not in MONTHS and following not in MONTHS:
+                bare = int(token)
+        elif token in _WEEKDAYS:
+            weekday = _WEEKDAYS[token]
+        elif token in MONTHS:
+            for candidate in (following, preceding):
+                if isinstance(candidate, int) and 1 <= candidate <= 31:
+                    day = (MONTHS[token], int(candidate))
+                    break
+        elif token in ("today", "tomorrow"):
+            value = (today or datetime.now()) + timedelta(days=1 if token == "tomorrow" else 0)
+            day = (value.month, value.day)
+        elif token == "noon":
+            hour, minute = 0, 0
+        elif token in _LAST_WORDS:
+            return _option(option_count, option_count), None
+
+    if ordinal is not None:
+        return _option(ordinal, option_count), None
+    if weekday is not None or day is not None or hour is not None:
+        return None, (weekday, day, hour, minute)
+    if bare is not None:
+        option = _option(bare, option_count)
+        if option is None and 1 <= bare <= 12:
+            return None, (None, None, bare % 12, None)
+        return option, None
+    return None, None
+
+def _option(number: int, option_count: int) -> Optional[int]:
+    return number if 1 <= number <= option_count else None
+
+class SlotChoices:
+    # The slots read to the caller, indexed under every combination of the
+    # cues they could be picked by, so a reply resolves with one dict lookup.
+    # Earlier slots win when several match ("Tuesday" -> the next Tuesday).
+
+    def __init__(self, slots: Iterable[Dict]):
+        self.slots: List[Dict] = list(slots)
+        self._by_key: Dict[SlotKey, int] = {}
+        for index, slot in enumerate(self.slots):
+            value = datetime.fromisoformat(slot["datetime"])
+            for key in product(
+                (None, value.weekday()),
+                (None, (value.month, value.day)),
+                (None, value.hour % 12),
+                (None, value.minute)
+            ):
+                if key[3] is not None and key[2] is None:
+                    continue
+                self._by_key.setdefault(key, index)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def choose(self, speech: str = "", digits: str = "") -> Optional[Dict]:
+        if digits:
+            option = _option(int(digits), len(self.slots)) if digits.isdigit() else None
+            return self.slots[option - 1] if option else None
+
+        option, key = parse_slot_choice(speech, len(self.slots))
+        if option:
+            return self.slots[option - 1]
+        if key is not None:
+            index = self._by_key.get(key)
+            return self.slots[index] if index is not None else None
+        return None
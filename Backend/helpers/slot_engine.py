@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+SLOT_INTERVAL_MINUTES = 30
+
+Interval = Tuple[datetime, datetime]
+
+def parse_busy_intervals(busy_periods: Iterable[Dict]) -> List[Interval]:
+    intervals = []
+    for busy in busy_periods:
+        busy_start = _parse_timestamp(busy['start'])
+        busy_end = _parse_timestamp(busy['end'])
+        if busy_end > busy_start:
+            intervals.append((busy_start, busy_end))
+    return merge_intervals(intervals)
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def align_to_slot(value: datetime, interval_minutes: int = SLOT_INTERVAL_MINUTES) -> datetime:
+    aligned = value.replace(second=0, microsecond=0)
+    remainder = (aligned.hour * 60 + aligned.minute) % interval_minutes
+    if remainder or aligned != value:
+        aligned += timedelta(minutes=interval_minutes - remainder)
+    return aligned
+
+def iter_free_slots(
+    start: datetime,
+    end: datetime,
+    busy: List[Interval],
+    duration_minutes: int = 30,
+    interval_minutes: int = SLOT_INTERVAL_MINUTES,
+    business_start: int = 9,
+    business_end: int = 17,
+    buffer_minutes: int = 0
+) -> Iterator[datetime]:
+    # busy must be sorted and merged (see parse_busy_intervals); each candidate
+    # only looks at the first interval that has not ended yet, so a full sweep
+    # costs O(candidates + busy intervals).
+    duration = timedelta(minutes=duration_minutes)
+    step = timedelta(minutes=interval_minutes)
+    buffer = timedelta(minutes=buffer_minutes)
+    busy_index = 0
+
+    current = align_to_slot(start, interval_minutes)
+    while current < end:
+        day_open = current.replace(hour=business_start, minute=0, second=0, microsecond=0)
+        day_close = current.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(hours=business_end)
+
+        if current < day_open:
+            current = day_open
+        if current + duration > day_close:
+            current = day_open + timedelta(days=1)
+            continue
+
+        slot_end = current + duration
+        while busy_index < len(busy) and busy[busy_index][1] + buffer <= current:
+            busy_index += 1
+
+        if busy_index < len(busy) and busy[busy_index][0] - buffer < slot_end:
+            current = align_to_slot(busy[busy_index][1] + buffer, interval_minutes)
+            continue
+
+        if slot_end > end:
+            return
+
+        yield current
+        current += step
+
+def format_slot(value: datetime) -> Dict:
+    return {
+        "date": value.strftime("%Y-%m-%d"),
+        "time": value.strftime("%H:%M"),
+        "datetime": value.isoformat(),
+        "formatted": value.strftime("%B %d, %Y at %I:%M %p")
+    }
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def expand_intervals(intervals: Iterable[Interval], buffer_minutes: int) -> List[Interval]:
+    if not buffer_minutes:
+        return list(intervals)
+    buffer = timedelta(minutes=buffer_minutes)
+    return merge_intervals((start - buffer, end + buffer) for start, end in intervals)
+
+def intersect_intervals(first: List[Interval], second: List[Interval]) -> List[Interval]:
+    result: List[Interval] = []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        if start < end:
+            result.append((start, end))
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+def iter_pool_openings(
+    start: datetime,
+    end: datetime,
+    busy_by_calendar: Dict[str, List[Interval]],
+    duration_minutes: int = 30,
+    interval_minutes: int = SLOT_INTERVAL_MINUTES,
+    business_start: int = 9,
+    business_end: int = 17,
+    buffer_minutes: int = 0
+) -> Iterator[Tuple[datetime, List[str]]]:
+    # A slot can only be open if it misses the intersection of everyone's
+    # busy time; each open slot comes with its free calendars in pool order.
+    if not busy_by_calendar:
+        return
+
+    padded = {
+        calendar_id: expand_intervals(intervals, buffer_minutes)
+        for calendar_id, intervals in busy_by_calendar.items()
+    }
+
+    all_busy = None
+    for intervals in padded.values():
+        all_busy = intervals if all_busy is None else intersect_intervals(all_busy, intervals)
+        if not all_busy:
+            break
+
+    duration = timedelta(minutes=duration_minutes)
+    pointers = dict.fromkeys(padded, 0)
+
+    for slot in iter_free_slots(
+        start, end, all_busy or [],
+        duration_minutes=duration_minutes,
+        interval_minutes=interval_minutes,
+        business_start=business_start,
+        business_end=business_end
+    ):
+        slot_end = slot + duration
+        free = []
+        for calendar_id, intervals in padded.items():
+            index = pointers[calendar_id]
+            while index < len(intervals) and intervals[index][1] <= slot:
+                index += 1
+            pointers[calendar_id] = index
+            if index >= len(intervals) or intervals[index][0] >= slot_end:
+                free.append(calendar_id)
+        # The intersection only rules slots out; staggered busy blocks can
+        # still leave nobody free for the whole slot.
+        if free:
+            yield slot, free
+
+def iter_pool_slots(
+    start: datetime,
+    end: datetime,
+    busy_by_calendar: Dict[str, List[Interval]],
+    **options
+) -> Iterator[Tuple[datetime, str]]:
+    # Each open slot goes to the first free calendar in pool order.
+    for slot, free in iter_pool_openings(start, end, busy_by_calendar, **options):
+        yield slot, free[0]
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from typing import Optional, Set, Tuple
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+from config.settings import settings
+from models.appointment import Appointment
+from models.slot_hold import SlotHold
+
+HeldSlot = Tuple[str, datetime]
+
+def _aware(value: datetime) -> datetime:
+    # Slots are naive UTC; compare against stored timestamps as aware values.
+    return value if timezone.is_aware(value) else timezone.make_aware(value, "UTC")
+
+class SlotHoldService:
+    # The unique (calendar_id, slot_start) row is the lock: whoever inserts it
+    # owns the slot until expires_at, and only the owner can turn it into an
+    # appointment.
+
+    def __init__(self, ttl_seconds: int = 180):
+        self.ttl_seconds = ttl_seconds
+
+    async def acquire(self, calendar_id: str, slot_start: datetime, call_sid: str) -> bool:
+        slot_start = _aware(slot_start)
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=self.ttl_seconds)
+
+        renewed = await SlotHold.filter(
+            calendar_id=calendar_id, slot_start=slot_start, call_sid=call_sid
+        ).update(expires_at=expires_at)
+        if renewed:
+            return True
+
+        await SlotHold.filter(calendar_id=calendar_id, slot_start=slot_start, expires_at__lte=now).delete()
+        try:
+            await SlotHold.create(
+                calendar_id=calendar_id,
+                slot_start=slot_start,
+                call_sid=call_sid,
+                expires_at=expires_at
+            )
+        except IntegrityError:
+            return False
+
+        if await self._is_booked(calendar_id, slot_start):
+            await self.release(call_sid)
+            return False
+
+        # A caller only ever holds the slot they picked last.
+        await SlotHold.filter(call_sid=call_sid).exclude(calendar_id=calendar_id, slot_start=slot_start).delete()
+        return True
+
+    async def release(self, call_sid: str):
+        await SlotHold.filter(call_sid=call_sid).delete()
+
+    async def get_hold(self, call_sid: str, slot_start: datetime) -> Optional[SlotHold]:
+        return await SlotHold.get_or_none(call_sid=call_sid, slot_start=_aware(slot_start))
+
+    async def held_slots(self, start: datetime, end: datetime, exclude_call_sid: Optional[str] = None) -> Set[HeldSlot]:
+        query = SlotHold.filter(slot_start__gte=_aware(start), slot_start__lt=_aware(end), expires_at__gt=timezone.now())
+        if exclude_call_sid:
+            query = query.exclude(call_sid=exclude_call_sid)
+        rows = await query.values_list("calendar_id", "slot_start")
+        return {(calendar_id, timezone.make_naive(_aware(slot_start), "UTC")) for calendar_id, slot_start in rows}
+
+    async def book(self, call_sid: str, calendar_id: str, slot_start: datetime, using_db=None, **appointment_fields) -> Optional[Appointment]:
+        # Runs on the caller's transaction when given one, so the claim, the
+        # appointment and whatever the caller writes next commit together.
+        if using_db is None:
+            async with in_transaction() as connection:
+                return await self.book(call_sid, calendar_id, slot_start, using_db=connection, **appointment_fields)
+
+        slot_start = _aware(slot_start)
+        # Deleting our own row is the claim: if the hold lapsed and someone
+        # else took the slot, the row is theirs and nothing matches.
+        claimed = await SlotHold.filter(
+            calendar_id=calendar_id, slot_start=slot_start, call_sid=call_sid
+        ).using_db(using_db).delete()
+        if not claimed:
+            return None
+        if await self._is_booked(calendar_id, slot_start, using_db):
+            return None
+
+        return await Appointment.create(
+            using_db=using_db,
+            appointment_date=slot_start,
+            appointment_time=slot_start.time(),
+            attorney_calendar_id=calendar_id,
+            **appointment_fields
+        )
+
+    async def _is_booked(self, calendar_id: str, slot_start: datetime, connection=None) -> bool:
+        return await Appointment.filter(
+            attorney_calendar_id=calendar_id, appointment_date=slot_start
+        ).exclude(booking_status="cancelled").using_db(connection).exists()
+
+slot_holds = SlotHoldService(ttl_seconds=settings.SLOT_HOLD_TTL_SECONDS)
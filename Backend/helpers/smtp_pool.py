@@ -0,0 +1,147 @@
+import asyncio
+import smtplib
+import time
+from email.message import Message
+from typing import Callable, List, Optional
+from config.settings import settings
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+class SMTPPool:
+    # smtplib is blocking, so every network call runs in a worker thread; a
+    # connection is only ever used by one send at a time.
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        size: int = 4,
+        timeout: float = 10,
+        keepalive_seconds: float = 30,
+        idle_timeout_seconds: float = 240
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self.keepalive_seconds = keepalive_seconds
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._idle: List[_PooledConnection] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def send(self, message: Message):
+        await self._deliver(lambda smtp: smtp.send_message(message))
+
+    async def send_raw(self, sender: str, recipients: List[str], data: bytes):
+        def sendmail(smtp: smtplib.SMTP):
+            mail_options = ["BODY=8BITMIME"] if smtp.has_extn("8bitmime") else []
+            smtp.sendmail(sender, recipients, data, mail_options=mail_options)
+        await self._deliver(sendmail)
+
+    async def _deliver(self, transmit: Callable[[smtplib.SMTP], object]):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+
+        async with self._semaphore:
+            connection = await self._checkout()
+            try:
+                await asyncio.to_thread(transmit, connection.smtp)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+                # The server answered and refused this message; the
+                # connection is fine, and resending would be refused again.
+                # (Checked first: every SMTPException is also an OSError.)
+                self._release(connection)
+                raise
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # The server dropped a pooled connection between our health
+                # check and the send; one fresh connection gets one retry.
+                self._discard(connection)
+                connection = await self._connect()
+                try:
+                    await asyncio.to_thread(transmit, connection.smtp)
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+                    self._release(connection)
+                    raise
+                except Exception:
+                    self._discard(connection)
+                    raise
+            except Exception:
+                self._discard(connection)
+                raise
+            self._release(connection)
+
+    async def _checkout(self) -> _PooledConnection:
+        while self._idle:
+            connection = self._idle.pop()
+            idle_for = time.monotonic() - connection.last_used
+            if idle_for > self.idle_timeout_seconds:
+                self._discard(connection)
+                continue
+            if idle_for > self.keepalive_seconds and not await self._is_alive(connection):
+                self._discard(connection)
+                continue
+            return connection
+        return await self._connect()
+
+    async def _connect(self) -> _PooledConnection:
+        return _PooledConnection(await asyncio.to_thread(self._open))
+
+    def _open(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.use_tls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.username and smtp.has_extn("auth"):
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    async def _is_alive(self, connection: _PooledConnection) -> bool:
+        try:
+            code, _ = await asyncio.to_thread(connection.smtp.noop)
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    def _release(self, connection: _PooledConnection):
+        connection.last_used = time.monotonic()
+        self._idle.append(connection)
+
+    def _discard(self, connection: _PooledConnection):
+        try:
+            connection.smtp.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            try:
+                await asyncio.to_thread(connection.smtp.quit)
+            except (smtplib.SMTPException, OSError):
+                self._discard(connection)
+
+smtp_pool = SMTPPool(
+    host=settings.SMTP_HOST,
+    port=settings.SMTP_PORT,
+    username=settings.SENDER_EMAIL,
+    password=settings.SENDER_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    size=settings.SMTP_POOL_SIZE,
+    timeout=settings.SMTP_TIMEOUT_SECONDS,
+    keepalive_seconds=settings.SMTP_KEEPALIVE_SECONDS,
+    idle_timeout_seconds=settings.SMTP_IDLE_TIMEOUT_SECONDS
+)
@@ -0,0 +1,177 @@
+import asyncio
+from typing import Dict, Optional
+from tortoise.expressions import F
+from tortoise.functions import Count
+from tortoise.exceptions import IntegrityError
+from tortoise.signals import post_save, pre_save
+from tortoise.transactions import in_transaction
+from models.appointment import Appointment
+from models.intake_call import IntakeCall
+from models.stat_counter import StatCounter
+from helpers.voice_agent import CallState, VoiceAgent, status_hooks, transition_hooks
+
+class DashboardStats:
+    # Flat counters ("calls.state.CONSENT") bumped as calls and bookings
+    # change. Increments land in memory and are written to stat_counters as
+    # deltas, so several app processes can share the table; every flush
+    # re-reads it so each process also sees the others' counts.
+
+    def __init__(self):
+        self._values: Dict[str, int] = {}
+        self._pending: Dict[str, int] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    def incr(self, key: str, delta: int = 1):
+        if delta:
+            self._values[key] = self._values.get(key, 0) + delta
+            self._pending[key] = self._pending.get(key, 0) + delta
+
+    def get(self, key: str) -> int:
+        return self._values.get(key, 0)
+
+    def group(self, prefix: str) -> Dict[str, int]:
+        prefix += "."
+        return {key[len(prefix):]: value for key, value in self._values.items() if key.startswith(prefix) and value}
+
+    def snapshot(self) -> Dict:
+        calls_total = self.get("calls.total")
+        completed = self.get("calls.status.completed")
+        return {
+            "calls": {
+                "total": calls_total,
+                "by_state": self.group("calls.state"),
+                "by_status": self.group("calls.status"),
+                "completion_rate": round(completed / calls_total, 4) if calls_total else 0.0,
+            },
+            "appointments": {
+                "total": self.get("appointments.total"),
+                "by_practice_area": self.group("appointments.practice_area"),
+                "by_status": self.group("appointments.status"),
+            },
+            "emails": {
+                "pending": self.get("emails.pending"),
+            },
+        }
+
+    async def load(self):
+        rows = await StatCounter.all().values_list("key", "value")
+        if not rows:
+            await self.rebuild()
+            return
+        self._values = dict(rows)
+        for key, delta in self._pending.items():
+            self._values[key] = self._values.get(key, 0) + delta
+
+    async def flush(self):
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            try:
+                async with in_transaction():
+                    for key, delta in pending.items():
+                        await self._apply_delta(key, delta)
+            except Exception:
+                for key, delta in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + delta
+                raise
+            await self.load()
+
+    async def _apply_delta(self, key: str, delta: int):
+        if await StatCounter.filter(key=key).update(value=F("value") + delta):
+            return
+        try:
+            await StatCounter.create(key=key, value=delta)
+        except IntegrityError:
+            await StatCounter.filter(key=key).update(value=F("value") + delta)
+
+    async def rebuild(self):
+        # Recount from the base tables, e.g. after a deploy or if the
+        # counters drifted. Grouped counts, so one pass per dimension.
+        counts: Dict[str, int] = {}
+
+        async def count_by(query, field: str, prefix: str):
+            rows = await query.annotate(n=Count("id")).group_by(field).values(field, "n")
+            for row in rows:
+                counts[f"{prefix}.{row[field]}"] = row["n"]
+
+        counts["calls.total"] = await IntakeCall.all().count()
+        await count_by(IntakeCall.all(), "current_state", "calls.state")
+        await count_by(IntakeCall.all(), "call_status", "calls.status")
+        counts["appointments.total"] = await Appointment.all().count()
+        await count_by(Appointment.exclude(booking_status="cancelled"), "practice_area", "appointments.practice_area")
+        await count_by(Appointment.all(), "booking_status", "appointments.status")
+        counts["emails.pending"] = await Appointment.filter(confirmation_email_sent=False).exclude(booking_status="cancelled").count()
+
+        async with in_transaction():
+            await StatCounter.all().delete()
+            await StatCounter.bulk_create([StatCounter(key=key, value=value) for key, value in counts.items()])
+        self._values = counts
+        self._pending = {}
+
+    async def run_flush_loop(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                import traceback
+                traceback.print_exc()
+
+dashboard_stats = DashboardStats()
+
+@post_save(IntakeCall)
+async def _count_new_call(sender, instance, created, using_db, update_fields):
+    if created:
+        dashboard_stats.incr("calls.total")
+        dashboard_stats.incr(f"calls.state.{instance.current_state}")
+        dashboard_stats.incr(f"calls.status.{instance.call_status}")
+
+_COUNTED_APPOINTMENT_FIELDS = ("booking_status", "practice_area", "confirmation_email_sent")
+
+def _appointment_counts(booking_status: str, practice_area: str, confirmation_email_sent: bool) -> Dict[str, int]:
+    counts = {f"appointments.status.{booking_status}": 1}
+    if booking_status != "cancelled":
+        counts[f"appointments.practice_area.{practice_area}"] = 1
+        if not confirmation_email_sent:
+            counts["emails.pending"] = 1
+    return counts
+
+# Appointments are counted through save(): an update moves the row from the
+# counters its stored values were in to the ones its new values belong in.
+# QuerySet.update() sends no signals, so code that changes these fields
+# that way adjusts the counters itself (see email_service).
+
+@pre_save(Appointment)
+async def _read_counted_appointment(sender, instance, using_db, update_fields):
+    if not instance._saved_in_db:
+        return
+    if update_fields is not None and not set(update_fields) & set(_COUNTED_APPOINTMENT_FIELDS):
+        return
+    stored = await Appointment.filter(id=instance.id).using_db(using_db).first().values(*_COUNTED_APPOINTMENT_FIELDS)
+    instance._counted_as = _appointment_counts(**stored) if stored else {}
+
+@post_save(Appointment)
+async def _count_appointment(sender, instance, created, using_db, update_fields):
+    if created:
+        dashboard_stats.incr("appointments.total")
+        before = {}
+    else:
+        before = instance.__dict__.pop("_counted_as", None)
+        if before is None:
+            return
+    after = _appointment_counts(instance.booking_status, instance.practice_area, instance.confirmation_email_sent)
+    for key in before.keys() | after.keys():
+        dashboard_stats.incr(key, after.get(key, 0) - before.get(key, 0))
+
+def _count_transition(agent: VoiceAgent, old_state: CallState, new_state: CallState):
+    if old_state != new_state:
+        dashboard_stats.incr(f"calls.state.{old_state.value}", -1)
+        dashboard_stats.incr(f"calls.state.{new_state.value}")
+
+def _count_status_change(agent: VoiceAgent, old_status: str, new_status: str):
+    dashboard_stats.incr(f"calls.status.{old_status}", -1)
+    dashboard_stats.incr(f"calls.status.{new_status}")
+
+transition_hooks.append(_count_transition)
+status_hooks.append(_count_status_change)
@@ -0,0 +1,103 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+class UnitOfWork:
+
+    def __init__(self):
+        self._tracked: Dict[int, Tuple[Model, Optional[Dict[str, Any]]]] = {}
+        self._upserts: List[Tuple[Model, List[str], List[str]]] = []
+        self._after_flush: List[Callable[[], None]] = []
+        self.statements = 0
+
+    def track(self, instance: Model) -> Model:
+        key = id(instance)
+        if key not in self._tracked:
+            self._tracked[key] = (instance, self._snapshot(instance))
+        return instance
+
+    def add(self, instance: Model) -> Model:
+        key = id(instance)
+        if key not in self._tracked:
+            self._tracked[key] = (instance, None)
+        return instance
+
+    def upsert(self, instance: Model, on_conflict: List[str], update_fields: List[str]) -> Model:
+        self._upserts.append((instance, on_conflict, update_fields))
+        return instance
+
+    def after_flush(self, callback: Callable[[], None]):
+        # For side effects (events, counters) that must only be seen once
+        # the changes behind them are stored.
+        self._after_flush.append(callback)
+
+    async def execute(self, query: Awaitable) -> Any:
+        self.statements += 1
+        return await query
+
+    async def create(self, model: Type[Model], **kwargs) -> Model:
+        instance = await self.execute(model.create(**kwargs))
+        return self.track(instance)
+
+    async def get_or_create(self, model: Type[Model], defaults: Optional[Dict] = None, **kwargs) -> Tuple[Model, bool]:
+        instance, created = await model.get_or_create(defaults=defaults, **kwargs)
+        self.statements += 2 if created else 1
+        return self.track(instance), created
+
+    def dirty_fields(self, instance: Model) -> Optional[List[str]]:
+        _, snapshot = self._tracked.get(id(instance), (instance, None))
+        if snapshot is None or not instance._saved_in_db:
+            return None
+
+        changed = [name for name, value in snapshot.items() if getattr(instance, name) != value]
+        if changed:
+            changed += [
+                name for name, field in instance._meta.fields_map.items()
+                if getattr(field, "auto_now", False) and name not in changed
+            ]
+        return changed
+
+    async def flush(self):
+        pending = []
+        for instance, _ in self._tracked.values():
+            update_fields = self.dirty_fields(instance)
+            if update_fields is None or update_fields:
+                pending.append((instance, update_fields))
+
+        upserts, self._upserts = self._upserts, []
+
+        if pending or upserts:
+            async with in_transaction():
+                for instance, update_fields in pending:
+                    await instance.save(update_fields=update_fields)
+                    self.statements += 1
+                for instance, on_conflict, update_fields in upserts:
+                    await type(instance).bulk_create(
+                        [instance], on_conflict=on_conflict, update_fields=update_fields
+                    )
+                    self.statements += 1
+
+        for key, (instance, _) in list(self._tracked.items()):
+            self._tracked[key] = (instance, self._snapshot(instance))
+
+        callbacks, self._after_flush = self._after_flush, []
+        for callback in callbacks:
+            callback()
+
+    def discard(self):
+        # Puts tracked rows back the way they were loaded and drops pending
+        # upserts, leaving memory consistent with what is stored.
+        for instance, snapshot in self._tracked.values():
+            if snapshot is not None:
+                for name, value in snapshot.items():
+                    setattr(instance, name, value)
+        self._upserts = []
+        self._after_flush = []
+
+    @staticmethod
+    def _snapshot(instance: Model) -> Dict[str, Any]:
+        return {
+            name: getattr(instance, name)
+            for name in instance._meta.fields_db_projection
+            if name != instance._meta.pk_attr
+        }
@@ -1,221 +1,254 @@
 import re
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from helpers.intents import classify
+
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_EMAIL_TOKEN = re.compile(r"[a-z0-9]+|[@._+-]")
+_REPEATED_DOTS = re.compile(r'\.{2,}')
+
+# Spoken forms matched longest phrase first; None marks filler that is dropped.
+_EMAIL_PHRASES = {
+    ("at", "the", "rate", "of"): "@",
+    ("at", "the", "rate"): "@",
+    ("at", "rate"): "@",
+    ("at",): "@",
+    ("dot",): ".",
+    ("point",): ".",
+    ("period",): ".",
+    ("underscore",): "_",
+    ("under", "score"): "_",
+    ("dash",): "-",
+    ("hyphen",): "-",
+    ("plus",): "+",
+    ("zero",): "0", ("one",): "1", ("two",): "2", ("three",): "3", ("four",): "4",
+    ("five",): "5", ("six",): "6", ("seven",): "7", ("eight",): "8", ("nine",): "9",
+    ("e", "-", "mail"): None,
+    ("e", "mail"): None,
+    ("email",): None,
+    ("address",): None,
+    ("my",): None,
+    ("is",): None,
+    ("its",): None,
+    ("it", "is"): None,
+    ("it", "s"): None,
+    ("the",): None,
+    ("and",): None,
+    ("yeah",): None,
+    ("yes",): None,
+    ("um",): None,
+    ("uh",): None,
+    ("capital",): None,
+    ("lowercase",): None,
+    ("uppercase",): None,
+    ("comma",): None,
+    ("question", "mark"): None,
+}
+_EMAIL_PHRASE_LENGTHS = sorted({len(phrase) for phrase in _EMAIL_PHRASES}, reverse=True)
+
+_DOMAIN_ALIASES = {
+    "gmail": "gmail.com", "gmailcom": "gmail.com", "geemail": "gmail.com", "jeemail": "gmail.com",
+    "yahoo": "yahoo.com", "yahoocom": "yahoo.com", "yahooom": "yahoo.com",
+    "hotmail": "hotmail.com", "hotmailcom": "hotmail.com",
+    "outlook": "outlook.com", "outlookcom": "outlook.com", "outlookom": "outlook.com",
+    "icloud": "icloud.com", "aol": "aol.com",
+}
+_TLD_FIXES = {"con": "com", "comm": "com", "nett": "net"}
+
+def _email_pieces(text: str):
+    tokens = _EMAIL_TOKEN.findall(text.lower())
+    i = 0
+    while i < len(tokens):
+        for length in _EMAIL_PHRASE_LENGTHS:
+            phrase = tuple(tokens[i:i + length])
+            if len(phrase) == length and phrase in _EMAIL_PHRASES:
+                if _EMAIL_PHRASES[phrase] is not None:
+                    yield _EMAIL_PHRASES[phrase]
+                i += length
+                break
+        else:
+            if tokens[i] == "double" and i + 1 < len(tokens) and len(tokens[i + 1]) == 1:
+                yield tokens[i + 1] * 2
+                i += 2
+            else:
+                yield tokens[i]
+                i += 1
+
+def _normalize_domain(domain: str) -> str:
+    labels = [label for label in domain.split('.') if label]
+    if not labels:
+        return ""
+    if len(labels) == 1:
+        name = labels[0]
+        if name in _DOMAIN_ALIASES:
+            return _DOMAIN_ALIASES[name]
+        if name.startswith('gm'):
+            return 'gmail.com'
+        return name + '.com' if name.isalpha() and len(name) >= 2 else name
+    
+    while len(labels) > 2 and labels[-1] == labels[-2]:
+        labels.pop()
+    labels[-1] = _TLD_FIXES.get(labels[-1], labels[-1])
+    if len(labels) == 2 and labels[0] in _DOMAIN_ALIASES and labels[1] == 'com':
+        return _DOMAIN_ALIASES[labels[0]]
+    return '.'.join(labels)
 
 def extract_email(text: str) -> Optional[str]:
+    # One pass over the transcript: spoken tokens become characters, filler
+    # is dropped and everything else is glued together ("j o h n" -> "john").
     if not text:
         return None
     
-    text_lower = text.lower().strip()
-    
-    original_text = text_lower
-    text_lower = re.sub(r'[.,?;:!]+$', '', text_lower)
-    
-    text_lower = re.sub(r'\b(at\s+)?at\s+the\s+rate\b', '@', text_lower, flags=re.IGNORECASE)
-    text_lower = re.sub(r'\bat\s+rate\b', '@', text_lower)
-    
-    text_lower = re.sub(r'\s+at\s+', '@', text_lower)
-    
-    text_lower = re.sub(r'@+', '@', text_lower)
-    text_lower = re.sub(r'@\s*at\s*', '@', text_lower)
-    text_lower = re.sub(r'at\s*@', '@', text_lower)
-    
-    text_lower = re.sub(r'\bdot\b', '.', text_lower, flags=re.IGNORECASE)
-    text_lower = re.sub(r'\bpoint\b', '.', text_lower, flags=re.IGNORECASE)
-    
-    text_lower = re.sub(r'\s*@\s*', '@', text_lower)
-    text_lower = re.sub(r'\s*\.\s*', '.', text_lower)
-    
-    filler_words = ['the', 'is', 'my', 'yeah', 'yes', 'question mark', 'comma', 'period', 'and', 'rate']
-    for word in filler_words:
-        if len(word) > 1:
-            text_lower = re.sub(r'\b' + word + r'\b', '', text_lower, flags=re.IGNORECASE)
-    
-    text_lower = re.sub(r'\s+', ' ', text_lower).strip()
-    
-    text_lower = re.sub(r'[^\w@.\s-]', '', text_lower)
-    
-    if '@' not in text_lower:
-        text_lower = re.sub(r'([a-z0-9])\s*,\s*([a-z0-9])', r'\1\2', text_lower, flags=re.IGNORECASE)
-    else:
-        parts_before_at = text_lower.split('@')
-        if len(parts_before_at) >= 1:
-            local_part_raw = parts_before_at[0]
-            local_part_cleaned = re.sub(r'([a-z0-9])\s*,\s*([a-z0-9])', r'\1\2', local_part_raw, flags=re.IGNORECASE)
-            text_lower = local_part_cleaned + '@' + '@'.join(parts_before_at[1:])
-    
-    if '@' in text_lower:
-        parts = text_lower.split('@')
-        if len(parts) == 2:
-            local_part = parts[0].strip()
-            
-            local_part = re.sub(r'[.,?;:!]+$', '', local_part)
-            
-            local_part = re.sub(r'\s*,\s*', ' ', local_part)
-            local_part = re.sub(r'\s+', '', local_part)
-            local_part = re.sub(r'[^\w._+-]', '', local_part)
-            
-            if not local_part:
-                return None
-            
-            domain_part = parts[1].strip()
-            domain_part = re.sub(r'[.,?;:!]+$', '', domain_part)
-            domain_lower = domain_part.lower()
-            
-            has_dot = '.' in domain_part
-            
-            if not has_dot and 'dot' in domain_lower:
-                domain_part = re.sub(r'\bdot\b', '.', domain_part, flags=re.IGNORECASE)
-                has_dot = '.' in domain_part
-            
-            if has_dot:
-                domain_parts = domain_part.split('.')
-                domain_parts = [re.sub(r'\s+', '', part.strip()).lower() for part in domain_parts if part.strip()]
-                domain_part = '.'.join(domain_parts)
-                domain_part = re.sub(r'\.{2,}', '.', domain_part)
-                domain_part = domain_part.strip('.')
-            else:
-                domain_part = re.sub(r'\s+', '', domain_part).lower()
-            
-            domain_part = re.sub(r'[^\w.-]', '', domain_part)
-            
-            if '.' in domain_part:
-                domain_part = re.sub(r'\.com\.com+$', '.com', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'\.net\.net+$', '.net', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'\.org\.org+$', '.org', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'\.com\.com', '.com', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'gmailcom\.com$', 'gmail.com', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'yahooom\.com$', 'yahoo.com', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'hotmailcom\.com$', 'hotmail.com', domain_part, flags=re.IGNORECASE)
-                domain_part = re.sub(r'outlookom\.com$', 'outlook.com', domain_part, flags=re.IGNORECASE)
-                domain_part = domain_part.lower()
-            else:
-                if 'gmail' in domain_part or (len(domain_part) >= 2 and domain_part[:2] == 'gm'):
-                    domain_part = 'gmail.com'
-                elif 'yahoo' in domain_part:
-                    domain_part = 'yahoo.com'
-                elif 'hotmail' in domain_part:
-                    domain_part = 'hotmail.com'
-                elif 'outlook' in domain_part:
-                    domain_part = 'outlook.com'
-                elif domain_part and domain_part.isalpha() and len(domain_part) >= 2:
-                    domain_part = domain_part + '.com'
-            
-            if local_part and domain_part:
-                text_lower = local_part + '@' + domain_part
-    else:
-        text_lower = re.sub(r'[^\w@.]', '', text_lower)
-    
-    text_lower = re.sub(r'\.{2,}', '.', text_lower)
-    text_lower = text_lower.strip('.')
-    
-    if '@' in text_lower:
-        parts = text_lower.split('@')
-        if len(parts) == 2:
-            local = parts[0].strip('._+-')
-            domain = parts[1].strip('._-')
-            
-            if domain:
-                domain = re.sub(r'^gmailcom\.com$', 'gmail.com', domain, flags=re.IGNORECASE)
-                domain = re.sub(r'^yahooom\.com$', 'yahoo.com', domain, flags=re.IGNORECASE)
-                domain = re.sub(r'^hotmailcom\.com$', 'hotmail.com', domain, flags=re.IGNORECASE)
-                domain = re.sub(r'^outlookom\.com$', 'outlook.com', domain, flags=re.IGNORECASE)
-                
-                domain = re.sub(r'\.com\.com+$', '.com', domain, flags=re.IGNORECASE)
-                domain = re.sub(r'\.net\.net+$', '.net', domain, flags=re.IGNORECASE)
-                domain = re.sub(r'\.org\.org+$', '.org', domain, flags=re.IGNORECASE)
-                
-                if '.' not in domain:
-                    domain_lower = domain.lower()
-                    if 'gmail' in domain_lower or domain_lower[:2] == 'gm':
-                        domain = 'gmail.com'
-                    elif 'yahoo' in domain_lower:
-                        domain = 'yahoo.com'
-                    elif 'hotmail' in domain_lower:
-                        domain = 'hotmail.com'
-                    elif 'outlook' in domain_lower:
-                        domain = 'outlook.com'
-                    elif domain and domain.isalpha() and len(domain) >= 2:
-                        domain = domain + '.com'
-            
-            if local and domain:
-                text_lower = local + '@' + domain
+    pieces = list(_email_pieces(text))
+    while pieces and pieces[0] == '@':
+        pieces.pop(0)
+    if '@' not in pieces:
+        return None
     
-    if validate_email(text_lower):
-        return text_lower
+    split_at = len(pieces) - 1 - pieces[::-1].index('@')
+    local = _REPEATED_DOTS.sub('.', ''.join(piece for piece in pieces[:split_at] if piece != '@')).strip('._+-')
+    domain = _REPEATED_DOTS.sub('.', ''.join(pieces[split_at + 1:])).strip('._-')
+    if not local or not domain:
+        return None
     
-    return None
+    email = local + '@' + _normalize_domain(domain)
+    return email if validate_email(email) else None
 
 def validate_email(email: str) -> bool:
     if not email:
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
+
+@dataclass(frozen=True)
+class PhoneRegion:
+    code: str
+    country_code: str
+    trunk_prefix: str = ""
+    national_lengths: Tuple[int, ...] = (10,)
+
+@dataclass(frozen=True)
+class PhoneNumber:
+    e164: str
+    region: Optional[str]
+    confidence: float
+
+# Regions we can recognise by country code or fall back to; add entries to
+# support more callers.
+PHONE_REGIONS: Dict[str, PhoneRegion] = {
+    "PK": PhoneRegion("PK", "92", "0", (9, 10)),
+    "US": PhoneRegion("US", "1", "1", (10,)),
+    "GB": PhoneRegion("GB", "44", "0", (10,)),
+    "IN": PhoneRegion("IN", "91", "0", (10,)),
+    "AE": PhoneRegion("AE", "971", "0", (8, 9)),
+    "SA": PhoneRegion("SA", "966", "0", (9,)),
+    "AU": PhoneRegion("AU", "61", "0", (9,)),
+    "CA": PhoneRegion("CA", "1", "1", (10,)),
+}
+DEFAULT_PHONE_REGION = "PK"
 
-def extract_phone_number(text: str) -> Optional[str]:
+_PHONE_TOKEN = re.compile(r"\d|[a-z]+|\+")
+_DIGIT_WORDS = {
+    "zero": "0", "oh": "0", "o": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+    "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+    "ten": "10", "eleven": "11", "twelve": "12", "thirteen": "13", "fourteen": "14",
+    "fifteen": "15", "sixteen": "16", "seventeen": "17", "eighteen": "18", "nineteen": "19",
+}
+_TENS_WORDS = {
+    "twenty": "2", "thirty": "3", "forty": "4", "fifty": "5",
+    "sixty": "6", "seventy": "7", "eighty": "8", "ninety": "9",
+}
+_SCALE_WORDS = {"hundred": "00", "thousand": "000"}
+_REPEAT_WORDS = {"double": 2, "triple": 3, "quadruple": 4}
+
+def _spoken_digits(text: str) -> Tuple[str, bool]:
+    # Single left-to-right pass; anything that is not part of a number
+    # ("my", "number", "is", ...) is skipped.
+    tokens = _PHONE_TOKEN.findall(text.lower())
+    digits: List[str] = []
+    explicit_plus = False
+    repeat = 1
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if token in ("+", "plus"):
+            explicit_plus = explicit_plus or not digits
+            continue
+        if token in _REPEAT_WORDS:
+            repeat = _REPEAT_WORDS[token]
+            continue
+        if token in _SCALE_WORDS:
+            if digits:
+                digits.append(_SCALE_WORDS[token])
+            continue
+
+        if token.isdigit():
+            value = token
+        elif token in _DIGIT_WORDS:
+            value = _DIGIT_WORDS[token]
+        elif token in _TENS_WORDS:
+            unit = _DIGIT_WORDS.get(tokens[i]) if i < len(tokens) else None
+            if unit is not None and len(unit) == 1 and unit != "0":
+                value = _TENS_WORDS[token] + unit
+                i += 1
+            else:
+                value = _TENS_WORDS[token] + "0"
+        else:
+            continue
+
+        digits.append(value[0] * repeat + value[1:])
+        repeat = 1
+    return "".join(digits), explicit_plus
+
+def _match_country_code(digits: str) -> Optional[PhoneRegion]:
+    for length in (3, 2, 1):
+        for region in PHONE_REGIONS.values():
+            if region.country_code == digits[:length]:
+                return region
+    return None
+
+def parse_phone_number(text: str, default_region: str = DEFAULT_PHONE_REGION) -> Optional[PhoneNumber]:
     if not text:
         return None
     
-    text_lower = text.lower()
-    text_lower = re.sub(r'\b(phone|number|is|my|the|a|an|yeah|yes)\b', '', text_lower)
-    
-    text_lower = re.sub(r'\b(triple|three times)\b', ' 333 ', text_lower)
-    text_lower = re.sub(r'\b(double|two times)\b', '', text_lower)
-    
-    has_plus = '+' in text_lower or 'plus' in text_lower
-    
-    number_words = {
-        'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
-        'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9'
-    }
-    for word, digit in number_words.items():
-        text_lower = re.sub(r'\b' + word + r'\b', digit, text_lower)
-    
-    digits = re.findall(r'\d+', text_lower)
+    digits, explicit = _spoken_digits(text)
+    if digits.startswith("00"):
+        digits, explicit = digits[2:], True
     if not digits:
         return None
     
-    phone_digits = ''.join(digits)
-    
-    if phone_digits.startswith('0'):
-        if len(phone_digits) >= 10:
-            phone_digits = '+92' + phone_digits[1:]
-        else:
-            return None
-    elif phone_digits.startswith('92'):
-        phone_digits = '+' + phone_digits
-    elif has_plus or len(phone_digits) >= 10:
-        if not phone_digits.startswith('+'):
-            if len(phone_digits) == 10:
-                phone_digits = '+92' + phone_digits
-            elif len(phone_digits) == 11 and phone_digits[0] == '0':
-                phone_digits = '+92' + phone_digits[1:]
-            elif len(phone_digits) >= 12:
-                phone_digits = '+' + phone_digits
-            else:
-                return None
-    else:
+    if explicit:
+        region = _match_country_code(digits)
+        if region and len(digits) - len(region.country_code) in region.national_lengths:
+            return PhoneNumber("+" + digits, region.code, 1.0)
+        if 8 <= len(digits) <= 15 and not digits.startswith("0"):
+            return PhoneNumber("+" + digits, None, 0.6)
         return None
     
-    return phone_digits
+    region = PHONE_REGIONS.get(default_region)
+    if region:
+        national = digits
+        if region.trunk_prefix and digits.startswith(region.trunk_prefix) and len(digits) - len(region.trunk_prefix) in region.national_lengths:
+            national = digits[len(region.trunk_prefix):]
+        elif digits.startswith(region.country_code) and len(digits) - len(region.country_code) in region.national_lengths:
+            national = digits[len(region.country_code):]
+        if len(national) in region.national_lengths:
+            return PhoneNumber("+" + region.country_code + national, region.code, 0.9 if national != digits else 0.8)
+    
+    other = _match_country_code(digits)
+    if other and len(digits) - len(other.country_code) in other.national_lengths and len(digits) >= 11:
+        return PhoneNumber("+" + digits, other.code, 0.7)
+    if 12 <= len(digits) <= 15 and not digits.startswith("0"):
+        return PhoneNumber("+" + digits, None, 0.5)
+    return None
 
-def validate_phone(phone: str) -> bool:
-    if not phone:
-        return False
-    
-    normalized = extract_phone_number(phone)
-    if not normalized:
-        return False
-    
-    cleaned = normalized.replace('+', '')
-    
-    if len(cleaned) < 7 or len(cleaned) > 15:
-        return False
-    
-    if not cleaned.isdigit():
-        return False
-    
-    return True
+def extract_phone_number(text: str, default_region: str = DEFAULT_PHONE_REGION) -> Optional[str]:
+    parsed = parse_phone_number(text, default_region)
+    return parsed.e164 if parsed else None
+
+def validate_phone(phone: str, default_region: str = DEFAULT_PHONE_REGION) -> bool:
+    return parse_phone_number(phone, default_region) is not None
 
 def normalize_phone(phone: str) -> str:
     cleaned = re.sub(r'[\s\-\(\)]', '', phone)
@@ -241,25 +274,7 @@ def validate_date(date_str: str) -> Optional[datetime]:
     return None
 
 def validate_practice_area(text: str) -> Optional[str]:
-    text_lower = text.lower().strip()
-    
-    text_lower = text_lower.replace("uh", "").replace("um", "").replace("okay", "").replace("ok", "")
-    text_lower = " ".join(text_lower.split())
-    
-    if "lemon" in text_lower:
-        return "Lemon Law"
-    
-    if "personal" in text_lower:
-        if "injury" in text_lower or "injured" in text_lower or "injuries" in text_lower:
-            return "Personal Injury"
-        if len(text_lower.split()) <= 3:
-            return "Personal Injury"
-    
-    if "injury" in text_lower or "injured" in text_lower or "injuries" in text_lower:
-        if "personal" in text_lower or "accident" in text_lower or "car" in text_lower:
-            return "Personal Injury"
-    
-    return None
+    return classify(text, "practice_area").intent
 
 def sanitize_input(text: str) -> str:
     if not text:
@@ -1,5 +1,8 @@
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional, Any
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Any
 from models.intake_call import IntakeCall
 from models.caller import Caller
 from models.case_question import CaseQuestion
@@ -7,9 +10,17 @@ from models.appointment import Appointment
 from config.lemon_law_questions import LEMON_LAW_QUESTIONS
 from config.personal_injury_questions import PERSONAL_INJURY_QUESTIONS
 from helpers.validators import (
-    validate_email, validate_phone, normalize_phone,
-    validate_practice_area, sanitize_input, extract_email
+    validate_email, normalize_phone,
+    sanitize_input, extract_email,
+    extract_phone_number, parse_phone_number
 )
+from config.settings import settings
+from helpers.intents import classify, YES, NO
+from helpers.answer_normalizer import NORMALIZED_FIELDS, normalized_fields
+from helpers.call_session import call_sessions
+from helpers.slot_choice import SlotChoices
+from helpers.slot_holds import slot_holds
+from helpers.unit_of_work import UnitOfWork
 
 class CallState(Enum):
     GREETING = "GREETING"
@@ -22,6 +33,34 @@ class CallState(Enum):
     CONFIRM_BOOKING = "CONFIRM_BOOKING"
     END_CALL = "END_CALL"
 
+TRANSITIONS: Dict[CallState, FrozenSet[CallState]] = {
+    CallState.GREETING: frozenset({CallState.PRACTICE_AREA, CallState.PERSONAL_INFO}),
+    CallState.PRACTICE_AREA: frozenset({CallState.PRACTICE_AREA_CLARIFY, CallState.PERSONAL_INFO}),
+    CallState.PRACTICE_AREA_CLARIFY: frozenset({CallState.PERSONAL_INFO}),
+    CallState.PERSONAL_INFO: frozenset({CallState.CONSENT}),
+    CallState.CONSENT: frozenset({CallState.CASE_QUESTIONS}),
+    CallState.CASE_QUESTIONS: frozenset({CallState.SHOW_SLOTS}),
+    CallState.SHOW_SLOTS: frozenset({CallState.CONFIRM_BOOKING}),
+    CallState.CONFIRM_BOOKING: frozenset({CallState.SHOW_SLOTS}),
+    CallState.END_CALL: frozenset(),
+}
+TRANSITIONS = {state: allowed | {state, CallState.END_CALL} for state, allowed in TRANSITIONS.items()}
+
+@dataclass
+class TurnResult:
+    message: str = ""
+    next_state: Optional[CallState] = None
+    action: str = "continue"
+
+# Hooks run synchronously, so they must not block.
+# turn_hooks receive (agent, state, result, elapsed_seconds) after every turn.
+# transition_hooks receive (agent, old_state, new_state) on every state change.
+# status_hooks receive (agent, old_status, new_status) when call_status changes.
+# Both run once the turn that made the change has been written.
+turn_hooks: List[Callable[["VoiceAgent", CallState, TurnResult, float], None]] = []
+transition_hooks: List[Callable[["VoiceAgent", CallState, CallState], None]] = []
+status_hooks: List[Callable[["VoiceAgent", str, str], None]] = []
+
 class VoiceAgent:
     
     def __init__(self, intake_call: IntakeCall):
@@ -29,9 +68,14 @@ class VoiceAgent:
         self.current_state = CallState(intake_call.current_state)
         self.personal_info = {}
         self.current_field = intake_call.current_field or None
-        self.current_question_index = 0
+        self.current_question_index = intake_call.question_index or 0
         self.questions = []
         self.selected_slot = None
+        self.offered_slots: Optional[SlotChoices] = SlotChoices(intake_call.offered_slots) if intake_call.offered_slots else None
+        self.held_slot: Optional[Dict] = None
+        self._caller_loaded = False
+        self.unit_of_work: Optional[UnitOfWork] = None
+        self.last_turn_statements = 0
         
     async def get_next_message(self) -> str:
         if self.current_state == CallState.GREETING:
@@ -63,27 +107,7 @@ class VoiceAgent:
             return "May I proceed to schedule an appointment and ask a few quick questions first?"
         
         elif self.current_state == CallState.CASE_QUESTIONS:
-            if not self.questions:
-                if self.intake_call.practice_area == "Lemon Law":
-                    self.questions = LEMON_LAW_QUESTIONS
-                else:
-                    self.questions = PERSONAL_INJURY_QUESTIONS
-                
-                try:
-                    answered_records = await CaseQuestion.filter(
-                        intake_call=self.intake_call
-                    ).all()
-                    answered_keys = {r.question_key for r in answered_records}
-                    
-                    self.current_question_index = len(self.questions)
-                    for i, q in enumerate(self.questions):
-                        if q["key"] not in answered_keys:
-                            self.current_question_index = i
-                            break
-                except Exception:
-                    import traceback
-                    traceback.print_exc()
-                    self.current_question_index = 0
+            self._load_questions()
             
             if self.current_question_index < len(self.questions):
                 question = self.questions[self.current_question_index]
@@ -105,437 +129,370 @@ class VoiceAgent:
         
         return "How can I help you?"
     
-    async def process_response(self, response: str) -> Dict[str, Any]:
-        await self._load_caller_info()
+    async def process_response(self, response: str) -> TurnResult:
+        state = self.current_state
+        started = time.perf_counter()
         
-        response = sanitize_input(response)
-        result = {
-            "message": "",
-            "next_state": None,
-            "action": "continue"
-        }
+        async with self._turn():
+            await self._load_caller_info()
+            handler = STATE_HANDLERS.get(state)
+            if handler:
+                result = await handler(self, sanitize_input(response))
+            else:
+                result = TurnResult()
         
-        field_info = f", current_field={self.current_field}" if self.current_field else ""
+        result.next_state = self.current_state
+        elapsed = time.perf_counter() - started
+        for hook in turn_hooks:
+            hook(self, state, result, elapsed)
+        return result
+    
+    async def _handle_greeting(self, response: str) -> TurnResult:
+        if not response or not response.strip():
+            return await self._move_to(CallState.PRACTICE_AREA)
         
-        if self.current_state == CallState.GREETING:
-            
-            if not response or not response.strip():
-                await self._transition_to(CallState.PRACTICE_AREA)
-                result["message"] = await self.get_next_message()
-            else:
-                practice_area = validate_practice_area(response)
-                
-                if practice_area:
-                    self.intake_call.practice_area = practice_area
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.PERSONAL_INFO)
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                    result["message"] = await self.get_next_message()
-                else:
-                    await self._transition_to(CallState.PRACTICE_AREA)
-                    result["message"] = await self.get_next_message()
+        practice_area = classify(response, "practice_area").intent
+        if practice_area:
+            return await self._select_practice_area(practice_area)
+        return await self._move_to(CallState.PRACTICE_AREA)
+    
+    async def _handle_practice_area(self, response: str) -> TurnResult:
+        practice_area = classify(response, "practice_area").intent
+        if practice_area:
+            return await self._select_practice_area(practice_area)
+        return await self._move_to(CallState.PRACTICE_AREA_CLARIFY)
+    
+    async def _handle_practice_area_clarify(self, response: str) -> TurnResult:
+        practice_area = classify(response, "practice_area_clarify").intent
+        return await self._select_practice_area(practice_area or "Personal Injury")
+    
+    async def _handle_personal_info(self, response: str) -> TurnResult:
+        if not self.current_field:
+            self._set_current_field("name")
         
-        elif self.current_state == CallState.PRACTICE_AREA:
-            practice_area = validate_practice_area(response)
-            if practice_area:
-                self.intake_call.practice_area = practice_area
-                await self.intake_call.save()
-                await self._transition_to(CallState.PERSONAL_INFO)
-                self.current_field = "name"
-                self.intake_call.current_field = "name"
-                await self.intake_call.save()
-                result["message"] = await self.get_next_message()
-            else:
-                response_lower = response.lower()
-                if "personal" in response_lower:
-                    self.intake_call.practice_area = "Personal Injury"
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.PERSONAL_INFO)
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                    result["message"] = await self.get_next_message()
-                elif "lemon" in response_lower:
-                    self.intake_call.practice_area = "Lemon Law"
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.PERSONAL_INFO)
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                    result["message"] = await self.get_next_message()
-                else:
-                    await self._transition_to(CallState.PRACTICE_AREA_CLARIFY)
-                    result["message"] = await self.get_next_message()
+        if not response or not response.strip():
+            return TurnResult(message=await self.get_next_message())
         
-        elif self.current_state == CallState.PRACTICE_AREA_CLARIFY:
-            practice_area = validate_practice_area(response)
-            if practice_area:
-                self.intake_call.practice_area = practice_area
-                await self.intake_call.save()
-                await self._transition_to(CallState.PERSONAL_INFO)
-                self.current_field = "name"
-                self.intake_call.current_field = "name"
-                await self.intake_call.save()
-                result["message"] = await self.get_next_message()
-            else:
-                response_lower = response.lower()
-                if "lemon" in response_lower or "vehicle" in response_lower or "car" in response_lower or "defect" in response_lower:
-                    self.intake_call.practice_area = "Lemon Law"
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.PERSONAL_INFO)
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                    result["message"] = await self.get_next_message()
-                elif "personal" in response_lower or "injury" in response_lower or "accident" in response_lower or "injured" in response_lower:
-                    self.intake_call.practice_area = "Personal Injury"
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.PERSONAL_INFO)
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                    result["message"] = await self.get_next_message()
-                else:
-                    self.intake_call.practice_area = "Personal Injury"
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.PERSONAL_INFO)
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                    result["message"] = await self.get_next_message()
+        handler = PERSONAL_INFO_HANDLERS.get(self.current_field)
+        if handler:
+            return await handler(self, response)
         
-        elif self.current_state == CallState.PERSONAL_INFO:
-            if not response or not response.strip():
-                if not self.current_field:
-                    self.current_field = "name"
-                    self.intake_call.current_field = "name"
-                    await self.intake_call.save()
-                result["message"] = await self.get_next_message()
-                return result
-            
-            if not self.current_field:
-                self.current_field = "name"
-                self.intake_call.current_field = "name"
-                await self.intake_call.save()
-            
-            if self.current_field == "name":
-                cleaned_response = response.strip('?').strip()
-                
-                if not cleaned_response:
-                    result["message"] = "I didn't catch that. Please provide your full name."
-                    return result
-                
-                from helpers.validators import extract_phone_number
-                extracted_phone = extract_phone_number(cleaned_response)
-                if extracted_phone:
-                    result["message"] = "That sounds like a phone number. I need your full name first. Please say your name."
-                    return result
-                
-                if not any(c.isalpha() for c in cleaned_response):
-                    result["message"] = "I need your full name, not just numbers. Please say your name."
-                    return result
-                
-                self.personal_info["full_name"] = cleaned_response
-                validated_input = cleaned_response
-                
-                try:
-                    if self.intake_call.caller_id:
-                        caller = await Caller.get(id=self.intake_call.caller_id)
-                        if hasattr(caller, 'email') and ('temp_' in str(caller.email) or '@temp.com' in str(caller.email)):
-                            caller = await Caller.create(
-                                full_name=validated_input,
-                                phone="",
-                                email=f"pending_{self.intake_call.twilio_call_sid}@temp.com"
-                            )
-                            self.intake_call.caller = caller
-                            await self.intake_call.save()
-                        else:
-                            caller.full_name = validated_input
-                            await caller.save()
-                    else:
-                        caller = await Caller.create(
-                            full_name=validated_input,
-                            phone="",
-                            email=f"pending_{self.intake_call.twilio_call_sid}@temp.com"
-                        )
-                        self.intake_call.caller = caller
-                        await self.intake_call.save()
-                except Exception:
-                    import traceback
-                    traceback.print_exc()
-                self.current_field = "phone"
-                self.intake_call.current_field = "phone"
-                await self.intake_call.save()
-                result["message"] = await self.get_next_message()
-                
-            elif self.current_field == "phone":
-                from helpers.validators import extract_phone_number, validate_phone
-                
-                extracted_phone = extract_phone_number(response)
-                
-                if not extracted_phone or not validate_phone(extracted_phone):
-                    result["message"] = "I didn't catch a valid phone number. Please say your phone number clearly, including the country code. For example, plus 9 2 3 3 3 1 2 3 4 5 6 7."
-                    return result
-                
-                validated_input = extracted_phone
-                self.personal_info["phone"] = validated_input
-                
-                try:
-                    if self.intake_call.caller_id:
-                        caller = await Caller.get(id=self.intake_call.caller_id)
-                        caller.phone = validated_input
-                        if "full_name" in self.personal_info:
-                            caller.full_name = self.personal_info["full_name"]
-                        await caller.save()
-                    else:
-                        caller = await Caller.create(
-                            full_name=self.personal_info.get("full_name", ""),
-                            phone=validated_input,
-                            email=f"pending_{self.intake_call.twilio_call_sid}@temp.com"
-                        )
-                        self.intake_call.caller = caller
-                        await self.intake_call.save()
-                except Exception:
-                    import traceback
-                    traceback.print_exc()
-                self.current_field = "email"
-                self.intake_call.current_field = "email"
-                await self.intake_call.save()
-                result["message"] = await self.get_next_message()
-                
-            elif self.current_field == "email":
-                extracted_email = extract_email(response)
-                
-                if not extracted_email:
-                    result["message"] = "I didn't catch a valid email address. Please say your email address clearly, like: muhammadhassib at gmail dot com."
-                    return result
-                
-                validated_input = extracted_email
-                self.personal_info["email"] = validated_input
-                self.intake_call.pending_email = validated_input
-                await self.intake_call.save()
-                
-                self.current_field = "email_confirm"
-                self.intake_call.current_field = "email_confirm"
-                await self.intake_call.save()
-                result["message"] = await self.get_next_message()
-                
-            elif self.current_field == "email_confirm":
-                pending_email = self.intake_call.pending_email or self.personal_info.get("email", "")
-                confirmation_response = response.lower().strip()
-                
-                if "yes" in confirmation_response or "correct" in confirmation_response or "right" in confirmation_response:
-                    validated_input = pending_email
-                    
-                    try:
-                        if self.intake_call.caller_id:
-                            caller = await Caller.get(id=self.intake_call.caller_id)
-                            if 'temp_' in str(caller.email) or '@temp.com' in str(caller.email):
-                                caller, _ = await Caller.get_or_create(
-                                    email=validated_input,
-                                    defaults={
-                                        "full_name": self.personal_info.get("full_name", ""),
-                                        "phone": self.personal_info.get("phone", "")
-                                    }
-                                )
-                                if not caller.full_name and self.personal_info.get("full_name"):
-                                    caller.full_name = self.personal_info["full_name"]
-                                if not caller.phone and self.personal_info.get("phone"):
-                                    caller.phone = self.personal_info["phone"]
-                                await caller.save()
-                            else:
-                                caller.email = validated_input
-                                if "full_name" in self.personal_info:
-                                    caller.full_name = self.personal_info["full_name"]
-                                if "phone" in self.personal_info:
-                                    caller.phone = self.personal_info["phone"]
-                                await caller.save()
-                        else:
-                            caller, _ = await Caller.get_or_create(
-                                email=validated_input,
-                                defaults={
-                                    "full_name": self.personal_info.get("full_name", ""),
-                                    "phone": self.personal_info.get("phone", "")
-                                }
-                            )
-                            if not caller.full_name and self.personal_info.get("full_name"):
-                                caller.full_name = self.personal_info["full_name"]
-                            if not caller.phone and self.personal_info.get("phone"):
-                                caller.phone = self.personal_info["phone"]
-                            await caller.save()
-                        
-                        self.intake_call.caller = caller
-                        self.intake_call.pending_email = None
-                        await self.intake_call.save()
-                    except Exception as e:
-                        import traceback
-                        traceback.print_exc()
-                    
-                    self.current_field = None
-                    self.intake_call.current_field = None
-                    await self.intake_call.save()
-                    await self._transition_to(CallState.CONSENT)
-                    result["message"] = await self.get_next_message()
-                elif "no" in confirmation_response or "wrong" in confirmation_response or "incorrect" in confirmation_response:
-                    self.intake_call.pending_email = None
-                    self.current_field = "email"
-                    self.intake_call.current_field = "email"
-                    await self.intake_call.save()
-                    if "email" in self.personal_info:
-                        del self.personal_info["email"]
-                    result["message"] = "No problem. Please say your email address again clearly."
-                else:
-                    result["message"] = await self.get_next_message()
-            
-            else:
-                self.current_field = "name"
-                self.intake_call.current_field = "name"
-                await self.intake_call.save()
-                result["message"] = await self.get_next_message()
+        self._set_current_field("name")
+        return TurnResult(message=await self.get_next_message())
+    
+    async def _collect_name(self, response: str) -> TurnResult:
+        cleaned_response = response.strip('?').strip()
         
-        elif self.current_state == CallState.CONSENT:
-            if "no" in response.lower() or "not now" in response.lower() or "later" in response.lower():
-                result["action"] = "transfer"
-                result["message"] = "I understand. Would you like me to transfer you to a human representative, or would you prefer to leave a message and have someone call you back?"
-            elif "yes" in response.lower() or "sure" in response.lower() or "okay" in response.lower() or "ok" in response.lower() or "yes please" in response.lower():
-                self.intake_call.consent_to_book = True
-                await self.intake_call.save()
-                await self._transition_to(CallState.CASE_QUESTIONS)
-                result["message"] = await self.get_next_message()
+        if not cleaned_response:
+            return TurnResult(message="I didn't catch that. Please provide your full name.")
+        
+        if extract_phone_number(cleaned_response, settings.PHONE_DEFAULT_REGION):
+            return TurnResult(message="That sounds like a phone number. I need your full name first. Please say your name.")
+        
+        if not any(c.isalpha() for c in cleaned_response):
+            return TurnResult(message="I need your full name, not just numbers. Please say your name.")
+        
+        self.personal_info["full_name"] = cleaned_response
+        
+        try:
+            caller = await self._get_caller()
+            if caller and 'temp_' not in str(caller.email):
+                caller.full_name = cleaned_response
+                self.unit_of_work.add(caller)
             else:
-                result["message"] = "I didn't catch that. May I proceed to schedule an appointment and ask a few quick questions first? Please say yes or no."
+                await self._create_pending_caller(full_name=cleaned_response, phone="")
+        except Exception:
+            import traceback
+            traceback.print_exc()
         
-        elif self.current_state == CallState.CASE_QUESTIONS:
-            if not self.questions:
-                if self.intake_call.practice_area == "Lemon Law":
-                    self.questions = LEMON_LAW_QUESTIONS
-                else:
-                    self.questions = PERSONAL_INJURY_QUESTIONS
-                
-                try:
-                    answered_records = await CaseQuestion.filter(
-                        intake_call=self.intake_call
-                    ).all()
-                    answered_keys = {r.question_key for r in answered_records}
-                    
-                    self.current_question_index = len(self.questions)
-                    for i, q in enumerate(self.questions):
-                        if q["key"] not in answered_keys:
-                            self.current_question_index = i
-                            break
-                except Exception:
-                    import traceback
-                    traceback.print_exc()
-                    self.current_question_index = 0
-            
-            if self.current_question_index >= len(self.questions):
-                await self._transition_to(CallState.SHOW_SLOTS)
-                result["message"] = await self.get_next_message()
-                return result
-            
-            if self.current_question_index >= len(self.questions):
-                await self._transition_to(CallState.SHOW_SLOTS)
-                result["message"] = await self.get_next_message()
-                return result
-            
-            question = self.questions[self.current_question_index]
-            
-            if not response or response.strip() == "":
-                result["message"] = question["question"] + " Please provide your answer."
-                return result
-            
-            try:
-                existing_answer = await CaseQuestion.get_or_none(
-                    intake_call=self.intake_call,
-                    question_key=question["key"]
+        self._set_current_field("phone")
+        return TurnResult(message=await self.get_next_message())
+    
+    async def _collect_phone(self, response: str) -> TurnResult:
+        parsed_phone = parse_phone_number(response, settings.PHONE_DEFAULT_REGION)
+        
+        if parsed_phone is None:
+            return TurnResult(message="I didn't catch a valid phone number. Please say your phone number clearly, including the country code. For example, plus 9 2 3 3 3 1 2 3 4 5 6 7.")
+        
+        extracted_phone = parsed_phone.e164
+        self.personal_info["phone"] = extracted_phone
+        
+        try:
+            caller = await self._get_caller()
+            if caller:
+                caller.phone = extracted_phone
+                if "full_name" in self.personal_info:
+                    caller.full_name = self.personal_info["full_name"]
+                self.unit_of_work.add(caller)
+            else:
+                await self._create_pending_caller(
+                    full_name=self.personal_info.get("full_name", ""),
+                    phone=extracted_phone
                 )
-                
-                if existing_answer:
-                    self.current_question_index += 1
-                    
-                    if self.current_question_index < len(self.questions):
-                        result["message"] = await self.get_next_message()
-                    else:
-                        await self._transition_to(CallState.SHOW_SLOTS)
-                        result["message"] = await self.get_next_message()
-                    return result
-            except Exception:
-                pass
-            
+        except Exception:
+            import traceback
+            traceback.print_exc()
+        
+        self._set_current_field("email")
+        return TurnResult(message=await self.get_next_message())
+    
+    async def _collect_email(self, response: str) -> TurnResult:
+        extracted_email = extract_email(response)
+        
+        if not extracted_email:
+            return TurnResult(message="I didn't catch a valid email address. Please say your email address clearly, like: muhammadhassib at gmail dot com.")
+        
+        self.personal_info["email"] = extracted_email
+        self.intake_call.pending_email = extracted_email
+        self._set_current_field("email_confirm")
+        return TurnResult(message=await self.get_next_message())
+    
+    async def _confirm_email(self, response: str) -> TurnResult:
+        pending_email = self.intake_call.pending_email or self.personal_info.get("email", "")
+        intent = classify(response, "confirm").intent
+        
+        if intent == YES:
             try:
-                case_question, created = await CaseQuestion.get_or_create(
-                    intake_call=self.intake_call,
-                    question_key=question["key"],
-                    defaults={
-                        "question_text": question["question"],
-                        "answer": response,
-                        "practice_area": self.intake_call.practice_area
-                    }
-                )
-                
-                if not created:
-                    case_question.answer = response
-                    case_question.question_text = question["question"]
-                    await case_question.save()
-                
-                self.current_question_index += 1
-                
-                if self.current_question_index < len(self.questions):
-                    result["message"] = await self.get_next_message()
+                caller = await self._get_caller()
+                if caller and 'temp_' not in str(caller.email) and '@temp.com' not in str(caller.email):
+                    caller.email = pending_email
+                    if "full_name" in self.personal_info:
+                        caller.full_name = self.personal_info["full_name"]
+                    if "phone" in self.personal_info:
+                        caller.phone = self.personal_info["phone"]
+                    self.unit_of_work.add(caller)
                 else:
-                    await self._transition_to(CallState.SHOW_SLOTS)
-                    result["message"] = await self.get_next_message()
+                    caller, _ = await self.unit_of_work.get_or_create(
+                        Caller,
+                        email=pending_email,
+                        defaults={
+                            "full_name": self.personal_info.get("full_name", ""),
+                            "phone": self.personal_info.get("phone", "")
+                        }
+                    )
+                    if not caller.full_name and self.personal_info.get("full_name"):
+                        caller.full_name = self.personal_info["full_name"]
+                    if not caller.phone and self.personal_info.get("phone"):
+                        caller.phone = self.personal_info["phone"]
+                
+                self.intake_call.caller = caller
+                self.intake_call.pending_email = None
             except Exception:
                 import traceback
                 traceback.print_exc()
-                result["message"] = question["question"] + " Please try again."
+            
+            self._set_current_field(None)
+            return await self._move_to(CallState.CONSENT)
         
-        elif self.current_state == CallState.SHOW_SLOTS:
-            result["message"] = "Please select a time slot."
+        if intent == NO:
+            self.intake_call.pending_email = None
+            self._set_current_field("email")
+            self.personal_info.pop("email", None)
+            return TurnResult(message="No problem. Please say your email address again clearly.")
         
-        elif self.current_state == CallState.CONFIRM_BOOKING:
-            if "yes" in response.lower() or "correct" in response.lower():
-                await self._transition_to(CallState.END_CALL)
-                result["message"] = await self.get_next_message()
-                result["action"] = "end"
-            else:
-                result["message"] = "Let me show you the available slots again."
-                await self._transition_to(CallState.SHOW_SLOTS)
+        return TurnResult(message=await self.get_next_message())
+    
+    async def _handle_consent(self, response: str) -> TurnResult:
+        intent = classify(response, "consent").intent
         
-        return result
+        if intent == NO:
+            return TurnResult(
+                message="I understand. Would you like me to transfer you to a human representative, or would you prefer to leave a message and have someone call you back?",
+                action="transfer"
+            )
+        
+        if intent == YES:
+            self.intake_call.consent_to_book = True
+            return await self._move_to(CallState.CASE_QUESTIONS)
+        
+        return TurnResult(message="I didn't catch that. May I proceed to schedule an appointment and ask a few quick questions first? Please say yes or no.")
+    
+    async def _handle_case_questions(self, response: str) -> TurnResult:
+        self._load_questions()
+        
+        if self.current_question_index >= len(self.questions):
+            return await self._move_to(CallState.SHOW_SLOTS)
+        
+        question = self.questions[self.current_question_index]
+        
+        if not response or response.strip() == "":
+            return TurnResult(message=question["question"] + " Please provide your answer.")
+        
+        try:
+            self.unit_of_work.upsert(
+                CaseQuestion(
+                    intake_call=self.intake_call,
+                    question_key=question["key"],
+                    question_text=question["question"],
+                    answer=response,
+                    practice_area=self.intake_call.practice_area,
+                    **normalized_fields(question, response)
+                ),
+                on_conflict=["intake_call_id", "question_key"],
+                update_fields=["question_text", "answer"] + NORMALIZED_FIELDS
+            )
+            
+            self.current_question_index += 1
+            self.intake_call.question_index = self.current_question_index
+            
+            if self.current_question_index < len(self.questions):
+                return TurnResult(message=await self.get_next_message())
+            return await self._move_to(CallState.SHOW_SLOTS)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            return TurnResult(message=question["question"] + " Please try again.")
+    
+    async def _handle_show_slots(self, response: str) -> TurnResult:
+        return TurnResult(message="Please select a time slot.")
+    
+    async def _handle_confirm_booking(self, response: str) -> TurnResult:
+        if classify(response, "confirm").intent == YES:
+            result = await self._move_to(CallState.END_CALL)
+            result.action = "end"
+            return result
+        
+        await self._transition_to(CallState.SHOW_SLOTS)
+        return TurnResult(message="Let me show you the available slots again.")
+    
+    async def _select_practice_area(self, practice_area: str) -> TurnResult:
+        self.intake_call.practice_area = practice_area
+        await self._transition_to(CallState.PERSONAL_INFO)
+        self._set_current_field("name")
+        return TurnResult(message=await self.get_next_message())
+    
+    async def _move_to(self, new_state: CallState) -> TurnResult:
+        await self._transition_to(new_state)
+        return TurnResult(message=await self.get_next_message())
+    
+    def _set_current_field(self, field: Optional[str]):
+        self.current_field = field
+        self.intake_call.current_field = field
+    
+    async def _create_pending_caller(self, full_name: str, phone: str) -> Caller:
+        caller = await self.unit_of_work.create(
+            Caller,
+            full_name=full_name,
+            phone=phone,
+            email=f"pending_{self.intake_call.twilio_call_sid}@temp.com"
+        )
+        self.intake_call.caller = caller
+        return caller
+    
+    def _load_questions(self):
+        if self.questions:
+            return
+        
+        if self.intake_call.practice_area == "Lemon Law":
+            self.questions = LEMON_LAW_QUESTIONS
+        else:
+            self.questions = PERSONAL_INJURY_QUESTIONS
     
     async def _load_caller_info(self):
-        if self.current_state == CallState.PERSONAL_INFO:
-            self.personal_info = {}
+        if self._caller_loaded:
             return
         
         try:
-            if hasattr(self.intake_call, 'caller_id') and self.intake_call.caller_id:
-                try:
-                    await self.intake_call.fetch_related('caller')
-                    if hasattr(self.intake_call, 'caller') and self.intake_call.caller:
-                        caller = self.intake_call.caller
-                        if hasattr(caller, 'email') and caller.email and 'temp_' not in caller.email and '@temp.com' not in caller.email:
-                            if hasattr(caller, 'full_name') and caller.full_name and caller.full_name not in ["Temporary", "Temporary Caller"]:
-                                self.personal_info["full_name"] = caller.full_name
-                            if hasattr(caller, 'phone') and caller.phone and caller.phone.strip():
-                                self.personal_info["phone"] = caller.phone
-                            if hasattr(caller, 'email') and caller.email and '@temp.com' not in caller.email:
-                                self.personal_info["email"] = caller.email
-                except Exception as fetch_error:
-                    pass
-        except Exception as e:
+            caller = await self._get_caller()
+            if caller and caller.email and 'temp_' not in caller.email:
+                if caller.full_name and caller.full_name not in ["Temporary", "Temporary Caller"]:
+                    self.personal_info.setdefault("full_name", caller.full_name)
+                if caller.phone and caller.phone.strip():
+                    self.personal_info.setdefault("phone", caller.phone)
+                if '@temp.com' not in caller.email:
+                    self.personal_info.setdefault("email", caller.email)
+            self._caller_loaded = True
+        except Exception:
             pass
     
+    async def _get_caller(self) -> Optional[Caller]:
+        caller = getattr(self.intake_call, 'caller', None)
+        if isinstance(caller, Caller):
+            return caller
+        if not self.intake_call.caller_id:
+            return None
+        await self._execute(self.intake_call.fetch_related('caller'))
+        if self.unit_of_work:
+            self.unit_of_work.track(self.intake_call.caller)
+        return self.intake_call.caller
+    
+    async def _execute(self, query: Awaitable) -> Any:
+        if self.unit_of_work:
+            return await self.unit_of_work.execute(query)
+        return await query
+    
+    @asynccontextmanager
+    async def _turn(self):
+        if self.unit_of_work:
+            yield self.unit_of_work
+            return
+        
+        unit_of_work = UnitOfWork()
+        unit_of_work.track(self.intake_call)
+        caller = getattr(self.intake_call, 'caller', None)
+        if isinstance(caller, Caller):
+            unit_of_work.track(caller)
+        
+        self.unit_of_work = unit_of_work
+        try:
+            yield unit_of_work
+        except BaseException:
+            # A failed turn writes nothing. The session is dropped so the
+            # next webhook rebuilds the agent from the saved row.
+            self.unit_of_work = None
+            unit_of_work.discard()
+            self.last_turn_statements = unit_of_work.statements
+            call_sessions.evict(self.intake_call.twilio_call_sid)
+            raise
+        self.unit_of_work = None
+        await unit_of_work.flush()
+        self.last_turn_statements = unit_of_work.statements
+    
     async def _transition_to(self, new_state: CallState):
-        self.current_state = new_state
-        self.intake_call.current_state = new_state.value
-        await self.intake_call.save()
+        old_state = self.current_state
+        if new_state not in TRANSITIONS[old_state]:
+            raise ValueError(f"Invalid transition from {old_state.value} to {new_state.value}")
+        
+        async with self._turn() as unit_of_work:
+            self.current_state = new_state
+            self.intake_call.current_state = new_state.value
+            unit_of_work.after_flush(lambda: self._run_hooks(transition_hooks, old_state, new_state))
+    
+    def _run_hooks(self, hooks: List[Callable], old, new):
+        for hook in hooks:
+            hook(self, old, new)
+    
+    async def offer_slots(self, slots: List[Dict]):
+        # Saved with the call, so a choice that arrives after the session
+        # was rebuilt still resolves against the list the caller heard.
+        async with self._turn():
+            self.offered_slots = SlotChoices(slots)
+            self.intake_call.offered_slots = self.offered_slots.slots
     
     async def end_call(self):
-        self.intake_call.call_status = "completed"
-        await self._transition_to(CallState.END_CALL)
-        await self.intake_call.save()
+        old_status = self.intake_call.call_status
+        async with self._turn() as unit_of_work:
+            self.intake_call.call_status = "completed"
+            await self._transition_to(CallState.END_CALL)
+            if old_status != "completed":
+                unit_of_work.after_flush(lambda: self._run_hooks(status_hooks, old_status, "completed"))
+        await slot_holds.release(self.intake_call.twilio_call_sid)
+        call_sessions.evict(self.intake_call.twilio_call_sid)
+
+STATE_HANDLERS: Dict[CallState, Callable[[VoiceAgent, str], Awaitable[TurnResult]]] = {
+    CallState.GREETING: VoiceAgent._handle_greeting,
+    CallState.PRACTICE_AREA: VoiceAgent._handle_practice_area,
+    CallState.PRACTICE_AREA_CLARIFY: VoiceAgent._handle_practice_area_clarify,
+    CallState.PERSONAL_INFO: VoiceAgent._handle_personal_info,
+    CallState.CONSENT: VoiceAgent._handle_consent,
+    CallState.CASE_QUESTIONS: VoiceAgent._handle_case_questions,
+    CallState.SHOW_SLOTS: VoiceAgent._handle_show_slots,
+    CallState.CONFIRM_BOOKING: VoiceAgent._handle_confirm_booking,
+}
 
+PERSONAL_INFO_HANDLERS: Dict[str, Callable[[VoiceAgent, str], Awaitable[TurnResult]]] = {
+    "name": VoiceAgent._collect_name,
+    "phone": VoiceAgent._collect_phone,
+    "email": VoiceAgent._collect_email,
+    "email_confirm": VoiceAgent._confirm_email,
+}
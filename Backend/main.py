@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from config.database import init_db, close_db
 from routes.intake_routes import router
+import asyncio
 import uvicorn
 
 load_dotenv()
@@ -19,6 +20,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Kind"],
 )
 
 app.include_router(router)
@@ -33,9 +35,46 @@ async def startup_event():
         await init_db()
     except Exception as e:
         pass
+    
+    from helpers.outbox import outbox_worker
+    from helpers.email_templates import email_templates
+    from helpers.stats import dashboard_stats
+    
+    email_templates.load()
+    outbox_worker.start()
+    try:
+        await dashboard_stats.load()
+    except Exception:
+        import traceback
+        traceback.print_exc()
+    app.state.stats_flush_task = asyncio.create_task(
+        dashboard_stats.run_flush_loop(settings.STATS_FLUSH_INTERVAL_SECONDS)
+    )
+    
+    if settings.CALENDAR_SYNC_ENABLED:
+        from helpers.calendar_service import calendar_service
+        
+        app.state.calendar_sync_task = asyncio.create_task(calendar_service.run_sync_loop())
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    from helpers.calendar_service import calendar_service
+    from helpers.outbox import outbox_worker
+    from helpers.smtp_pool import smtp_pool
+    from helpers.stats import dashboard_stats
+    
+    await outbox_worker.stop()
+    await smtp_pool.close()
+    app.state.stats_flush_task.cancel()
+    try:
+        await dashboard_stats.flush()
+    except Exception:
+        import traceback
+        traceback.print_exc()
+    sync_task = getattr(app.state, "calendar_sync_task", None)
+    if sync_task is not None:
+        sync_task.cancel()
+    await calendar_service.close()
     await close_db()
 
 @app.get("/")
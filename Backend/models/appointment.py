@@ -14,6 +14,7 @@ class Appointment(Model):
     appointment_date = fields.DatetimeField()
     appointment_time = fields.TimeField()
     calendar_event_id = fields.CharField(max_length=255, null=True)
+    attorney_calendar_id = fields.CharField(max_length=255, null=True)  # Calendar of the attorney assigned to the slot
     booking_status = fields.CharField(
         max_length=20, 
         default="pending"
@@ -24,6 +25,12 @@ class Appointment(Model):
 
     class Meta:
         table = "appointments"
+        indexes = (
+            ("appointment_date", "id"),
+            ("booking_status", "appointment_date", "id"),
+            ("practice_area", "appointment_date", "id"),
+            ("intake_call", "id"),
+        )
 
     def __str__(self):
         return f"Appointment {self.id} - {self.appointment_date}"
@@ -0,0 +1,22 @@
+"""
+BusyInterval Model - Locally indexed busy time synced from attorney calendars
+"""
+from tortoise.models import Model
+from tortoise import fields
+
+
+class BusyInterval(Model):
+    id = fields.IntField(pk=True)
+    calendar_id = fields.CharField(max_length=255)
+    google_event_id = fields.CharField(max_length=255)
+    start_time = fields.DatetimeField()
+    end_time = fields.DatetimeField()
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "busy_intervals"
+        unique_together = (("calendar_id", "google_event_id"),)
+        indexes = (("calendar_id", "start_time"),)
+
+    def __str__(self):
+        return f"{self.calendar_id} busy {self.start_time} - {self.end_time}"
@@ -18,6 +18,7 @@ class CalendarEvent(Model):
 
     class Meta:
         table = "calendar_events"
+        indexes = (("appointment",),)
 
     def __str__(self):
         return f"Calendar Event {self.google_event_id} - {self.event_title}"
@@ -0,0 +1,19 @@
+"""
+CalendarSyncState Model - Incremental sync progress for each attorney calendar
+"""
+from tortoise.models import Model
+from tortoise import fields
+
+
+class CalendarSyncState(Model):
+    id = fields.IntField(pk=True)
+    calendar_id = fields.CharField(max_length=255, unique=True)
+    sync_token = fields.TextField(null=True)
+    last_synced_at = fields.DatetimeField(null=True)
+    last_full_sync_at = fields.DatetimeField(null=True)
+
+    class Meta:
+        table = "calendar_sync_states"
+
+    def __str__(self):
+        return f"Sync {self.calendar_id} at {self.last_synced_at}"
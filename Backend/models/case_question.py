@@ -12,11 +12,18 @@ class CaseQuestion(Model):
     question_key = fields.CharField(max_length=100)  # e.g., "vehicle_year", "incident_type"
     question_text = fields.TextField()
     answer = fields.TextField()
+    # Typed value parsed from the answer, by question type; null when it could not be parsed
+    answer_date = fields.DateField(null=True)  # "date" questions
+    answer_number = fields.IntField(null=True)  # "number" questions
+    answer_choice = fields.CharField(max_length=50, null=True)  # "yes"/"no"/"unsure", or the option key for "choice"
+    normalized_at = fields.DatetimeField(null=True)  # Set once the answer has been parsed
     practice_area = fields.CharField(max_length=50)
     created_at = fields.DatetimeField(auto_now_add=True)
 
     class Meta:
         table = "case_questions"
+        unique_together = (("intake_call", "question_key"),)
+        indexes = (("question_key", "answer_choice"),)
 
     def __str__(self):
         return f"{self.question_key}: {self.answer[:50]}"
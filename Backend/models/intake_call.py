@@ -28,11 +28,19 @@ class IntakeCall(Model):
         null=True
     )  # Temporary storage for email before confirmation
     consent_to_book = fields.BooleanField(default=False)
+    question_index = fields.IntField(default=0)  # Index of the next unanswered case question
+    offered_slots = fields.JSONField(null=True)  # Slots last read to the caller, in the order they heard them
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
 
     class Meta:
         table = "intake_calls"
+        indexes = (
+            ("created_at", "id"),
+            ("call_status", "created_at", "id"),
+            ("practice_area", "created_at", "id"),
+            ("current_state", "created_at", "id"),
+        )
 
     def __str__(self):
         return f"Call {self.twilio_call_sid} - {self.practice_area}"
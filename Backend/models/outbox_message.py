@@ -0,0 +1,28 @@
+"""
+OutboxMessage Model - Side effects queued in the same transaction as the data they belong to
+"""
+from tortoise.models import Model
+from tortoise import fields
+
+
+class OutboxMessage(Model):
+    id = fields.IntField(pk=True)
+    kind = fields.CharField(max_length=50)  # "calendar_event", "confirmation_email"
+    payload = fields.JSONField(default=dict)
+    idempotency_key = fields.CharField(max_length=255, unique=True)
+    status = fields.CharField(
+        max_length=20,
+        default="pending"
+    )  # "pending", "done", "dead"
+    attempts = fields.IntField(default=0)
+    available_at = fields.DatetimeField()  # Next run; pushed forward while a worker holds the message
+    last_error = fields.TextField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "outbox_messages"
+        indexes = (("status", "available_at"),)
+
+    def __str__(self):
+        return f"Outbox {self.kind} {self.idempotency_key} ({self.status})"
@@ -0,0 +1,22 @@
+"""
+SlotHold Model - Short-lived claim on an offered appointment slot
+"""
+from tortoise.models import Model
+from tortoise import fields
+
+
+class SlotHold(Model):
+    id = fields.IntField(pk=True)
+    calendar_id = fields.CharField(max_length=255)
+    slot_start = fields.DatetimeField()
+    call_sid = fields.CharField(max_length=100, index=True)
+    expires_at = fields.DatetimeField()
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "slot_holds"
+        unique_together = (("calendar_id", "slot_start"),)  # At most one caller holds a slot
+        indexes = (("slot_start", "expires_at"),)
+
+    def __str__(self):
+        return f"{self.calendar_id} {self.slot_start} held by {self.call_sid}"
@@ -0,0 +1,18 @@
+"""
+StatCounter Model - Dashboard counters, kept up to date incrementally and rebuildable from the base tables
+"""
+from tortoise.models import Model
+from tortoise import fields
+
+
+class StatCounter(Model):
+    id = fields.IntField(pk=True)
+    key = fields.CharField(max_length=150, unique=True)  # e.g. "calls.total", "calls.state.CONSENT"
+    value = fields.BigIntField(default=0)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "stat_counters"
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
@@ -0,0 +1,26 @@
+"""
+Recount the dashboard counters (stat_counters) from the calls and appointments tables.
+
+    python rebuild_stats.py
+"""
+import asyncio
+import json
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.database import init_db, close_db
+from helpers.stats import dashboard_stats
+
+
+async def main():
+    await init_db()
+    try:
+        await dashboard_stats.rebuild()
+        print(json.dumps(dashboard_stats.snapshot()), flush=True)
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
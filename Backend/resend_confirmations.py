@@ -0,0 +1,44 @@
+"""
+Resend confirmation emails that never went out (e.g. after an SMTP outage).
+
+    python resend_confirmations.py
+    python resend_confirmations.py --practice-area "Lemon Law" --since 2026-10-01
+    python resend_confirmations.py --id 12 --id 15
+"""
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.database import init_db, close_db
+from helpers.email_service import resend_confirmation_emails
+from helpers.smtp_pool import smtp_pool
+from helpers.stats import dashboard_stats
+
+
+async def main(args):
+    await init_db()
+    try:
+        async for update in resend_confirmation_emails(
+            appointment_ids=args.id,
+            practice_area=args.practice_area,
+            start_date=args.since,
+            end_date=args.until
+        ):
+            print(json.dumps(update), flush=True)
+    finally:
+        await smtp_pool.close()
+        await dashboard_stats.flush()
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resend unsent appointment confirmation emails")
+    parser.add_argument("--id", type=int, action="append", help="Only this appointment id (repeatable)")
+    parser.add_argument("--practice-area", help="Only appointments in this practice area")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Appointments on or after this date")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Appointments before this date")
+    asyncio.run(main(parser.parse_args()))
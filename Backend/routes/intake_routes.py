@@ -1,15 +1,28 @@
-from fastapi import APIRouter, Request, Form, HTTPException
-from typing import Optional
+from fastapi import APIRouter, Request, Form, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Optional
+import asyncio
+import hashlib
+import json
 import os
 from models.intake_call import IntakeCall
 from models.appointment import Appointment
-from models.caller import Caller
+from models.case_question import CaseQuestion
 from controllers.twilio_controller import (
     handle_caller_response,
     handle_slot_selection
 )
 from helpers.calendar_service import calendar_service
-from helpers.email_service import send_confirmation_email
+from helpers.call_events import call_events
+from helpers.call_export import EXPORT_MEDIA_TYPES, export_rows, export_stream
+from helpers.stats import dashboard_stats
+from helpers.slot_holds import slot_holds
+from helpers.email_service import send_confirmation_email, resend_confirmation_emails
+from helpers.pagination import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_KIND_HEADER,
+    count_rows, encode_cursor, keyset_page
+)
+from config.settings import settings
 from datetime import datetime, timedelta
 
 router = APIRouter(prefix="/api", tags=["intake"])
@@ -33,29 +46,32 @@ async def twilio_webhook(request: Request):
 
         from models.intake_call import IntakeCall
         from models.caller import Caller
-        from helpers.voice_agent import CallState
+        from helpers.voice_agent import VoiceAgent, CallState
+        from helpers.call_session import call_sessions
         from tortoise.exceptions import IntegrityError, DoesNotExist, TransactionManagementError
 
-        try:
-            intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
-        except (DoesNotExist, TransactionManagementError):
-            temp_caller, _ = await Caller.get_or_create(
-                email=f"temp_{call_sid}@temp.com",
-                defaults={
-                    "full_name": "Temporary",
-                    "phone": from_number or ""
-                }
-            )
-            intake_call, _ = await IntakeCall.get_or_create(
-                twilio_call_sid=call_sid,
-                defaults={
-                    "caller": temp_caller,
-                    "call_status": "in_progress",
-                    "current_state": CallState.GREETING.value,
-                    "practice_area": "",
-                    "consent_to_book": False
-                }
-            )
+        if call_sessions.get(call_sid) is None:
+            try:
+                intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
+            except (DoesNotExist, TransactionManagementError):
+                temp_caller, _ = await Caller.get_or_create(
+                    email=f"temp_{call_sid}@temp.com",
+                    defaults={
+                        "full_name": "Temporary",
+                        "phone": from_number or ""
+                    }
+                )
+                intake_call, _ = await IntakeCall.get_or_create(
+                    twilio_call_sid=call_sid,
+                    defaults={
+                        "caller": temp_caller,
+                        "call_status": "in_progress",
+                        "current_state": CallState.GREETING.value,
+                        "practice_area": "",
+                        "consent_to_book": False
+                    }
+                )
+            call_sessions.put(call_sid, VoiceAgent(intake_call))
         resp = VoiceResponse()
         from config.settings import settings
         base_url = settings.APP_URL.rstrip('/')
@@ -125,22 +141,26 @@ async def twilio_handle_transfer_response(request: Request, call_sid: str):
     from twilio.twiml.voice_response import VoiceResponse
     from models.intake_call import IntakeCall
     from helpers.voice_agent import VoiceAgent, CallState
+    from helpers.call_session import call_sessions
+    from helpers.intents import classify, TRANSFER, MESSAGE
     
     try:
         form = await request.form()
-        speech_result = form.get("SpeechResult", "").lower()
+        intent = classify(form.get("SpeechResult", ""), "transfer").intent
         
-        intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
-        agent = VoiceAgent(intake_call)
+        agent = call_sessions.get(call_sid)
+        if agent is None:
+            intake_call = await IntakeCall.get(twilio_call_sid=call_sid)
+            agent = VoiceAgent(intake_call)
         
         response = VoiceResponse()
         
-        if "transfer" in speech_result or "speak" in speech_result or "human" in speech_result:
+        if intent == TRANSFER:
             response.say("I'll transfer you to a human representative now. Please hold.", voice='alice')
             response.say("I'm sorry, but I cannot transfer you at this time. Please call back during business hours to speak with someone.", voice='alice')
             await agent.end_call()
             response.hangup()
-        elif "message" in speech_result or "leave" in speech_result:
+        elif intent == MESSAGE:
             response.say("I've noted your information and someone will call you back soon. Thank you for calling.", voice='alice')
             await agent.end_call()
             response.hangup()
@@ -165,38 +185,181 @@ async def twilio_handle_transfer_response(request: Request, call_sid: str):
         return Response(content=str(response), media_type="application/xml")
 
 
+def _sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+@router.get("/calls/events")
+async def stream_call_events(call_id: Optional[int] = None):
+    # Server-Sent Events: one "state" event per call transition, for one call
+    # or (without call_id) for every call.
+    snapshot = None
+    if call_id is not None:
+        snapshot = await IntakeCall.filter(id=call_id).first().values(
+            "twilio_call_sid", "current_state", "call_status", "practice_area", call_id="id"
+        )
+        if not snapshot:
+            raise HTTPException(status_code=404, detail="Call not found")
+    
+    subscription = call_events.subscribe(call_id)
+    
+    async def stream():
+        try:
+            if snapshot:
+                yield _sse("snapshot", snapshot)
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), settings.CALL_EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse("state", event, event["seq"])
+        finally:
+            call_events.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+_CALL_DETAIL_FIELDS = dict(
+    caller_id="caller__id",
+    caller_name="caller__full_name",
+    caller_email="caller__email",
+    caller_phone="caller__phone",
+)
+_CASE_ANSWER_COLUMNS = (
+    "question_key", "question_text", "answer",
+    "answer_date", "answer_number", "answer_choice",
+)
+_CALL_APPOINTMENT_FIELDS = dict(
+    event_id="calendar_event__google_event_id",
+    event_title="calendar_event__event_title",
+    event_start="calendar_event__start_time",
+    event_end="calendar_event__end_time",
+)
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def _call_detail_response(call: dict, answers: List[dict], appointment: Optional[dict]) -> dict:
+    return {
+        "id": call["id"],
+        "twilio_call_sid": call["twilio_call_sid"],
+        "practice_area": call["practice_area"],
+        "call_status": call["call_status"],
+        "current_state": call["current_state"],
+        "consent_to_book": call["consent_to_book"],
+        "created_at": call["created_at"].isoformat(),
+        "updated_at": call["updated_at"].isoformat(),
+        "caller": {
+            "id": call["caller_id"],
+            "name": call["caller_name"],
+            "email": call["caller_email"],
+            "phone": call["caller_phone"],
+        } if call["caller_id"] is not None else None,
+        "case_answers": [
+            dict(answer, answer_date=_isoformat(answer["answer_date"])) for answer in answers
+        ],
+        "appointment": dict(
+            _appointment_response(appointment),
+            calendar_event={
+                "google_event_id": appointment["event_id"],
+                "title": appointment["event_title"],
+                "start_time": _isoformat(appointment["event_start"]),
+                "end_time": _isoformat(appointment["event_end"]),
+            } if appointment["event_id"] else None
+        ) if appointment else None,
+    }
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/calls/{call_id}")
-async def get_call_details(call_id: int):
-    try:
-        call = await IntakeCall.get(id=call_id)
-        return {
-            "id": call.id,
-            "twilio_call_sid": call.twilio_call_sid,
-            "practice_area": call.practice_area,
-            "call_status": call.call_status,
-            "current_state": call.current_state,
-            "consent_to_book": call.consent_to_book,
-            "created_at": call.created_at.isoformat()
-        }
-    except:
+async def get_call_details(call_id: int, request: Request):
+    # The call with its caller, answers in the order they were asked, and
+    # the latest appointment with its calendar event: three queries, the
+    # to-one relations joined in. They are independent, so they run
+    # concurrently.
+    call, answers, appointment = await asyncio.gather(
+        IntakeCall.filter(id=call_id).first().values(*_CALL_COLUMNS, "updated_at", **_CALL_DETAIL_FIELDS),
+        CaseQuestion.filter(intake_call_id=call_id).order_by("id").values(*_CASE_ANSWER_COLUMNS),
+        Appointment.filter(intake_call_id=call_id).order_by("-id").first().values(
+            *_APPOINTMENT_COLUMNS, **_APPOINTMENT_FIELDS, **_CALL_APPOINTMENT_FIELDS
+        ),
+    )
+    if not call:
         raise HTTPException(status_code=404, detail="Call not found")
 
+    # The ETag is a hash of the body, so it changes with anything shown,
+    # including answers normalized later by the backfill.
+    body = json.dumps(_call_detail_response(call, answers, appointment)).encode()
+    headers = {"ETag": _etag(body), "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+_CALL_COLUMNS = (
+    "id", "twilio_call_sid", "practice_area", "call_status",
+    "current_state", "consent_to_book", "created_at",
+)
+
 
 @router.get("/calls")
-async def list_calls():
-    calls = await IntakeCall.all().order_by("-created_at")
-    return [
-        {
-            "id": call.id,
-            "twilio_call_sid": call.twilio_call_sid,
-            "practice_area": call.practice_area,
-            "call_status": call.call_status,
-            "current_state": call.current_state,
-            "consent_to_book": call.consent_to_book,
-            "created_at": call.created_at.isoformat(),
-        }
-        for call in calls
-    ]
+async def list_calls(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    call_status: Optional[str] = None,
+    practice_area: Optional[str] = None,
+    current_state: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    count: Optional[str] = Query(None, pattern="^(exact|estimate)$")
+):
+    query = IntakeCall.all()
+    if call_status:
+        query = query.filter(call_status=call_status)
+    if practice_area:
+        query = query.filter(practice_area=practice_area)
+    if current_state:
+        query = query.filter(current_state=current_state)
+    if start_date:
+        query = query.filter(created_at__gte=start_date)
+    if end_date:
+        query = query.filter(created_at__lt=end_date)
+    
+    if count:
+        total, kind = await count_rows(query, estimate=count == "estimate")
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+        response.headers[TOTAL_COUNT_KIND_HEADER] = kind
+    
+    try:
+        page = keyset_page(query, "created_at", cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    rows = await page.values(*_CALL_COLUMNS)
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return [dict(row, created_at=row["created_at"].isoformat()) for row in rows]
 
 
 @router.get("/calls/{call_id}/state")
@@ -212,58 +375,106 @@ async def get_call_state(call_id: int):
         raise HTTPException(status_code=404, detail="Call not found")
 
 
+@router.get("/stats")
+async def get_stats():
+    return dashboard_stats.snapshot()
+
+
 @router.get("/calendar/availability")
-async def get_availability(days_ahead: int = 14):
+async def get_availability(days_ahead: int = 14, practice_area: Optional[str] = None):
     start_date = datetime.now() + timedelta(days=1)
     end_date = start_date + timedelta(days=days_ahead)
-    slots = await calendar_service.get_available_slots(start_date, end_date)
-    return {"available_slots": slots}
+    held = await slot_holds.held_slots(start_date, end_date)
+    slots = await calendar_service.get_available_slots(start_date, end_date, practice_area=practice_area, held=held)
+    return {"available_slots": slots, "index": calendar_service.get_index_status(practice_area)}
+
+
+def _appointment_response(row: dict) -> dict:
+    return {
+        "id": row["id"],
+        "caller": {
+            "name": row["caller_name"],
+            "email": row["caller_email"],
+            "phone": row["caller_phone"],
+        },
+        "practice_area": row["practice_area"],
+        "appointment_date": row["appointment_date"].isoformat(),
+        "appointment_time": row["appointment_time"].isoformat(),
+        "booking_status": row["booking_status"],
+        "confirmation_email_sent": row["confirmation_email_sent"],
+    }
+
+
+_APPOINTMENT_FIELDS = dict(
+    caller_name="caller__full_name",
+    caller_email="caller__email",
+    caller_phone="caller__phone",
+)
+_APPOINTMENT_COLUMNS = (
+    "id", "practice_area", "appointment_date", "appointment_time",
+    "booking_status", "confirmation_email_sent",
+)
 
 
 @router.get("/appointments")
-async def list_appointments():
-    appointments = await Appointment.all().order_by("-appointment_date")
-    result = []
-    for appointment in appointments:
-        caller = await Caller.get(id=appointment.caller_id)
-        result.append(
-            {
-                "id": appointment.id,
-                "caller": {
-                    "name": caller.full_name,
-                    "email": caller.email,
-                    "phone": caller.phone,
-                },
-                "practice_area": appointment.practice_area,
-                "appointment_date": appointment.appointment_date.isoformat(),
-                "appointment_time": appointment.appointment_time.isoformat(),
-                "booking_status": appointment.booking_status,
-                "confirmation_email_sent": appointment.confirmation_email_sent,
-            }
-        )
-    return result
+async def list_appointments(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    status: Optional[str] = None,
+    practice_area: Optional[str] = None
+):
+    query = Appointment.all()
+    if start_date:
+        query = query.filter(appointment_date__gte=start_date)
+    if end_date:
+        query = query.filter(appointment_date__lt=end_date)
+    if status:
+        query = query.filter(booking_status=status)
+    if practice_area:
+        query = query.filter(practice_area=practice_area)
+    
+    try:
+        page = keyset_page(query, "appointment_date", cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Callers come back in the same query through the join.
+    rows = await page.values(*_APPOINTMENT_COLUMNS, **_APPOINTMENT_FIELDS)
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1]["appointment_date"], rows[-1]["id"])
+    return [_appointment_response(row) for row in rows]
 
 
 @router.get("/appointments/{appointment_id}")
 async def get_appointment(appointment_id: int):
-    try:
-        appointment = await Appointment.get(id=appointment_id)
-        caller = await Caller.get(id=appointment.caller_id)
-        return {
-            "id": appointment.id,
-            "caller": {
-                "name": caller.full_name,
-                "email": caller.email,
-                "phone": caller.phone
-            },
-            "practice_area": appointment.practice_area,
-            "appointment_date": appointment.appointment_date.isoformat(),
-            "appointment_time": appointment.appointment_time.isoformat(),
-            "booking_status": appointment.booking_status,
-            "confirmation_email_sent": appointment.confirmation_email_sent
-        }
-    except:
+    row = await Appointment.filter(id=appointment_id).first().values(*_APPOINTMENT_COLUMNS, **_APPOINTMENT_FIELDS)
+    if not row:
         raise HTTPException(status_code=404, detail="Appointment not found")
+    return _appointment_response(row)
+
+
+@router.get("/export/calls")
+async def export_calls(
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet)$"),
+    practice_area: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    chunks = export_rows(practice_area, start_date, end_date, batch_size=settings.EXPORT_BATCH_SIZE)
+    try:
+        stream = export_stream(format, chunks)
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    filename = f"calls-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{format}"
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 
 @router.post("/email/send-confirmation")
@@ -277,3 +488,17 @@ async def send_email_confirmation(appointment_id: int):
             raise HTTPException(status_code=500, detail="Failed to send email")
     except:
         raise HTTPException(status_code=404, detail="Appointment not found")
+
+
+@router.post("/email/resend-confirmations")
+async def resend_email_confirmations(
+    appointment_ids: Optional[List[int]] = Query(None),
+    practice_area: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    async def progress():
+        async for update in resend_confirmation_emails(appointment_ids, practice_area, start_date, end_date):
+            yield json.dumps(update) + "\n"
+    
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
@@ -0,0 +1,55 @@
+"""
+Generated freebusy responses, and the per-slot loop CalendarService used
+before the sweep engine, kept as the reference the engine must agree with.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+
+def busy_periods(start: datetime, end: datetime, count: int, rng: random.Random) -> List[Dict]:
+    # Random, possibly overlapping meetings, some starting before the window.
+    periods = []
+    window_minutes = int((end - start).total_seconds() // 60)
+    for _ in range(count):
+        busy_start = start + timedelta(minutes=rng.randint(-600, window_minutes))
+        busy_end = busy_start + timedelta(minutes=rng.randint(5, 600))
+        periods.append({"start": busy_start.isoformat() + "Z", "end": busy_end.isoformat() + "Z"})
+    return periods
+
+
+def packed_calendar(start: datetime, days: int, rng: random.Random) -> List[Dict]:
+    # A busy attorney: back-to-back meetings with short gaps for the whole window.
+    periods = []
+    current = start
+    end = start + timedelta(days=days)
+    while current < end:
+        current += timedelta(minutes=rng.randint(10, 90))
+        periods.append({
+            "start": current.isoformat() + "Z",
+            "end": (current + timedelta(minutes=rng.randint(15, 60))).isoformat() + "Z",
+        })
+    return periods
+
+
+def legacy_free_slots(start: datetime, end: datetime, busy: List[Dict], duration_minutes: int = 30, limit: int = 10) -> List[datetime]:
+    # The pre-sweep loop: every 30-minute step between 9 and 17 re-parses
+    # and checks every busy period.
+    available = []
+    current = start
+    while current < end:
+        if 9 <= current.hour < 17:
+            is_available = True
+            slot_end = current + timedelta(minutes=duration_minutes)
+            for period in busy:
+                busy_start = datetime.fromisoformat(period["start"].replace("Z", "+00:00")).replace(tzinfo=None)
+                busy_end = datetime.fromisoformat(period["end"].replace("Z", "+00:00")).replace(tzinfo=None)
+                if current < busy_end and slot_end > busy_start:
+                    is_available = False
+                    break
+            if is_available:
+                available.append(current)
+        current += timedelta(minutes=30)
+        if current.hour >= 17:
+            current = current.replace(hour=9, minute=0) + timedelta(days=1)
+    return available[:limit]
@@ -0,0 +1,60 @@
+import pytest
+from tortoise import Tortoise
+from config.database import TORTOISE_ORM
+from config.settings import settings
+from helpers import email_service
+from helpers.calendar_service import CalendarService
+from helpers.smtp_pool import SMTPPool
+from tests.fake_google_calendar import FakeCredentials, FakeGoogleCalendar
+from tests.fake_smtp_server import FakeSMTPServer
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_calendar():
+    fake = FakeGoogleCalendar()
+    url = fake.start()
+    yield fake, url
+    fake.stop()
+
+
+@pytest.fixture
+async def calendar(fake_calendar, monkeypatch):
+    fake, url = fake_calendar
+    monkeypatch.setattr(settings, "GOOGLE_CALENDAR_API_URL", url)
+    service = CalendarService()
+    service.credentials = FakeCredentials()
+    yield service
+    await service.close()
+
+
+@pytest.fixture
+async def db():
+    await Tortoise.init(config=dict(TORTOISE_ORM, connections={"default": "sqlite://:memory:"}))
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
+
+
+@pytest.fixture
+def smtp_server():
+    fake = FakeSMTPServer()
+    port = fake.start()
+    yield fake, port
+    fake.stop()
+
+
+@pytest.fixture
+async def mail(db, smtp_server, monkeypatch):
+    # Confirmation emails go to the local SMTP server.
+    fake, port = smtp_server
+    pool = SMTPPool("127.0.0.1", port, use_tls=False, timeout=5)
+    monkeypatch.setattr(email_service, "smtp_pool", pool)
+    monkeypatch.setattr(settings, "SENDER_EMAIL", "intake@example.com")
+    monkeypatch.setattr(settings, "SENDER_PASSWORD", "secret")
+    yield fake, pool
+    await pool.close()
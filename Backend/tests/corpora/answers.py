@@ -0,0 +1,64 @@
+"""
+Case-question answers as the speech recognizer hands them over, with the
+typed value we expect to store for the question's type: a date, a number,
+or the yes/no/unsure or option key (None: nothing could be parsed).
+Relative dates are read against REFERENCE, the day the answer was given.
+"""
+from datetime import date
+
+REFERENCE = date(2024, 6, 15)
+
+ANSWER_CORPUS = [
+    ("incident_date", "March third twenty twenty three", date(2023, 3, 3)),
+    ("incident_date", "the 21st of January 2024", date(2024, 1, 21)),
+    ("incident_date", "2023-11-05", date(2023, 11, 5)),
+    ("incident_date", "11/05/2023", date(2023, 11, 5)),
+    ("incident_date", "in July", date(2023, 7, 1)),
+    ("incident_date", "yesterday", date(2024, 6, 14)),
+    ("incident_date", "two weeks ago", date(2024, 6, 1)),
+    ("incident_date", "about three months ago", date(2024, 3, 15)),
+    ("incident_date", "last month", date(2024, 5, 15)),
+    ("incident_date", "I may have forgotten", None),
+    ("purchase_date", "August twenty twenty two", date(2022, 8, 1)),
+    ("purchase_date", "a year ago", date(2023, 6, 15)),
+    ("purchase_date", "I don't remember", None),
+    ("repair_attempts", "three", 3),
+    ("repair_attempts", "twenty three", 23),
+    ("repair_attempts", "maybe 4 times", 4),
+    ("repair_attempts", "twice", 2),
+    ("repair_attempts", "none", 0),
+    ("days_in_shop", "one hundred and twenty", 120),
+    ("days_in_shop", "about forty five days", 45),
+    ("days_in_shop", "a couple", 2),
+    ("days_in_shop", "I'm not sure", None),
+    ("medical_treatment", "yes I did", "yes"),
+    ("medical_treatment", "no I didn't", "no"),
+    ("medical_treatment", "I do not know", "unsure"),
+    ("has_invoices", "I do", "yes"),
+    ("has_invoices", "we did not", "no"),
+    ("police_report", "it was not", "no"),
+    ("police_report", "not sure", "unsure"),
+    ("police_report", "I don't remember", "unsure"),
+    ("incident_type", "I slipped on ice", "slip_and_fall"),
+    ("incident_type", "rear ended at a light", "car_accident"),
+    ("incident_type", "something else", "other"),
+    ("incident_type", "hmm", None),
+    ("insurance_involved", "my insurance", "own"),
+    ("insurance_involved", "the other driver's", "other_party"),
+    ("insurance_involved", "both of them", "both"),
+    ("insurance_involved", "I don't know", "unsure"),
+    ("incident_location", "Austin Texas", None),
+    ("vehicle_details", "2019 Honda Civic", None),
+]
+
+SPOKEN_NUMBER_CORPUS = [
+    ("twenty three", [23]),
+    ("one hundred and twenty", [120]),
+    ("two thousand and five", [2005]),
+    ("twenty twenty three", [2023]),
+    ("nineteen ninety nine", [1999]),
+    ("three 4 five", [3, 4, 5]),
+    ("March 3rd", ["march", 3]),
+    ("the twenty first", ["the", 21]),
+    ("I do not know", ["i", "do", "not", "know"]),
+]
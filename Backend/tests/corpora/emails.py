@@ -0,0 +1,79 @@
+"""
+Email addresses as the speech recognizer transcribes them: spelled
+letters, recognizer punctuation, "at the rate", provider misspellings and
+replies with no address (expected None).
+"""
+
+EMAIL_CORPUS = [
+    ("john dot smith at gmail dot com", "john.smith@gmail.com"),
+    ("John.Smith@gmail.com.", "john.smith@gmail.com"),
+    ("john.smith@gmail.com", "john.smith@gmail.com"),
+    ("My email is john smith at gmail dot com", "johnsmith@gmail.com"),
+    ("my email address is sarah at yahoo dot com", "sarah@yahoo.com"),
+    ("It's sarah underscore lee at yahoo dot com.", "sarah_lee@yahoo.com"),
+    ("sarah_lee@yahoo.com", "sarah_lee@yahoo.com"),
+    ("J O H N at gmail.com", "john@gmail.com"),
+    ("j, o, h, n at gmail dot com", "john@gmail.com"),
+    ("mike123 at hotmail dot com", "mike123@hotmail.com"),
+    ("mike one two three at hotmail dot com", "mike123@hotmail.com"),
+    ("jane at the rate gmail dot com", "jane@gmail.com"),
+    ("Jane at the rate of gmail.com", "jane@gmail.com"),
+    ("jane at rate gmail dot com", "jane@gmail.com"),
+    ("Robert. Brown at outlook.com.", "robert.brown@outlook.com"),
+    ("robert dash brown at company dot co dot uk", "robert-brown@company.co.uk"),
+    ("robert hyphen brown at company dot org", "robert-brown@company.org"),
+    ("a dot b at gmail dot con", "a.b@gmail.com"),
+    ("john at gmail", "john@gmail.com"),
+    ("john at g mail dot com", "john@gmail.com"),
+    ("tom at gmail.com.com", "tom@gmail.com"),
+    ("Yes, it's tom at gmail dot com.", "tom@gmail.com"),
+    ("yeah my email is tom at aol dot com", "tom@aol.com"),
+    ("email address is tom at aol dot com", "tom@aol.com"),
+    ("my e-mail is tom at aol dot com", "tom@aol.com"),
+    ("Tom@AOL.com", "tom@aol.com"),
+    ("tom at icloud dot com", "tom@icloud.com"),
+    ("tom at icloud", "tom@icloud.com"),
+    ("lisa point ray at outlook dot com", "lisa.ray@outlook.com"),
+    ("lisa period ray at outlook dot com", "lisa.ray@outlook.com"),
+    ("anna double n at gmail dot com", "annann@gmail.com"),
+    ("k e v i n dot l e e at yahoo dot com", "kevin.lee@yahoo.com"),
+    ("kevin lee 1985 at yahoo dot com", "kevinlee1985@yahoo.com"),
+    ("kevin plus law at gmail dot com", "kevin+law@gmail.com"),
+    ("um it's uh dave at hotmail dot com", "dave@hotmail.com"),
+    ("dave at hot mail dot com", "dave@hotmail.com"),
+    ("dave at out look dot com", "dave@outlook.com"),
+    ("Dave at Gmail dot com?", "dave@gmail.com"),
+    ("dave at gmailcom.com", "dave@gmail.com"),
+    ("capital D dave at gmail dot com", "ddave@gmail.com"),
+    ("maria gonzalez at law firm dot com", "mariagonzalez@lawfirm.com"),
+    ("maria at smith and jones dot com", "maria@smithjones.com"),
+    ("info at my company dot net", "info@company.net"),
+    ("peter at example dot net dot net", "peter@example.net"),
+    ("peter at example.org.org", "peter@example.org"),
+    ("p e t e r at example dot io", "peter@example.io"),
+    ("I don't have an email", None),
+    ("no", None),
+    ("at", None),
+    ("gmail dot com", None),
+    ("", None),
+    ("my email is at gmail dot com", None),
+    ("john smith", None),
+    ("chris at gee mail dot com", "chris@gmail.com"),
+    ("chris at the rate yahoo dot com", "chris@yahoo.com"),
+    ("chris underscore 77 at yahoo dot com", "chris_77@yahoo.com"),
+    ("chris seven seven at yahoo dot com", "chris77@yahoo.com"),
+    ("Chris.Evans77@Yahoo.com", "chris.evans77@yahoo.com"),
+    ("it is chris at yahoo dot com", "chris@yahoo.com"),
+    ("the email is chris at yahoo dot com", "chris@yahoo.com"),
+    ("matt at att dot net", "matt@att.net"),
+    ("pat at gmail dot com", "pat@gmail.com"),
+    ("sam at sam dot com", "sam@sam.com"),
+    ("Sam at Sam.com.", "sam@sam.com"),
+    ("nina under score west at gmail dot com", "nina_west@gmail.com"),
+    ("n i n a at g m a i l dot com", "nina@gmail.com"),
+    ("zoe at proton mail dot com", "zoe@protonmail.com"),
+    ("zoe at protonmail dot me", "zoe@protonmail.me"),
+    ("zoe at yahoo", "zoe@yahoo.com"),
+    ("zoe at hotmail", "zoe@hotmail.com"),
+    ("zoe at outlook", "zoe@outlook.com"),
+]
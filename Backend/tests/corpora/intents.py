@@ -0,0 +1,42 @@
+"""
+Caller replies with the vocabulary of the prompt they answer and the
+intent we expect (None: ask again). Includes the words that fooled the
+old substring checks ("know" is not "no", "book" is not "ok").
+"""
+from helpers.intents import LEMON_LAW, MESSAGE, NO, PERSONAL_INJURY, TRANSFER, UNSURE, YES
+
+INTENT_CORPUS = [
+    ("consent", "yes please", YES),
+    ("consent", "sure go ahead", YES),
+    ("consent", "I don't know", None),
+    ("consent", "no not right now", NO),
+    ("consent", "maybe later", NO),
+    ("consent", "okay", YES),
+    ("consent", "I want to book", None),
+    ("consent", "I know", None),
+    ("confirm", "yes that's correct", YES),
+    ("confirm", "that is not correct", NO),
+    ("confirm", "nope wrong", NO),
+    ("confirm", "that's right", YES),
+    ("confirm", "um", None),
+    ("confirm", "not right", NO),
+    ("transfer", "I'd like to speak to a human", TRANSFER),
+    ("transfer", "leave a message", MESSAGE),
+    ("transfer", "have someone call me back", MESSAGE),
+    ("transfer", "what", None),
+    ("practice_area", "lemon law", LEMON_LAW),
+    ("practice_area", "personal injury", PERSONAL_INJURY),
+    ("practice_area", "I was in a car accident", PERSONAL_INJURY),
+    ("practice_area", "uh okay lemon", LEMON_LAW),
+    ("practice_area", "hello", None),
+    ("practice_area_clarify", "my car keeps breaking it's a defect", LEMON_LAW),
+    ("practice_area_clarify", "I got injured", PERSONAL_INJURY),
+    ("answer_yes_no", "yes I did", YES),
+    ("answer_yes_no", "I do", YES),
+    ("answer_yes_no", "no", NO),
+    ("answer_yes_no", "it was not", NO),
+    ("answer_yes_no", "we did not", NO),
+    ("answer_yes_no", "not sure", UNSURE),
+    ("answer_yes_no", "I do not know", UNSURE),
+    ("answer_yes_no", "I don't remember", UNSURE),
+]
@@ -0,0 +1,30 @@
+"""
+Spoken phone numbers as the speech recognizer hands them over, with the
+E.164 number we expect to store (None: nothing should be extracted).
+Default region is PK.
+"""
+
+PHONE_CORPUS = [
+    ("five five five one two three four five six seven", "+925551234567"),
+    ("0333 1234567", "+923331234567"),
+    ("my number is zero three three three one two three four five six seven", "+923331234567"),
+    ("plus nine two three three three one two three four five six seven", "+923331234567"),
+    ("+92 333 1234567", "+923331234567"),
+    ("923331234567", "+923331234567"),
+    ("plus one five five five one two three four five six seven", "+15551234567"),
+    ("+1 (555) 123-4567", "+15551234567"),
+    ("double three three one two three four five six seven zero", None),
+    ("zero three double three one two three four five six seven", "+923331234567"),
+    ("oh three three three triple one two three four five six", None),
+    ("zero three three three one two three four five six seven", "+923331234567"),
+    ("0 triple three one two three four five six seven", "+923331234567"),
+    ("zero three oh oh one two three four five six seven", "+923001234567"),
+    ("plus four four seven nine one one one two three four five six", "+447911123456"),
+    ("double oh four four seven nine one one one two three four five six", "+447911123456"),
+    ("five five five twelve thirty four fifty six seven", "+925551234567"),
+    ("John Smith", None),
+    ("one two three", None),
+    ("my name is john", None),
+    ("", None),
+    ("yes it's 0300 1234567", "+923001234567"),
+]
@@ -0,0 +1,91 @@
+"""
+Local stand-in for the Google Calendar REST endpoints CalendarService uses
+(freeBusy, events.insert, events.list), served over real HTTP so the
+httpx client, connection pool and timeouts are exercised end to end.
+"""
+import asyncio
+import socket
+import threading
+import time
+from typing import Dict, List
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+
+
+class FakeGoogleCalendar:
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.busy: Dict[str, List[Dict]] = {}
+        self.events: Dict[str, Dict[str, Dict]] = {}
+        self.requests: List[Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = self._build_app()
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def record(request: Request, call_next):
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.latency_seconds)
+                return await call_next(request)
+            finally:
+                self.in_flight -= 1
+
+        @app.post("/freeBusy")
+        async def free_busy(request: Request):
+            body = await request.json()
+            return {
+                "calendars": {
+                    item["id"]: {"busy": self.busy.get(item["id"], [])}
+                    for item in body["items"]
+                }
+            }
+
+        @app.post("/calendars/{calendar_id}/events")
+        async def insert_event(calendar_id: str, request: Request):
+            event = await request.json()
+            events = self.events.setdefault(calendar_id, {})
+            event_id = event.get("id") or f"evt{len(events) + 1}"
+            if event_id in events:
+                raise HTTPException(status_code=409, detail="duplicate")
+            events[event_id] = dict(event, id=event_id, status="confirmed")
+            return events[event_id]
+
+        @app.get("/calendars/{calendar_id}/events")
+        async def list_events(calendar_id: str, maxResults: int = 250, pageToken: str = "0"):
+            items = list(self.events.get(calendar_id, {}).values())
+            start = int(pageToken)
+            page = {"items": items[start:start + maxResults]}
+            if start + maxResults < len(items):
+                page["nextPageToken"] = str(start + maxResults)
+            else:
+                page["nextSyncToken"] = f"sync-{len(items)}"
+            return page
+
+        return app
+
+    def start(self) -> str:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        self._server = uvicorn.Server(uvicorn.Config(self.app, host="127.0.0.1", port=port, log_level="error"))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return f"http://127.0.0.1:{port}"
+
+    def stop(self):
+        self._server.should_exit = True
+        self._thread.join()
+
+
+class FakeCredentials:
+    valid = True
+    token = "test-token"
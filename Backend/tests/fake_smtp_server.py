@@ -0,0 +1,82 @@
+"""
+Local SMTP server on aiosmtpd for SMTPPool tests and benchmarks. It records
+every connection and message, can refuse recipients, can drop every open
+connection as a restarting server would, and can delay each reply to stand
+in for a network round trip.
+"""
+import asyncio
+import socket
+from typing import List
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP
+
+
+class _RecordingSMTP(SMTP):
+
+    def __init__(self, fake: "FakeSMTPServer", *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fake = fake
+
+    def connection_made(self, transport):
+        self.fake.transports.append(transport)
+        self.fake.connections += 1
+        super().connection_made(transport)
+
+    async def push(self, status: str):
+        await asyncio.sleep(self.fake.latency_seconds)
+        await super().push(status)
+
+    async def smtp_NOOP(self, arg: str):
+        self.fake.noops += 1
+        await super().smtp_NOOP(arg)
+
+
+class _Handler:
+
+    def __init__(self, fake: "FakeSMTPServer"):
+        self.fake = fake
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith("@refused.example"):
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.fake.messages.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+class FakeSMTPServer:
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.connections = 0
+        self.noops = 0
+        self.messages = []
+        self.transports: List[asyncio.Transport] = []
+
+    def start(self) -> int:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        fake = self
+
+        class _Controller(Controller):
+            def factory(self):
+                return _RecordingSMTP(fake, self.handler, **self.SMTP_kwargs)
+
+        self._controller = _Controller(_Handler(self), hostname="127.0.0.1", port=port)
+        self._controller.start()
+        # start() opens one connection of its own to check the server is up.
+        self.connections = 0
+        return port
+
+    def drop_connections(self):
+        def close_all():
+            for transport in self.transports:
+                transport.close()
+        self._controller.loop.call_soon_threadsafe(close_all)
+
+    def stop(self):
+        self._controller.stop()
@@ -0,0 +1,47 @@
+"""
+Seeds calls with callers, personal-injury answers and appointments in
+bulk, for export tests and benchmarks.
+"""
+from datetime import datetime, time, timedelta, timezone
+from config.personal_injury_questions import PERSONAL_INJURY_QUESTIONS
+from models.appointment import Appointment
+from models.caller import Caller
+from models.case_question import CaseQuestion
+from models.intake_call import IntakeCall
+
+ANSWERS = ["yes", "no", "car accident", "January 5 2024", "Austin Texas"]
+
+
+async def seed_calls(count: int, batch_size: int = 2000):
+    # Every call has a caller and answers; every other call has an appointment.
+    first_day = datetime(2030, 1, 7, 9, tzinfo=timezone.utc)
+    for offset in range(0, count, batch_size):
+        numbers = range(offset, min(offset + batch_size, count))
+        callers = await Caller.bulk_create([
+            Caller(full_name=f"Caller {n}", email=f"caller{n}@example.com", phone=f"+1555{n:07d}")
+            for n in numbers
+        ])
+        if callers[0].id is None:
+            callers = await Caller.filter(email__in=[f"caller{n}@example.com" for n in numbers]).order_by("id")
+        calls = await IntakeCall.bulk_create([
+            IntakeCall(caller_id=caller.id, twilio_call_sid=f"CA{n}", practice_area="Personal Injury", call_status="completed", current_state="END_CALL")
+            for n, caller in zip(numbers, callers)
+        ])
+        if calls[0].id is None:
+            calls = await IntakeCall.filter(twilio_call_sid__in=[f"CA{n}" for n in numbers]).order_by("id")
+        await CaseQuestion.bulk_create([
+            CaseQuestion(
+                intake_call_id=call.id, question_key=question["key"], question_text=question["question"],
+                answer=ANSWERS[(call.id + i) % len(ANSWERS)], practice_area="Personal Injury"
+            )
+            for call in calls
+            for i, question in enumerate(PERSONAL_INJURY_QUESTIONS)
+        ])
+        await Appointment.bulk_create([
+            Appointment(
+                intake_call_id=call.id, caller_id=call.caller_id, practice_area="Personal Injury",
+                appointment_date=first_day + timedelta(hours=call.id % 8, days=call.id // 8), appointment_time=time(9 + call.id % 8),
+                booking_status="confirmed"
+            )
+            for call in calls if call.id % 2 == 0
+        ])
@@ -0,0 +1,85 @@
+from datetime import date, datetime, timezone
+import pytest
+from helpers.answer_normalizer import (
+    QUESTIONS_BY_KEY, NormalizedAnswer, SpokenOrdinal, backfill_case_answers, normalize_answer,
+    parse_spoken_date, read_spoken_numbers,
+)
+from models.case_question import CaseQuestion
+from models.intake_call import IntakeCall
+from tests.corpora.answers import ANSWER_CORPUS, REFERENCE, SPOKEN_NUMBER_CORPUS
+
+FIELD_BY_TYPE = {"date": "answer_date", "number": "answer_number", "yes_no": "answer_choice", "yes_no_unsure": "answer_choice", "choice": "answer_choice"}
+
+
+def expected_answer(question_key, value) -> NormalizedAnswer:
+    field = FIELD_BY_TYPE.get(QUESTIONS_BY_KEY[question_key]["type"])
+    return NormalizedAnswer(**{field: value}) if field else NormalizedAnswer()
+
+
+@pytest.mark.parametrize("question_key,answer,expected", ANSWER_CORPUS)
+def test_normalizes_corpus(question_key, answer, expected):
+    assert normalize_answer(QUESTIONS_BY_KEY[question_key], answer, REFERENCE) == expected_answer(question_key, expected)
+
+
+@pytest.mark.parametrize("text,expected", SPOKEN_NUMBER_CORPUS)
+def test_reads_spoken_numbers(text, expected):
+    assert read_spoken_numbers(text) == expected
+
+
+def test_ordinals_are_days_not_years():
+    assert [type(token) for token in read_spoken_numbers("March 3rd twenty twenty")] == [str, SpokenOrdinal, int]
+    assert parse_spoken_date("January twentieth twenty twenty four", REFERENCE) == date(2024, 1, 20)
+
+
+def test_month_without_year_is_never_in_the_future():
+    assert parse_spoken_date("June tenth", REFERENCE) == date(2024, 6, 10)
+    assert parse_spoken_date("June twentieth", REFERENCE) == date(2023, 6, 20)
+
+
+def test_unknown_question_or_empty_answer_normalizes_to_nothing():
+    assert normalize_answer(None, "yes") == NormalizedAnswer()
+    assert normalize_answer(QUESTIONS_BY_KEY["medical_treatment"], "") == NormalizedAnswer()
+
+
+async def seed_answers(rows):
+    for n, (question_key, answer) in enumerate(rows):
+        call = await IntakeCall.create(twilio_call_sid=f"CA{n}", practice_area="Personal Injury")
+        await CaseQuestion.create(
+            intake_call=call, question_key=question_key, question_text=QUESTIONS_BY_KEY[question_key]["question"],
+            answer=answer, practice_area="Personal Injury"
+        )
+    await CaseQuestion.all().update(created_at=datetime.combine(REFERENCE, datetime.min.time(), timezone.utc))
+
+
+async def backfill(**options):
+    return [progress async for progress in backfill_case_answers(**options)]
+
+
+@pytest.mark.anyio
+async def test_backfill_normalizes_every_row_against_its_answer_date(db):
+    await seed_answers([(question_key, answer) for question_key, answer, _ in ANSWER_CORPUS])
+
+    progress = await backfill(batch_size=16)
+
+    assert [step["batch"] for step in progress] == [16, 16, len(ANSWER_CORPUS) - 32]
+    assert progress[-1]["processed"] == len(ANSWER_CORPUS)
+    rows = await CaseQuestion.all().order_by("id")
+    for row, (question_key, _, expected) in zip(rows, ANSWER_CORPUS):
+        stored = NormalizedAnswer(answer_date=row.answer_date, answer_number=row.answer_number, answer_choice=row.answer_choice)
+        assert stored == expected_answer(question_key, expected), row.answer
+        assert row.normalized_at is not None
+
+
+@pytest.mark.anyio
+async def test_backfill_skips_normalized_rows_unless_asked(db):
+    await seed_answers([("medical_treatment", "I do not know"), ("repair_attempts", "twice")])
+    await backfill()
+    await CaseQuestion.filter(question_key="medical_treatment").update(answer_choice="yes")
+
+    assert await backfill() == []
+    assert (await CaseQuestion.get(question_key="medical_treatment")).answer_choice == "yes"
+
+    progress = await backfill(renormalize=True)
+
+    assert progress[-1]["processed"] == 2
+    assert (await CaseQuestion.get(question_key="medical_treatment")).answer_choice == "unsure"
@@ -0,0 +1,63 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+MONDAY = datetime(2030, 1, 7)
+
+
+async def test_free_busy_drives_available_slots(calendar, fake_calendar):
+    fake, _ = fake_calendar
+    fake.busy[calendar.calendar_id] = [
+        {"start": "2030-01-07T09:00:00Z", "end": "2030-01-07T10:00:00Z"},
+    ]
+
+    slots = await calendar.get_available_slots(MONDAY, MONDAY + timedelta(days=1))
+
+    assert slots[0]["datetime"].startswith("2030-01-07T10:00")
+    request = fake.requests[0]
+    assert request.url.path == "/freeBusy"
+    assert request.headers["authorization"] == "Bearer test-token"
+
+
+async def test_insert_event_is_idempotent_on_event_id(calendar, fake_calendar):
+    fake, _ = fake_calendar
+    appointment = {
+        "start_time": MONDAY.replace(hour=11),
+        "end_time": MONDAY.replace(hour=11, minute=30),
+        "event_id": "appt42",
+    }
+
+    assert await calendar.insert_calendar_event(appointment) == "appt42"
+    # A retry gets 409 from Google and is treated as already done.
+    assert await calendar.insert_calendar_event(appointment) == "appt42"
+    assert list(fake.events[calendar.calendar_id]) == ["appt42"]
+
+
+async def test_list_events_follows_pages(calendar, fake_calendar, monkeypatch):
+    fake, _ = fake_calendar
+    monkeypatch.setattr("helpers.calendar_service.EVENTS_PAGE_SIZE", 2)
+    fake.events["primary"] = {f"e{i}": {"id": f"e{i}"} for i in range(5)}
+
+    events, sync_token = await calendar._list_events("primary")
+
+    assert [event["id"] for event in events] == ["e0", "e1", "e2", "e3", "e4"]
+    assert sync_token == "sync-5"
+
+
+async def test_concurrent_lookups_are_not_serialized(calendar, fake_calendar):
+    fake, _ = fake_calendar
+    fake.latency_seconds = 0.2
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        calendar.get_available_slots(MONDAY + timedelta(days=i), MONDAY + timedelta(days=i + 1))
+        for i in range(10)
+    ])
+    elapsed = time.perf_counter() - started
+
+    # Serialized, ten 200ms round trips take two seconds.
+    assert fake.max_in_flight == 10
+    assert elapsed < 1.0
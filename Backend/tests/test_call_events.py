@@ -0,0 +1,105 @@
+import json
+import pytest
+from config.personal_injury_questions import PERSONAL_INJURY_QUESTIONS
+from helpers import voice_agent
+from helpers.call_events import call_events
+from helpers.unit_of_work import UnitOfWork
+from helpers.voice_agent import CallState, VoiceAgent
+from models.caller import Caller
+from models.intake_call import IntakeCall
+from routes.intake_routes import stream_call_events
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def call(db):
+    caller = await Caller.create(full_name="Jane Doe", email="jane@example.com", phone="+15125550100")
+    return await IntakeCall.create(
+        caller=caller, twilio_call_sid="CA1", practice_area="Personal Injury", call_status="in_progress",
+        current_state=CallState.CASE_QUESTIONS.value, consent_to_book=True,
+        question_index=len(PERSONAL_INJURY_QUESTIONS) - 1
+    )
+
+
+@pytest.fixture
+def subscription(call):
+    subscription = call_events.subscribe(call.id)
+    yield subscription
+    call_events.unsubscribe(subscription)
+
+
+def received(subscription):
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+async def test_transition_is_published_after_the_turn_is_written(call, subscription, monkeypatch):
+    order = []
+    flush = UnitOfWork.flush
+
+    async def recording_flush(self):
+        order.append("flush")
+        await flush(self)
+
+    monkeypatch.setattr(UnitOfWork, "flush", recording_flush)
+    monkeypatch.setattr(voice_agent, "transition_hooks", voice_agent.transition_hooks + [lambda *args: order.append("hook")])
+
+    await VoiceAgent(call).process_response("yes")
+
+    assert order == ["flush", "hook"]
+    [event] = received(subscription)
+    assert (event["previous_state"], event["current_state"]) == ("CASE_QUESTIONS", "SHOW_SLOTS")
+    assert (await IntakeCall.get(id=call.id)).current_state == "SHOW_SLOTS"
+
+
+async def test_each_transition_in_a_turn_reports_its_own_state(call, subscription):
+    agent = VoiceAgent(call)
+
+    async with agent._turn():
+        await agent._transition_to(CallState.SHOW_SLOTS)
+        await agent._transition_to(CallState.CONFIRM_BOOKING)
+        assert received(subscription) == []
+
+    events = received(subscription)
+    assert [(event["previous_state"], event["current_state"]) for event in events] == [
+        ("CASE_QUESTIONS", "SHOW_SLOTS"), ("SHOW_SLOTS", "CONFIRM_BOOKING")
+    ]
+
+
+async def test_failed_turn_publishes_nothing(call, subscription):
+    agent = VoiceAgent(call)
+
+    with pytest.raises(RuntimeError):
+        async with agent._turn():
+            await agent._transition_to(CallState.SHOW_SLOTS)
+            raise RuntimeError("handler failed")
+
+    assert received(subscription) == []
+    assert (await IntakeCall.get(id=call.id)).current_state == "CASE_QUESTIONS"
+
+
+async def test_end_call_publishes_after_it_is_saved(call, subscription):
+    await VoiceAgent(call).end_call()
+
+    [event] = received(subscription)
+    assert (event["current_state"], event["call_status"]) == ("END_CALL", "completed")
+
+
+async def test_stream_starts_with_a_snapshot(call):
+    response = await stream_call_events(call_id=call.id)
+    stream = response.body_iterator
+    try:
+        first = await stream.__anext__()
+    finally:
+        await stream.aclose()
+
+    event, data = first.strip().split("\n")
+    assert event == "event: snapshot"
+    assert json.loads(data.removeprefix("data: ")) == {
+        "call_id": call.id, "twilio_call_sid": "CA1", "current_state": "CASE_QUESTIONS",
+        "call_status": "in_progress", "practice_area": "Personal Injury",
+    }
+    assert call_events.subscriber_count() == 0
@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+import pytest
+from helpers.call_export import EXPORT_COLUMNS, export_rows, export_stream
+from tests.intake_data import seed_calls
+
+pytestmark = pytest.mark.anyio
+
+
+async def collect(export_format: str, **filters) -> bytes:
+    chunks = export_rows(batch_size=3, **filters)
+    return b"".join([data async for data in export_stream(export_format, chunks)])
+
+
+async def test_rows_join_caller_answers_and_appointment(db):
+    await seed_calls(4)
+
+    rows = [row async for chunk in export_rows(batch_size=3) for row in chunk]
+
+    assert [row["call_id"] for row in rows] == [1, 2, 3, 4]
+    assert rows[0]["caller_email"] == "caller0@example.com"
+    assert rows[0]["incident_type"] is not None
+    assert rows[0]["vehicle_details"] is None  # a Lemon Law question
+    assert rows[0]["appointment_id"] is None
+    assert rows[1]["appointment_id"] is not None
+
+
+async def test_csv_and_ndjson_stream_every_row(db):
+    await seed_calls(7)
+
+    table = list(csv.reader(io.StringIO((await collect("csv")).decode())))
+    assert table[0] == EXPORT_COLUMNS
+    assert len(table) == 8
+
+    lines = (await collect("ndjson")).decode().splitlines()
+    assert [json.loads(line)["call_id"] for line in lines] == list(range(1, 8))
+
+
+async def test_parquet_has_one_row_group_per_chunk(db):
+    pq = pytest.importorskip("pyarrow.parquet")
+    await seed_calls(7)
+
+    parquet = pq.ParquetFile(io.BytesIO(await collect("parquet")))
+
+    assert parquet.metadata.num_rows == 7
+    assert parquet.num_row_groups == 3
+    assert parquet.schema_arrow.names == EXPORT_COLUMNS
+
+
+async def test_empty_export_is_still_valid(db):
+    assert (await collect("csv")).decode().strip() == ",".join(EXPORT_COLUMNS)
+    assert await collect("ndjson") == b""
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        export_stream("xml", None)
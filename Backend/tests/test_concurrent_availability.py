@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from helpers.calendar_service import HELD_SLOT_ALLOWANCE
+from helpers.slot_holds import slot_holds
+
+pytestmark = pytest.mark.anyio
+
+MONDAY = datetime(2030, 1, 7)
+WINDOW = (MONDAY, MONDAY + timedelta(days=14))
+
+
+async def pick_and_hold(calendar, call_sid: str) -> dict:
+    # What a caller's turn does: read the shared openings minus everyone
+    # else's holds, then hold the first; lose a race and look again. Each
+    # round has a winner, so ten callers need at most ten rounds.
+    for _ in range(10):
+        held = await slot_holds.held_slots(*WINDOW, exclude_call_sid=call_sid)
+        slots = await calendar.get_available_slots(*WINDOW, held=held)
+        assert not any((slot["calendar_id"], datetime.fromisoformat(slot["datetime"])) in held for slot in slots)
+        if slots and await slot_holds.acquire(slots[0]["calendar_id"], datetime.fromisoformat(slots[0]["datetime"]), call_sid):
+            return slots[0]
+    raise AssertionError(f"{call_sid} never got a slot")
+
+
+async def test_concurrent_callers_share_one_lookup_and_hold_distinct_slots(db, calendar, fake_calendar):
+    fake, _ = fake_calendar
+    fake.latency_seconds = 0.05
+
+    # As many callers as the held-slot allowance covers.
+    picked = await asyncio.gather(*[pick_and_hold(calendar, f"CA{n}") for n in range(HELD_SLOT_ALLOWANCE)])
+
+    assert len({slot["datetime"] for slot in picked}) == HELD_SLOT_ALLOWANCE
+    # One freeBusy round trip served every caller and every retry.
+    assert [request.url.path for request in fake.requests] == ["/freeBusy"]
+
+
+async def test_holds_beyond_the_cached_allowance_still_leave_full_lists(db, calendar, fake_calendar):
+    fake, _ = fake_calendar
+    first = await calendar.get_available_slots(*WINDOW)
+    for n, slot in enumerate(first * 3):
+        await slot_holds.acquire(slot["calendar_id"], datetime.fromisoformat(slot["datetime"]) + timedelta(hours=n // len(first) * 24), f"CA{n}")
+
+    held = await slot_holds.held_slots(*WINDOW)
+    slots = await calendar.get_available_slots(*WINDOW, held=held)
+
+    assert len(held) == 30
+    assert len(slots) == len(first)
+    assert not {(slot["calendar_id"], datetime.fromisoformat(slot["datetime"])) for slot in slots} & held
+    # The cached openings ran out, so one wider lookup was made.
+    assert [request.url.path for request in fake.requests] == ["/freeBusy", "/freeBusy"]
+
+
+async def test_calendar_outage_offers_nothing(calendar, fake_calendar):
+    fake, _ = fake_calendar
+    fake.stop()
+
+    assert await calendar.get_available_slots(*WINDOW) == []
+    # The failure is not cached.
+    assert len(calendar.availability_cache) == 0
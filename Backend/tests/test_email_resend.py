@@ -0,0 +1,73 @@
+import pytest
+from helpers.email_service import resend_confirmation_emails
+from helpers.stats import dashboard_stats
+from models.appointment import Appointment
+from tests.intake_data import seed_calls
+
+pytestmark = pytest.mark.anyio
+
+
+async def resend(**filters):
+    return [update async for update in resend_confirmation_emails(**filters)]
+
+
+async def test_resend_sends_and_marks_every_unsent_confirmation(mail):
+    fake, _ = mail
+    await seed_calls(8)
+    await Appointment.filter(id=1).update(booking_status="cancelled")
+    await Appointment.filter(id=2).update(confirmation_email_sent=True)
+    pending = dashboard_stats.get("emails.pending")
+
+    updates = await resend()
+
+    assert updates[-1] == {"done": True, "sent": 2, "failed": 0, "total": 2}
+    assert sorted(update["appointment_id"] for update in updates[:-1]) == [3, 4]
+    assert sorted(envelope.rcpt_tos[0] for envelope in fake.messages) == ["caller5@example.com", "caller7@example.com"]
+    assert await Appointment.filter(confirmation_email_sent=False).values_list("id", flat=True) == [1]
+    assert dashboard_stats.get("emails.pending") == pending - 2
+
+    # Everything that could go out has; a second run sends nothing.
+    assert (await resend())[-1] == {"done": True, "sent": 0, "failed": 0, "total": 0}
+    assert len(fake.messages) == 2
+
+
+async def test_resend_filters_by_id(mail):
+    await seed_calls(8)
+
+    updates = await resend(appointment_ids=[3])
+
+    assert updates[-1]["sent"] == 1
+    assert await Appointment.filter(confirmation_email_sent=True).values_list("id", flat=True) == [3]
+
+
+async def test_row_the_outbox_already_marked_is_not_counted_twice(mail, monkeypatch):
+    _, pool = mail
+    await seed_calls(4)
+    deliver = pool.send_raw
+
+    async def outbox_wins_the_race(sender, recipients, data):
+        await deliver(sender, recipients, data)
+        # The outbox worker delivers and marks the same appointment meanwhile.
+        await Appointment.filter(id=1).update(confirmation_email_sent=True)
+
+    monkeypatch.setattr(pool, "send_raw", outbox_wins_the_race)
+    pending = dashboard_stats.get("emails.pending")
+
+    updates = await resend()
+
+    assert [update["status"] for update in updates[:-1]] == ["sent", "sent"]
+    assert dashboard_stats.get("emails.pending") == pending - 1
+
+
+async def test_failed_send_is_reported_and_left_unsent(mail):
+    await seed_calls(2)
+    caller = (await Appointment.get(id=1).prefetch_related("caller")).caller
+    caller.email = "nobody@refused.example"
+    await caller.save()
+
+    updates = await resend()
+
+    assert updates[0]["status"] == "failed"
+    assert "SMTPRecipientsRefused" in updates[0]["error"]
+    assert updates[-1] == {"done": True, "sent": 0, "failed": 1, "total": 1}
+    assert not (await Appointment.get(id=1)).confirmation_email_sent
@@ -0,0 +1,136 @@
+import os
+import shutil
+import time
+from email import message_from_bytes, policy
+from pathlib import Path
+import pytest
+from helpers.email_templates import EmailTemplateRegistry
+
+SHIPPED = Path(__file__).resolve().parent.parent / "templates" / "email"
+SENDER = ("Legal Intake Team", "intake@example.com")
+FIELDS = {
+    "caller_name": "Jane Doe",
+    "practice_area": "Personal Injury",
+    "date": "January 07, 2030",
+    "time": "10:00 AM",
+    "signature": "Legal Intake Team",
+}
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    shutil.copytree(SHIPPED, tmp_path / "email")
+    return tmp_path / "email"
+
+
+def write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def render(registry: EmailTemplateRegistry, variant=None, **fields):
+    rendered = registry.get("confirmation", variant).render(SENDER, "jane@example.com", dict(FIELDS, **fields))
+    return message_from_bytes(rendered.data, policy=policy.default)
+
+
+def parts(message):
+    return {part.get_content_subtype(): part.get_content() for part in message.iter_parts()}
+
+
+def test_shipped_confirmation_renders_both_parts():
+    message = render(EmailTemplateRegistry(str(SHIPPED)))
+
+    assert message["Subject"] == "Appointment Confirmation - Personal Injury"
+    assert message["From"] == "Legal Intake Team <intake@example.com>"
+    assert message["To"] == "jane@example.com"
+    body = parts(message)
+    assert "Dear Jane Doe," in body["plain"]
+    assert "<li><strong>Date:</strong> January 07, 2030</li>" in body["html"]
+
+
+def test_caller_fields_are_escaped_in_html_only():
+    message = render(EmailTemplateRegistry(str(SHIPPED)), caller_name='<script>alert("x")</script> & Co')
+
+    body = parts(message)
+    assert "Dear &lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; Co," in body["html"]
+    assert "<script>" not in body["html"]
+    assert 'Dear <script>alert("x")</script> & Co,' in body["plain"]
+
+
+def test_non_ascii_headers_are_encoded():
+    registry = EmailTemplateRegistry(str(SHIPPED))
+    rendered = registry.get("confirmation").render(("Bufete Núñez", "intake@example.com"), "jane@example.com", dict(FIELDS, practice_area="Lesión"))
+
+    assert rendered.data.isascii() is False  # 8bit bodies
+    header_block = rendered.data.split(b"\r\n\r\n", 1)[0]
+    assert header_block.isascii()
+    message = message_from_bytes(rendered.data, policy=policy.default)
+    assert message["Subject"] == "Appointment Confirmation - Lesión"
+    assert message["From"].addresses[0].display_name == "Bufete Núñez"
+
+
+def test_tenant_falls_back_to_default_part_by_part(template_dir):
+    write(template_dir / "acme" / "confirmation.subject", "Acme Law: see you ${date}")
+
+    message = render(EmailTemplateRegistry(str(template_dir), tenant="acme"))
+
+    assert message["Subject"] == "Acme Law: see you January 07, 2030"
+    assert "Dear Jane Doe," in parts(message)["plain"]
+
+
+def test_practice_area_variant_and_tenant_precedence(template_dir):
+    write(template_dir / "default" / "confirmation.lemon_law.subject", "Your Lemon Law consultation")
+    write(template_dir / "acme" / "confirmation.subject", "Acme: ${practice_area}")
+    registry = EmailTemplateRegistry(str(template_dir), tenant="acme")
+
+    # A tenant's plain part outranks the default practice-area variant.
+    assert render(registry, "Lemon Law", practice_area="Lemon Law")["Subject"] == "Acme: Lemon Law"
+
+    write(template_dir / "acme" / "confirmation.lemon_law.subject", "Acme lemon law")
+    registry.load()
+    assert render(registry, "Lemon Law")["Subject"] == "Acme lemon law"
+    assert render(registry, "Personal Injury")["Subject"] == "Acme: Personal Injury"
+    assert render(EmailTemplateRegistry(str(template_dir)), "Lemon Law")["Subject"] == "Your Lemon Law consultation"
+
+
+def test_edits_are_picked_up_after_the_reload_interval(template_dir):
+    registry = EmailTemplateRegistry(str(template_dir), reload_seconds=0.05)
+    first = registry.get("confirmation")
+
+    subject = template_dir / "default" / "confirmation.subject"
+    write(subject, "Updated: ${practice_area}")
+    later = time.time() + 5
+    os.utime(subject, (later, later))
+    assert registry.get("confirmation") is first
+
+    time.sleep(0.06)
+    assert render(registry)["Subject"] == "Updated: Personal Injury"
+    # Unchanged files are not recompiled on the next check.
+    current = registry.get("confirmation")
+    time.sleep(0.06)
+    assert registry.get("confirmation") is current
+
+
+def test_new_override_is_picked_up_on_reload(template_dir):
+    registry = EmailTemplateRegistry(str(template_dir), tenant="acme", reload_seconds=0.05)
+    render(registry)
+
+    write(template_dir / "acme" / "confirmation.subject", "Acme")
+    time.sleep(0.06)
+
+    assert render(registry)["Subject"] == "Acme"
+
+
+def test_reload_can_be_disabled(template_dir):
+    registry = EmailTemplateRegistry(str(template_dir), reload_seconds=0)
+    first = registry.get("confirmation")
+    write(template_dir / "default" / "confirmation.subject", "Updated")
+
+    assert registry.get("confirmation") is first
+
+
+def test_missing_part_is_an_error(template_dir):
+    write(template_dir / "default" / "reminder.subject", "Reminder")
+
+    with pytest.raises(FileNotFoundError, match="txt, html"):
+        EmailTemplateRegistry(str(template_dir)).get("reminder")
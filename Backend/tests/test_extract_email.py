@@ -0,0 +1,14 @@
+import pytest
+from helpers.validators import extract_email, validate_email
+from tests.corpora.emails import EMAIL_CORPUS
+
+
+@pytest.mark.parametrize("text,expected", EMAIL_CORPUS)
+def test_extracts_corpus(text, expected):
+    assert extract_email(text) == expected
+
+
+def test_extracted_addresses_validate():
+    for text, expected in EMAIL_CORPUS:
+        if expected:
+            assert validate_email(expected)
@@ -0,0 +1,34 @@
+import pytest
+from helpers.intents import NO, UNSURE, VOCABULARIES, YES, IntentMatcher, classify
+from tests.corpora.intents import INTENT_CORPUS
+
+
+@pytest.mark.parametrize("vocabulary,text,expected", INTENT_CORPUS)
+def test_classifies_corpus(vocabulary, text, expected):
+    assert classify(text, vocabulary).intent == expected
+
+
+def test_scores_cover_the_vocabulary():
+    result = classify("yes", "confirm")
+    assert set(result.scores) == set(VOCABULARIES["confirm"][0])
+    assert result.scores[YES] > result.scores[NO]
+
+
+def test_tie_asks_again():
+    assert classify("yes no", "confirm").intent is None
+
+
+def test_phrase_followed_by_a_negator_yields_to_the_negated_phrase():
+    # "I do" used to score yes before "do not know" was reached.
+    assert classify("I do not know", "answer_yes_no").intent == UNSURE
+    assert classify("it was not", "answer_yes_no").intent == NO
+    assert classify("I do", "answer_yes_no").intent == YES
+
+    matcher = IntentMatcher({"covered": ["it was covered"], "denied": ["not covered"]})
+    assert matcher.classify("it was covered").intent == "covered"
+    assert matcher.classify("it was not covered").intent == "denied"
+
+
+def test_vocabulary_phrases_stay_in_their_prompt():
+    assert classify("it's my car", "practice_area").intent is None
+    assert classify("it's my car", "practice_area_clarify").intent is not None
@@ -0,0 +1,45 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from routes.intake_routes import router
+from tests.intake_data import seed_calls
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def client(db):
+    app = FastAPI()
+    app.include_router(router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def follow_cursor(client: httpx.AsyncClient, path: str, **params):
+    # What the dashboard does: request pages until X-Next-Cursor is absent.
+    items, pages = [], 0
+    while True:
+        response = await client.get(path, params=params)
+        assert response.status_code == 200
+        items += response.json()
+        pages += 1
+        if "x-next-cursor" not in response.headers:
+            return items, pages
+        params["cursor"] = response.headers["x-next-cursor"]
+
+
+@pytest.mark.parametrize("path", ["/api/calls", "/api/appointments"])
+async def test_following_the_cursor_returns_every_row_once(client, path):
+    await seed_calls(14)
+
+    items, pages = await follow_cursor(client, path, limit=3)
+    every, _ = await follow_cursor(client, path, limit=1000)
+
+    ids = [item["id"] for item in items]
+    assert len(ids) == len(set(ids)) == len(every)
+    assert pages == -(-len(every) // 3)
+
+
+async def test_bad_cursor_is_a_400(client):
+    response = await client.get("/api/calls", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,25 @@
+import pytest
+from helpers.validators import extract_phone_number, parse_phone_number, validate_phone
+from tests.corpora.phones import PHONE_CORPUS
+
+
+@pytest.mark.parametrize("text,expected", PHONE_CORPUS)
+def test_extracts_corpus(text, expected):
+    assert extract_phone_number(text) == expected
+
+
+def test_result_carries_region_and_confidence():
+    parsed = parse_phone_number("plus four four seven nine one one one two three four five six")
+    assert parsed.e164 == "+447911123456"
+    assert parsed.region == "GB"
+    assert parsed.confidence == 1.0
+
+
+def test_default_region_is_pluggable():
+    assert extract_phone_number("five five five one two three four five six seven", default_region="US") == "+15551234567"
+
+
+def test_validates_its_own_output():
+    for text, expected in PHONE_CORPUS:
+        if expected:
+            assert validate_phone(expected)
@@ -0,0 +1,78 @@
+import json
+from datetime import datetime
+import pytest
+from helpers.slot_choice import SlotChoices, parse_slot_choice
+from helpers.slot_engine import format_slot
+
+# The eight slots as read to the caller, Monday 7 January 2030 onwards.
+OFFERED = [
+    datetime(2030, 1, 7, 9), datetime(2030, 1, 7, 10), datetime(2030, 1, 7, 14),
+    datetime(2030, 1, 8, 9), datetime(2030, 1, 8, 12), datetime(2030, 1, 8, 14),
+    datetime(2030, 1, 9, 10, 30), datetime(2030, 1, 9, 15),
+]
+
+# (speech, DTMF digits, option number chosen or None)
+CHOICES = [
+    # DTMF
+    ("", "2", 2),
+    ("", "8", 8),
+    ("", "9", None),
+    ("", "0", None),
+    # option numbers, in and out of range
+    ("option two", "", 2),
+    ("number 3", "", 3),
+    ("option ten", "", None),
+    ("option 10", "", None),
+    # ordinals
+    ("the second one", "", 2),
+    ("I'll take the first", "", 1),
+    ("the last one", "", 8),
+    # bare numbers
+    ("three", "", 3),
+    ("8", "", 8),
+    # day and time cues
+    ("Tuesday at 2", "", 6),
+    ("tuesday at two", "", 6),
+    ("Wednesday at 10:30", "", 7),
+    ("ten thirty", "", 7),
+    ("January 8th at 9", "", 4),
+    ("the 9th at three", "", None),
+    ("Tuesday", "", 4),
+    ("Friday", "", None),
+    # meridiems, dotted or not
+    ("10 a.m.", "", 2),
+    ("ten A.M.", "", 2),
+    ("2 p.m.", "", 3),
+    ("2pm on Tuesday", "", 6),
+    ("3 p.m. Wednesday", "", 8),
+    ("ten a.m. on Tuesday", "", None),
+    # twelve is a clock hour when it cannot be an option
+    ("twelve", "", 5),
+    ("12", "", 5),
+    ("noon", "", 5),
+    ("twelve o'clock", "", 5),
+    # nothing usable
+    ("", "", None),
+    ("I'm not sure", "", None),
+]
+
+
+@pytest.fixture
+def choices():
+    return SlotChoices(dict(format_slot(slot), calendar_id="attorney@example.com") for slot in OFFERED)
+
+
+@pytest.mark.parametrize("speech,digits,expected", CHOICES)
+def test_resolves_choice(choices, speech, digits, expected):
+    chosen = choices.choose(speech, digits)
+    assert (chosen and OFFERED.index(datetime.fromisoformat(chosen["datetime"])) + 1) == expected
+
+
+def test_relative_days_use_today():
+    assert parse_slot_choice("tomorrow at 9", 8, today=datetime(2030, 1, 7)) == (None, (None, (1, 8), 9, None))
+
+
+def test_choices_survive_a_round_trip_through_json(choices):
+    # offered_slots is saved on the call and rebuilt in a later turn.
+    rebuilt = SlotChoices(json.loads(json.dumps(choices.slots)))
+    assert [rebuilt.choose(speech, digits) for speech, digits, _ in CHOICES] == [choices.choose(speech, digits) for speech, digits, _ in CHOICES]
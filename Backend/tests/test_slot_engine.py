@@ -0,0 +1,38 @@
+import random
+from datetime import datetime, timedelta
+from itertools import islice
+import pytest
+from helpers.slot_engine import iter_free_slots, parse_busy_intervals
+from tests.busy_calendars import busy_periods, legacy_free_slots
+
+MONDAY = datetime(2030, 1, 7)
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_matches_legacy_loop(seed):
+    rng = random.Random(seed)
+    start = MONDAY.replace(hour=rng.choice([0, 9, 10, 16]), minute=rng.choice([0, 30]))
+    end = start + timedelta(days=rng.randint(1, 20))
+    busy = busy_periods(start, end, rng.randint(0, 200), rng)
+    limit = rng.choice([10, 10000])
+
+    slots = list(islice(iter_free_slots(start, end, parse_busy_intervals(busy)), limit))
+
+    assert slots == legacy_free_slots(start, end, busy, limit=limit)
+
+
+def test_overlapping_busy_periods_are_merged():
+    busy = parse_busy_intervals([
+        {"start": "2030-01-07T10:00:00Z", "end": "2030-01-07T11:00:00Z"},
+        {"start": "2030-01-07T09:30:00Z", "end": "2030-01-07T10:30:00Z"},
+    ])
+    assert busy == [(MONDAY.replace(hour=9, minute=30), MONDAY.replace(hour=11))]
+
+
+def test_business_hours_and_buffer():
+    busy = parse_busy_intervals([{"start": "2030-01-07T12:00:00Z", "end": "2030-01-07T13:00:00Z"}])
+    slots = list(iter_free_slots(
+        MONDAY, MONDAY + timedelta(days=1), busy,
+        business_start=11, business_end=15, buffer_minutes=30
+    ))
+    assert [slot.strftime("%H:%M") for slot in slots] == ["11:00", "13:30", "14:00", "14:30"]
@@ -0,0 +1,63 @@
+from datetime import datetime
+import pytest
+from tortoise.transactions import in_transaction
+from helpers import slot_holds as slot_holds_module
+from helpers.outbox import enqueue_booking_side_effects
+from helpers.slot_holds import slot_holds
+from models.appointment import Appointment
+from models.caller import Caller
+from models.intake_call import IntakeCall
+from models.outbox_message import OutboxMessage
+from models.slot_hold import SlotHold
+
+pytestmark = pytest.mark.anyio
+
+SLOT = datetime(2030, 1, 7, 10)
+CALENDAR_ID = "attorney@example.com"
+
+
+@pytest.fixture
+async def call(db):
+    caller = await Caller.create(full_name="Jane Doe", email="jane@example.com", phone="+15125550100")
+    return await IntakeCall.create(caller=caller, twilio_call_sid="CA1", practice_area="Personal Injury")
+
+
+def appointment_fields(call: IntakeCall):
+    return dict(intake_call=call, caller_id=call.caller_id, practice_area=call.practice_area, booking_status="confirmed")
+
+
+async def test_book_turns_the_hold_into_an_appointment(call):
+    assert await slot_holds.acquire(CALENDAR_ID, SLOT, "CA1")
+
+    appointment = await slot_holds.book("CA1", CALENDAR_ID, SLOT, **appointment_fields(call))
+
+    assert appointment.attorney_calendar_id == CALENDAR_ID
+    assert not await SlotHold.exists()
+    # Booked slots cannot be held again.
+    assert not await slot_holds.acquire(CALENDAR_ID, SLOT, "CA2")
+
+
+async def test_book_without_our_hold_books_nothing(call):
+    assert await slot_holds.acquire(CALENDAR_ID, SLOT, "CA2")
+
+    assert await slot_holds.book("CA1", CALENDAR_ID, SLOT, **appointment_fields(call)) is None
+    assert not await Appointment.exists()
+
+
+async def test_book_joins_the_callers_transaction(call, monkeypatch):
+    assert await slot_holds.acquire(CALENDAR_ID, SLOT, "CA1")
+
+    def no_transaction_of_its_own(*args, **kwargs):
+        raise AssertionError("book opened its own transaction")
+
+    with pytest.raises(RuntimeError):
+        async with in_transaction() as connection:
+            monkeypatch.setattr(slot_holds_module, "in_transaction", no_transaction_of_its_own)
+            appointment = await slot_holds.book("CA1", CALENDAR_ID, SLOT, using_db=connection, **appointment_fields(call))
+            await enqueue_booking_side_effects(appointment, using_db=connection)
+            raise RuntimeError("rolled back after the side effects were queued")
+
+    # The hold delete, the appointment and the outbox rows went together.
+    assert await SlotHold.filter(call_sid="CA1").exists()
+    assert not await Appointment.exists()
+    assert not await OutboxMessage.exists()
@@ -0,0 +1,101 @@
+import asyncio
+import smtplib
+import time
+import pytest
+from helpers.smtp_pool import SMTPPool
+
+pytestmark = pytest.mark.anyio
+
+MESSAGE = b"Subject: Appointment confirmed\r\n\r\nSee you then.\r\n"
+
+
+@pytest.fixture
+async def pool(smtp_server):
+    _, port = smtp_server
+    pool = SMTPPool("127.0.0.1", port, use_tls=False, size=2, timeout=5)
+    yield pool
+    await pool.close()
+
+
+async def send(pool: SMTPPool, recipient: str = "caller@example.com"):
+    await pool.send_raw("intake@example.com", [recipient], MESSAGE)
+
+
+async def test_sends_reuse_one_connection(pool, smtp_server):
+    fake, _ = smtp_server
+
+    for _ in range(5):
+        await send(pool)
+
+    assert len(fake.messages) == 5
+    assert fake.connections == 1
+    assert fake.noops == 0
+
+
+async def test_idle_connection_is_checked_with_noop(pool, smtp_server):
+    fake, _ = smtp_server
+    pool.keepalive_seconds = 0
+
+    await send(pool)
+    await send(pool)
+
+    assert fake.noops == 1
+    assert fake.connections == 1
+
+
+async def test_stale_connection_fails_health_check_and_is_replaced(pool, smtp_server):
+    fake, _ = smtp_server
+    pool.keepalive_seconds = 0
+    await send(pool)
+
+    fake.drop_connections()
+    time.sleep(0.1)
+    await send(pool)
+
+    assert len(fake.messages) == 2
+    assert fake.connections == 2
+
+
+async def test_send_on_dropped_connection_retries_once_on_a_new_one(pool, smtp_server):
+    fake, _ = smtp_server
+    await send(pool)
+
+    # Dropped after the health check window, so the send itself finds out.
+    fake.drop_connections()
+    time.sleep(0.1)
+    await send(pool)
+
+    assert len(fake.messages) == 2
+    assert fake.connections == 2
+    assert fake.noops == 0
+
+
+async def test_idle_timeout_discards_without_noop(pool, smtp_server):
+    fake, _ = smtp_server
+    pool.idle_timeout_seconds = 0
+    await send(pool)
+    await send(pool)
+
+    assert fake.connections == 2
+    assert fake.noops == 0
+
+
+async def test_refused_recipient_is_not_retried_and_keeps_the_connection(pool, smtp_server):
+    fake, _ = smtp_server
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        await send(pool, "nobody@refused.example")
+    await send(pool)
+
+    assert len(fake.messages) == 1
+    assert fake.connections == 1
+
+
+async def test_concurrency_is_bounded_by_pool_size(pool, smtp_server):
+    fake, _ = smtp_server
+    fake.latency_seconds = 0.01
+
+    await asyncio.gather(*[send(pool) for _ in range(8)])
+
+    assert len(fake.messages) == 8
+    assert fake.connections == 2
@@ -0,0 +1,66 @@
+from datetime import datetime, time
+import pytest
+from helpers.email_service import resend_confirmation_emails, send_confirmation_email
+from helpers.stats import dashboard_stats
+from helpers.voice_agent import CallState, VoiceAgent
+from models.appointment import Appointment
+from models.caller import Caller
+from models.intake_call import IntakeCall
+
+pytestmark = pytest.mark.anyio
+
+
+async def new_call(n: int, practice_area: str) -> IntakeCall:
+    caller = await Caller.create(full_name=f"Caller {n}", email=f"caller{n}@example.com", phone=f"+1512555{n:04d}")
+    return await IntakeCall.create(
+        caller=caller, twilio_call_sid=f"CA{n}", practice_area=practice_area,
+        call_status="in_progress", current_state=CallState.CASE_QUESTIONS.value
+    )
+
+
+async def book(call: IntakeCall, hour: int, booking_status: str = "confirmed") -> Appointment:
+    return await Appointment.create(
+        intake_call=call, caller_id=call.caller_id, practice_area=call.practice_area,
+        appointment_date=datetime(2030, 1, 7, hour), appointment_time=time(hour), booking_status=booking_status
+    )
+
+
+async def test_live_counters_match_a_rebuild(mail):
+    await dashboard_stats.rebuild()
+    calls = [await new_call(n, "Lemon Law" if n % 3 == 0 else "Personal Injury") for n in range(6)]
+
+    # Calls move through their states and some finish.
+    for call in calls[:4]:
+        agent = VoiceAgent(call)
+        await agent._transition_to(CallState.SHOW_SLOTS)
+        if call.id % 2:
+            await agent.end_call()
+
+    appointments = [await book(call, 9 + n) for n, call in enumerate(calls[:5])]
+    await book(calls[5], 15, booking_status="pending")
+
+    # Updates through save(): a cancellation, a moved practice area, a
+    # confirmation marked sent by hand.
+    appointments[0].booking_status = "cancelled"
+    await appointments[0].save()
+    appointments[1].practice_area = "Lemon Law"
+    await appointments[1].save(update_fields=["practice_area", "updated_at"])
+    appointments[2].confirmation_email_sent = True
+    await appointments[2].save()
+    # A save that touches none of the counted fields changes nothing.
+    appointments[3].calendar_event_id = "evt1"
+    await appointments[3].save(update_fields=["calendar_event_id", "updated_at"])
+
+    # Confirmations sent through QuerySet.update(), one of them twice.
+    assert await send_confirmation_email(await Appointment.get(id=appointments[3].id))
+    assert await send_confirmation_email(await Appointment.get(id=appointments[3].id))
+    [update async for update in resend_confirmation_emails(appointment_ids=[appointments[4].id])]
+
+    live = dashboard_stats.snapshot()
+    await dashboard_stats.flush()
+    assert dashboard_stats.snapshot() == live
+
+    await dashboard_stats.rebuild()
+    assert dashboard_stats.snapshot() == live
+    assert live["emails"]["pending"] == 2
+    assert live["appointments"]["by_status"] == {"cancelled": 1, "confirmed": 4, "pending": 1}
@@ -0,0 +1,71 @@
+from datetime import datetime
+import httpx
+import pytest
+from fastapi import FastAPI
+from helpers.call_session import call_sessions
+from helpers.slot_holds import slot_holds
+from helpers.voice_agent import CallState
+from models.appointment import Appointment
+from models.caller import Caller
+from models.intake_call import IntakeCall
+from routes.intake_routes import router
+
+pytestmark = pytest.mark.anyio
+
+SLOT = datetime(2030, 1, 7, 10)
+CALENDAR_ID = "attorney@example.com"
+
+
+@pytest.fixture
+async def client(db):
+    app = FastAPI()
+    app.include_router(router)
+    call_sessions.clear()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    call_sessions.clear()
+
+
+@pytest.fixture
+async def call_holding_a_slot(db):
+    caller = await Caller.create(full_name="Jane Doe", email="jane@example.com", phone="+15125550100")
+    call = await IntakeCall.create(
+        caller=caller, twilio_call_sid="CA1", practice_area="Personal Injury",
+        call_status="in_progress", current_state=CallState.CONFIRM_BOOKING.value
+    )
+    assert await slot_holds.acquire(CALENDAR_ID, SLOT, "CA1")
+    return call
+
+
+async def confirm(client: httpx.AsyncClient, **form) -> str:
+    response = await client.post(
+        "/api/twilio/handle-slot-selection",
+        params={"call_sid": "CA1", "slot_datetime": SLOT.isoformat()},
+        data=form
+    )
+    assert response.status_code == 200
+    return response.text
+
+
+async def test_duplicate_confirmation_after_the_call_ended_says_goodbye(client, call_holding_a_slot):
+    first = await confirm(client, SpeechResult="yes")
+    assert "I have you scheduled" in first
+
+    # Twilio retries the same webhook; the session is gone and the call is over.
+    duplicate = await confirm(client, SpeechResult="yes")
+
+    assert "Goodbye" in duplicate
+    assert "<Hangup" in duplicate
+    assert "error" not in duplicate
+    assert await Appointment.filter(intake_call_id=call_holding_a_slot.id).count() == 1
+    await call_holding_a_slot.refresh_from_db()
+    assert call_holding_a_slot.current_state == CallState.END_CALL.value
+
+
+async def test_late_slot_choice_after_the_call_ended_says_goodbye(client, call_holding_a_slot):
+    await confirm(client, SpeechResult="yes")
+
+    response = await client.post("/api/twilio/handle-slot-selection", params={"call_sid": "CA1"}, data={"Digits": "1"})
+
+    assert "Goodbye" in response.text
+    assert "error" not in response.text
@@ -0,0 +1,105 @@
+import logging
+import pytest
+from config.personal_injury_questions import PERSONAL_INJURY_QUESTIONS
+from helpers import voice_agent
+from helpers.call_session import call_sessions
+from helpers.voice_agent import CallState, VoiceAgent
+from models.caller import Caller
+from models.case_question import CaseQuestion
+from models.intake_call import IntakeCall
+
+pytestmark = pytest.mark.anyio
+
+
+class _StatementLog(logging.Handler):
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.statements = []
+
+    def emit(self, record):
+        self.statements.append(record.getMessage())
+
+    def writes(self, table: str):
+        return [sql for sql in self.statements if sql.startswith(("INSERT", "UPDATE")) and f'"{table}"' in sql]
+
+
+@pytest.fixture
+def sql():
+    # Every statement the ORM sends, as logged by its database client.
+    log = _StatementLog()
+    logger = logging.getLogger("tortoise.db_client")
+    level = logger.level
+    logger.addHandler(log)
+    logger.setLevel(logging.DEBUG)
+    yield log
+    logger.removeHandler(log)
+    logger.setLevel(level)
+
+
+async def agent_in(state: CallState, **fields) -> VoiceAgent:
+    caller = await Caller.create(full_name="Jane Doe", email="jane@example.com", phone="+15125550100")
+    await IntakeCall.create(
+        caller=caller, twilio_call_sid="CA1", call_status="in_progress",
+        current_state=state.value, **fields
+    )
+    agent = VoiceAgent(await IntakeCall.get(twilio_call_sid="CA1"))
+    call_sessions.put("CA1", agent)
+    return agent
+
+
+async def turn(agent: VoiceAgent, sql: _StatementLog, speech: str):
+    sql.statements.clear()
+    await agent.process_response(speech)
+    # The counter agrees with what actually went to the database.
+    assert agent.last_turn_statements == len(sql.statements)
+
+
+async def test_practice_area_turn_is_one_update(db, sql):
+    agent = await agent_in(CallState.PRACTICE_AREA, practice_area="")
+
+    await turn(agent, sql, "it was a car accident")
+
+    # practice_area, current_state and current_field used to be three saves.
+    assert len(sql.writes("intake_calls")) == 1
+    assert agent.current_state == CallState.PERSONAL_INFO
+    stored = await IntakeCall.get(twilio_call_sid="CA1")
+    assert (stored.practice_area, stored.current_state, stored.current_field) == ("Personal Injury", "PERSONAL_INFO", "name")
+
+
+async def test_case_question_turns_are_one_update_and_one_upsert(db, sql):
+    agent = await agent_in(CallState.CASE_QUESTIONS, practice_area="Personal Injury", consent_to_book=True)
+
+    for index, question in enumerate(PERSONAL_INJURY_QUESTIONS):
+        await turn(agent, sql, "yes")
+        assert len(sql.writes("intake_calls")) == 1
+        assert len(sql.writes("case_questions")) == 1
+        # Only the first turn loads the caller; no turn scans the answers.
+        assert len(sql.statements) == (3 if index == 0 else 2)
+
+    assert agent.current_state == CallState.SHOW_SLOTS
+    assert await CaseQuestion.filter(intake_call_id=agent.intake_call.id).count() == len(PERSONAL_INJURY_QUESTIONS)
+
+
+async def test_failed_turn_writes_nothing(db, sql, monkeypatch):
+    agent = await agent_in(CallState.CASE_QUESTIONS, practice_area="Personal Injury", consent_to_book=True)
+
+    async def fails_halfway(agent: VoiceAgent, response: str):
+        agent.unit_of_work.upsert(
+            CaseQuestion(intake_call=agent.intake_call, question_key="incident_type", question_text="?", answer=response, practice_area="Personal Injury"),
+            on_conflict=["intake_call_id", "question_key"], update_fields=["answer"]
+        )
+        agent.intake_call.question_index = 3
+        agent.intake_call.practice_area = "Lemon Law"
+        raise RuntimeError("handler failed")
+
+    monkeypatch.setitem(voice_agent.STATE_HANDLERS, CallState.CASE_QUESTIONS, fails_halfway)
+    sql.statements.clear()
+    with pytest.raises(RuntimeError):
+        await agent.process_response("yes")
+
+    assert sql.writes("intake_calls") == sql.writes("case_questions") == []
+    assert (agent.intake_call.question_index, agent.intake_call.practice_area) == (0, "Personal Injury")
+    assert call_sessions.get("CA1") is None
+    stored = await IntakeCall.get(twilio_call_sid="CA1")
+    assert (stored.question_index, stored.practice_area) == (0, "Personal Injury")
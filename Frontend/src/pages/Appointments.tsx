@@ -4,12 +4,15 @@ import { apiService, Appointment } from '../services/api';
 export default function Appointments() {
   const [appointments, setAppointments] = useState<Appointment[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchAppointments = async () => {
       try {
-        const data = await apiService.getAppointments();
-        setAppointments(data);
+        const page = await apiService.getAppointments();
+        setAppointments(page.items);
+        setNextCursor(page.nextCursor);
       } catch (error) {
         console.error('Failed to load appointments', error);
       } finally {
@@ -20,6 +23,20 @@ export default function Appointments() {
     fetchAppointments();
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await apiService.getAppointments(nextCursor);
+      setAppointments((current) => [...current, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to load more appointments', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const getStatusColor = (status: string) => {
     switch (status) {
       case 'confirmed':
@@ -91,6 +108,17 @@ export default function Appointments() {
               </li>
             ))}
           </ul>
+          {nextCursor && (
+            <div className="px-4 py-4 text-center border-t border-gray-200">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="text-sm text-blue-600 hover:text-blue-800 disabled:text-gray-400"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
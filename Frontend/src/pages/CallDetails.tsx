@@ -1,10 +1,10 @@
 import { useState, useEffect } from 'react';
 import { useParams } from 'react-router-dom';
-import { apiService, Call } from '../services/api';
+import { apiService, CallDetail } from '../services/api';
 
 export default function CallDetails() {
   const { callId } = useParams<{ callId: string }>();
-  const [call, setCall] = useState<Call | null>(null);
+  const [call, setCall] = useState<CallDetail | null>(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
@@ -17,6 +17,23 @@ export default function CallDetails() {
     }
   }, [callId]);
 
+  useEffect(() => {
+    if (!callId) return;
+    // Pushes state changes while the page is open; closes on unmount.
+    return apiService.subscribeToCallEvents((event) => {
+      setCall((current) =>
+        current
+          ? {
+              ...current,
+              current_state: event.current_state,
+              call_status: event.call_status,
+              practice_area: event.practice_area,
+            }
+          : current
+      );
+    }, parseInt(callId));
+  }, [callId]);
+
   if (loading) {
     return (
       <div className="text-center py-12">
@@ -72,6 +89,64 @@ export default function CallDetails() {
           </div>
         </dl>
       </div>
+
+      {call.caller && (
+        <div className="bg-white shadow rounded-lg p-6 mt-6">
+          <h3 className="text-lg font-medium text-gray-900 mb-4">Caller</h3>
+          <dl className="grid grid-cols-1 gap-x-4 gap-y-6 sm:grid-cols-3">
+            <div>
+              <dt className="text-sm font-medium text-gray-500">Name</dt>
+              <dd className="mt-1 text-sm text-gray-900">{call.caller.name}</dd>
+            </div>
+            <div>
+              <dt className="text-sm font-medium text-gray-500">Email</dt>
+              <dd className="mt-1 text-sm text-gray-900">{call.caller.email}</dd>
+            </div>
+            <div>
+              <dt className="text-sm font-medium text-gray-500">Phone</dt>
+              <dd className="mt-1 text-sm text-gray-900">{call.caller.phone}</dd>
+            </div>
+          </dl>
+        </div>
+      )}
+
+      {call.case_answers.length > 0 && (
+        <div className="bg-white shadow rounded-lg p-6 mt-6">
+          <h3 className="text-lg font-medium text-gray-900 mb-4">Case Answers</h3>
+          <dl className="space-y-4">
+            {call.case_answers.map((answer) => (
+              <div key={answer.question_key}>
+                <dt className="text-sm font-medium text-gray-500">{answer.question_text}</dt>
+                <dd className="mt-1 text-sm text-gray-900">{answer.answer}</dd>
+              </div>
+            ))}
+          </dl>
+        </div>
+      )}
+
+      {call.appointment && (
+        <div className="bg-white shadow rounded-lg p-6 mt-6">
+          <h3 className="text-lg font-medium text-gray-900 mb-4">Appointment</h3>
+          <dl className="grid grid-cols-1 gap-x-4 gap-y-6 sm:grid-cols-3">
+            <div>
+              <dt className="text-sm font-medium text-gray-500">Date</dt>
+              <dd className="mt-1 text-sm text-gray-900">
+                {new Date(call.appointment.appointment_date).toLocaleString()}
+              </dd>
+            </div>
+            <div>
+              <dt className="text-sm font-medium text-gray-500">Status</dt>
+              <dd className="mt-1 text-sm text-gray-900">{call.appointment.booking_status}</dd>
+            </div>
+            <div>
+              <dt className="text-sm font-medium text-gray-500">Confirmation Email</dt>
+              <dd className="mt-1 text-sm text-gray-900">
+                {call.appointment.confirmation_email_sent ? 'Sent' : 'Pending'}
+              </dd>
+            </div>
+          </dl>
+        </div>
+      )}
     </div>
   );
 }
@@ -5,12 +5,15 @@ import { apiService, Call } from '../services/api';
 export default function Dashboard() {
   const [calls, setCalls] = useState<Call[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchCalls = async () => {
       try {
-        const data = await apiService.getCalls();
-        setCalls(data);
+        const page = await apiService.getCalls();
+        setCalls(page.items);
+        setNextCursor(page.nextCursor);
       } catch (error) {
         console.error('Failed to load calls', error);
       } finally {
@@ -21,6 +24,38 @@ export default function Dashboard() {
     fetchCalls();
   }, []);
 
+  useEffect(() => {
+    // Keeps the loaded rows current as calls move through their states.
+    return apiService.subscribeToCallEvents((event) => {
+      setCalls((current) =>
+        current.map((call) =>
+          call.id === event.call_id
+            ? {
+                ...call,
+                current_state: event.current_state,
+                call_status: event.call_status,
+                practice_area: event.practice_area,
+              }
+            : call
+        )
+      );
+    });
+  }, []);
+
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await apiService.getCalls(nextCursor);
+      setCalls((current) => [...current, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to load more calls', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const getStatusColor = (status: string) => {
     switch (status) {
       case 'completed':
@@ -87,6 +122,17 @@ export default function Dashboard() {
               </li>
             ))}
           </ul>
+          {nextCursor && (
+            <div className="px-4 py-4 text-center border-t border-gray-200">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="text-sm text-blue-600 hover:text-blue-800 disabled:text-gray-400"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
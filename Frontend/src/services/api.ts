@@ -19,6 +19,17 @@ export interface Call {
   created_at: string;
 }
 
+export interface CallStateEvent {
+  call_id: number;
+  twilio_call_sid: string;
+  previous_state?: string | null;
+  current_state: string;
+  call_status: string;
+  practice_area: string;
+  at?: string;
+  seq?: number;
+}
+
 export interface Appointment {
   id: number;
   caller: {
@@ -33,6 +44,40 @@ export interface Appointment {
   confirmation_email_sent: boolean;
 }
 
+export interface CaseAnswer {
+  question_key: string;
+  question_text: string;
+  answer: string;
+  answer_date: string | null;
+  answer_number: number | null;
+  answer_choice: string | null;
+}
+
+export interface CallDetail extends Call {
+  updated_at: string;
+  caller: {
+    id: number;
+    name: string;
+    email: string;
+    phone: string;
+  } | null;
+  case_answers: CaseAnswer[];
+  appointment: (Appointment & {
+    calendar_event: {
+      google_event_id: string;
+      title: string;
+      start_time: string;
+      end_time: string;
+    } | null;
+  }) | null;
+}
+
+// List endpoints return one page at a time; nextCursor is null on the last page.
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
 export interface CalendarSlot {
   date: string;
   time: string;
@@ -41,12 +86,12 @@ export interface CalendarSlot {
 }
 
 export const apiService = {
-  getCalls: async (): Promise<Call[]> => {
-    const response = await api.get('/api/calls');
-    return response.data;
+  getCalls: async (cursor?: string): Promise<Page<Call>> => {
+    const response = await api.get('/api/calls', { params: { cursor } });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
   },
 
-  getCall: async (callId: number): Promise<Call> => {
+  getCall: async (callId: number): Promise<CallDetail> => {
     const response = await api.get(`/api/calls/${callId}`);
     return response.data;
   },
@@ -56,14 +101,30 @@ export const apiService = {
     return response.data;
   },
 
+  // Pushes call state changes as they happen; returns a function that closes the stream.
+  subscribeToCallEvents: (
+    onEvent: (event: CallStateEvent) => void,
+    callId?: number
+  ): (() => void) => {
+    const url = new URL('/api/calls/events', API_BASE_URL);
+    if (callId !== undefined) {
+      url.searchParams.set('call_id', String(callId));
+    }
+    const source = new EventSource(url.toString());
+    const handler = (message: MessageEvent) => onEvent(JSON.parse(message.data));
+    source.addEventListener('snapshot', handler);
+    source.addEventListener('state', handler);
+    return () => source.close();
+  },
+
   getAvailability: async (daysAhead: number = 14): Promise<{ available_slots: CalendarSlot[] }> => {
     const response = await api.get(`/api/calendar/availability?days_ahead=${daysAhead}`);
     return response.data;
   },
 
-  getAppointments: async (): Promise<Appointment[]> => {
-    const response = await api.get('/api/appointments');
-    return response.data;
+  getAppointments: async (cursor?: string): Promise<Page<Appointment>> => {
+    const response = await api.get('/api/appointments', { params: { cursor } });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
   },
 
   getAppointment: async (appointmentId: number): Promise<Appointment> => {